@@ -37,6 +37,7 @@ setup(
             "pytest>=7.0",
             "pytest-cov>=4.0",
             "pytest-asyncio>=0.21",
+            "pytest-xdist>=3.0",
             "pytest-benchmark>=4.0",
             "black>=22.0",
             "flake8>=5.0",
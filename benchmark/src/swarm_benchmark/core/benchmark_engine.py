@@ -1,8 +1,18 @@
 """Unified benchmark engine with pluggable architecture."""
 
 import asyncio
+import copy
+import dataclasses
+import hashlib
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Type, Union
+from enum import Enum
+from typing import Awaitable, Callable, Dict, List, Any, Optional, Set, Tuple, Type, Union
 from pathlib import Path
 import uuid
 
@@ -10,7 +20,7 @@ from .models import (
     Benchmark, Task, Result, BenchmarkConfig, TaskStatus, 
     StrategyType, CoordinationMode, ResultStatus
 )
-from ..strategies import create_strategy
+from ..strategies import BaseStrategy, create_strategy
 from ..output.output_manager import OutputManager
 
 
@@ -34,14 +44,39 @@ class EnginePlugin:
         return result
 
 
+# A plugin hook prepared for dispatch: ("PluginClass.hook_name", bound method)
+PluginHook = Tuple[str, Callable[..., Awaitable[Any]]]
+
+
+def _run_strategy_in_process(strategy: BaseStrategy, task: Task) -> Result:
+    """Execute a strategy to completion inside a worker process."""
+    return asyncio.run(strategy.execute(task))
+
+
+def _overrides_hook(plugin: EnginePlugin, hook_name: str) -> bool:
+    """Check whether a plugin provides its own implementation of a hook."""
+    return getattr(type(plugin), hook_name, None) is not getattr(EnginePlugin, hook_name)
+
+
 class OptimizationPlugin(EnginePlugin):
-    """Plugin for optimized execution."""
+    """Plugin for optimized execution.
+    
+    With ``memoize_results`` enabled in the config, results are kept in an
+    LRU cache (bounded by ``max_cache_size``) keyed by strategy and objective,
+    and repeated tasks reuse them instead of executing the strategy again.
+    """
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize the optimization plugin."""
         self.config = config or {}
         self.cache = {}
+        self.result_cache: "OrderedDict[Tuple[str, str], Result]" = OrderedDict()
+        self.memoize_results = self.config.get("memoize_results", False)
+        self.max_cache_size = self.config.get("max_cache_size", 1024)
         self.execution_history = []
+        self._interned: Dict[str, str] = {}
+        # Ids of tasks handed a cached result, until their post_task
+        self._served_from_cache: Set[str] = set()
         
     async def pre_benchmark(self, benchmark: Benchmark) -> None:
         """Initialize optimization for benchmark."""
@@ -56,24 +91,65 @@ class OptimizationPlugin(EnginePlugin):
             "execution_history": len(self.execution_history)
         }
     
+    def _intern(self, value: str) -> str:
+        """Return the canonical instance of a repeated cache key part.
+        
+        The table holds at most the two parts of each key the result
+        cache can hold, and starts over once it outgrows that.
+        """
+        interned = self._interned.get(value)
+        if interned is None:
+            if len(self._interned) >= 2 * self.max_cache_size:
+                self._interned.clear()
+            interned = self._interned[value] = value
+        return interned
+    
+    def _cache_key(self, task: Task) -> Tuple[str, str]:
+        """Build the cache key identifying equivalent tasks."""
+        return (self._intern(str(task.strategy)), self._intern(task.objective))
+    
     async def pre_task(self, task: Task) -> None:
         """Apply task-level optimizations."""
         task.parameters["optimized"] = True
+        
+        if self.memoize_results:
+            cache_key = self._cache_key(task)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                self.result_cache.move_to_end(cache_key)
+                # Hand the engine a private copy bound to this task
+                result = copy.deepcopy(cached)
+                result.id = str(uuid.uuid4())
+                result.task_id = task.id
+                task.parameters["_cache_hit"] = result
+                self._served_from_cache.add(task.id)
     
     async def post_task(self, task: Task, result: Result) -> Result:
         """Process task result with optimizations."""
         # Cache result for reuse
-        cache_key = f"{task.strategy}-{task.objective}"
+        cache_key = self._cache_key(task)
+        if task.id in self._served_from_cache:
+            # The result is a copy of the cached entry, so only refresh its recency
+            self._served_from_cache.discard(task.id)
+            if cache_key in self.result_cache:
+                self.result_cache.move_to_end(cache_key)
+        elif self.memoize_results and result.status == ResultStatus.SUCCESS:
+            self.result_cache[cache_key] = copy.deepcopy(result)
+            self.result_cache.move_to_end(cache_key)
+            if len(self.result_cache) > self.max_cache_size:
+                self.result_cache.popitem(last=False)
+        
+        timestamp = datetime.now().isoformat()
         self.cache[cache_key] = {
             "result": result.id,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
         
         # Record execution for metrics
         self.execution_history.append({
             "task_id": task.id,
             "execution_time": result.performance_metrics.execution_time,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         })
         
         return result
@@ -86,7 +162,8 @@ class MetricsCollectionPlugin(EnginePlugin):
         """Initialize the metrics collection plugin."""
         self.sampling_interval = sampling_interval
         self.metrics_buffer = []
-        self.active_collectors = {}
+        # Task id -> perf_counter() reading taken when the task started
+        self.active_collectors: Dict[str, float] = {}
         
     async def pre_benchmark(self, benchmark: Benchmark) -> None:
         """Initialize metrics collection for benchmark."""
@@ -103,8 +180,15 @@ class MetricsCollectionPlugin(EnginePlugin):
         
         # Aggregate metrics across all tasks
         if benchmark.results:
-            peak_memory = max(r.resource_usage.peak_memory_mb for r in benchmark.results) if benchmark.results else 0
-            avg_cpu = sum(r.resource_usage.average_cpu_percent for r in benchmark.results) / len(benchmark.results) if benchmark.results else 0
+            # Single pass over the results for both aggregates
+            peak_memory = 0
+            cpu_total = 0
+            for r in benchmark.results:
+                usage = r.resource_usage
+                if usage.peak_memory_mb > peak_memory:
+                    peak_memory = usage.peak_memory_mb
+                cpu_total += usage.average_cpu_percent
+            avg_cpu = cpu_total / len(benchmark.results)
             
             benchmark.metadata["metrics_collection"]["peak_memory_mb"] = peak_memory
             benchmark.metadata["metrics_collection"]["avg_cpu_percent"] = avg_cpu
@@ -112,31 +196,87 @@ class MetricsCollectionPlugin(EnginePlugin):
     async def pre_task(self, task: Task) -> None:
         """Initialize metrics collection for task."""
         # Start performance collector for this task
-        collector_id = f"task_{task.id}"
-        self.active_collectors[collector_id] = {
-            "start_time": datetime.now(),
-            "metrics": []
-        }
+        self.active_collectors[task.id] = time.perf_counter()
     
     async def post_task(self, task: Task, result: Result) -> Result:
         """Process task metrics and enhance result."""
-        # Get collector for this task
-        collector_id = f"task_{task.id}"
-        if collector_id in self.active_collectors:
-            collector = self.active_collectors[collector_id]
-            collector["end_time"] = datetime.now()
-            
-            # Calculate execution time
-            execution_time = (collector["end_time"] - collector["start_time"]).total_seconds()
-            result.performance_metrics.execution_time = execution_time
-            
-            # Clean up
-            self.metrics_buffer.extend(collector["metrics"])
-            del self.active_collectors[collector_id]
+        # Stop the collector for this task
+        start_time = self.active_collectors.pop(task.id, None)
+        if start_time is not None:
+            # Calculate execution time from the monotonic clock
+            result.performance_metrics.execution_time = time.perf_counter() - start_time
             
         return result
 
 
+class BenchmarkResponse(MutableMapping):
+    """Benchmark response mapping with lazily converted results.
+    
+    The per-result dictionaries under ``"results"`` are only built when that
+    key is looked up, so callers that only read the summary never pay for
+    them. Every read goes through ``__getitem__``, so the inherited mapping
+    methods (``pop``, ``setdefault``, ``==`` and so on) see the converted
+    results. Use ``to_dict`` to get a plain dictionary, e.g. for
+    ``json.dumps``.
+    """
+    
+    def __init__(
+        self, fields: Dict[str, Any], results: Optional[List[Result]] = None,
+        convert: Optional[Callable[[Result], Dict[str, Any]]] = None
+    ):
+        """Initialize the response with eager fields and pending results.
+        
+        Without results the response holds the fields alone.
+        """
+        self._data: Dict[str, Any] = dict(fields)
+        self._pending: Optional[Tuple[List[Result], Callable]] = None
+        if results is not None:
+            self._data.pop("results", None)
+            self._pending = (results, convert)
+    
+    def _materialize(self) -> None:
+        """Convert the pending results into dictionaries."""
+        if self._pending is not None:
+            results, convert = self._pending
+            self._pending = None
+            self._data["results"] = [convert(r) for r in results]
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == "results":
+            self._materialize()
+        return self._data[key]
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == "results":
+            self._pending = None
+        self._data[key] = value
+    
+    def __delitem__(self, key: str) -> None:
+        if key == "results" and self._pending is not None:
+            self._pending = None
+            return
+        del self._data[key]
+    
+    def __contains__(self, key: object) -> bool:
+        return (key == "results" and self._pending is not None) or key in self._data
+    
+    def __iter__(self):
+        yield from self._data
+        if self._pending is not None:
+            yield "results"
+    
+    def __len__(self) -> int:
+        return len(self._data) + (self._pending is not None)
+    
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the response as a plain dictionary."""
+        self._materialize()
+        return dict(self._data)
+
+
 class UnifiedBenchmarkEngine:
     """Unified benchmark engine with pluggable architecture."""
     
@@ -148,23 +288,73 @@ class UnifiedBenchmarkEngine:
         self.task_queue = []
         self.current_benchmark: Optional[Benchmark] = None
         self.output_manager = OutputManager()
+        self.plugin_hook_timeout = self.config.plugin_hook_timeout
+        self._strategy_cache: Dict[Any, BaseStrategy] = {}
+        self._cpu_executor: Optional[ProcessPoolExecutor] = None
+        self._created_output_dirs: Set[Path] = set()
+        self._output_manifests: Dict[Path, Dict[str, str]] = {}
+        # Manifests are recorded on executor threads, one save at a time
+        self._output_lock = threading.Lock()
+        self._refresh_hooks()
     
     def add_plugin(self, plugin: EnginePlugin) -> None:
         """Add a plugin to the engine."""
         self.plugins.append(plugin)
+        self._refresh_hooks()
+    
+    def _refresh_hooks(self) -> None:
+        """Precompute the flat callback list for each hook.
+        
+        Only hooks a plugin actually overrides are listed, so an engine
+        without plugins never awaits a hook at all, and dispatch is a direct
+        call on a pre-bound method.
+        """
+        self._pre_benchmark_hooks = self._hook_callbacks("pre_benchmark")
+        self._post_benchmark_hooks = self._hook_callbacks("post_benchmark")
+        self._pre_task_hooks = self._hook_callbacks("pre_task")
+        self._post_task_hooks = self._hook_callbacks("post_task")
+    
+    def _hook_callbacks(self, hook_name: str) -> List[PluginHook]:
+        """Get (label, bound method) pairs for plugins overriding a hook."""
+        return [
+            (f"{type(plugin).__name__}.{hook_name}", getattr(plugin, hook_name))
+            for plugin in self.plugins if _overrides_hook(plugin, hook_name)
+        ]
+    
+    async def _call_hook(self, hook: PluginHook, errors: List[str], *args: Any) -> Any:
+        """Await a plugin hook, bounded by the configured hook timeout.
+        
+        A hook that misses its deadline is abandoned and reported in
+        ``errors``; None is returned in that case.
+        """
+        label, callback = hook
+        try:
+            return await asyncio.wait_for(callback(*args), self.plugin_hook_timeout)
+        except asyncio.TimeoutError:
+            errors.append(f"{label} timeout")
+            return None
+    
+    async def _fan_out(self, hooks: List[PluginHook], errors: List[str], *args: Any) -> None:
+        """Run independent plugin hooks concurrently.
+        
+        The first exception raised by a hook propagates to the caller.
+        """
+        if hooks:
+            await asyncio.gather(*(self._call_hook(hook, errors, *args) for hook in hooks))
     
     def submit_task(self, task: Task) -> None:
         """Submit a task to the benchmark queue."""
         self.task_queue.append(task)
     
-    async def run_benchmark(self, objective: str) -> Dict[str, Any]:
+    async def run_benchmark(self, objective: str) -> BenchmarkResponse:
         """Run a complete benchmark for the given objective.
         
         Args:
             objective: The main objective for the benchmark
             
         Returns:
-            Benchmark results dictionary
+            Benchmark response mapping, on success and failure alike; use
+            its to_dict() for a plain dictionary
         """
         # Create the main task
         main_task = Task(
@@ -178,7 +368,7 @@ class UnifiedBenchmarkEngine:
         
         # Create benchmark
         benchmark = Benchmark(
-            name=self.config.name or f"benchmark-{str(uuid.uuid4())[:8]}",
+            name=self.config.name or f"benchmark-{uuid.uuid4().hex[:8]}",
             description=self.config.description or f"Benchmark for: {objective}",
             config=self.config
         )
@@ -190,8 +380,7 @@ class UnifiedBenchmarkEngine:
         
         try:
             # Run pre-benchmark hooks for all plugins
-            for plugin in self.plugins:
-                await plugin.pre_benchmark(benchmark)
+            await self._fan_out(self._pre_benchmark_hooks, benchmark.error_log, benchmark)
             
             # Execute the task
             if self.config.parallel and len(benchmark.tasks) > 1:
@@ -209,8 +398,7 @@ class UnifiedBenchmarkEngine:
             benchmark.completed_at = datetime.now()
             
             # Run post-benchmark hooks for all plugins
-            for plugin in self.plugins:
-                await plugin.post_benchmark(benchmark)
+            await self._fan_out(self._post_benchmark_hooks, benchmark.error_log, benchmark)
             
             # Save results
             await self._save_benchmark_results(benchmark)
@@ -220,36 +408,52 @@ class UnifiedBenchmarkEngine:
         except Exception as e:
             benchmark.status = TaskStatus.FAILED
             benchmark.completed_at = datetime.now()
+            error_type = type(e).__name__
             benchmark.error_log.append(str(e))
+            benchmark.metadata["error_type"] = error_type
             
-            # Run post-benchmark hooks even on failure
-            for plugin in self.plugins:
-                try:
-                    await plugin.post_benchmark(benchmark)
-                except Exception as plugin_error:
-                    benchmark.error_log.append(f"Plugin error during cleanup: {str(plugin_error)}")
+            # Run post-benchmark hooks even on failure, concurrently
+            outcomes = await asyncio.gather(
+                *(self._call_hook(hook, benchmark.error_log, benchmark)
+                  for hook in self._post_benchmark_hooks),
+                return_exceptions=True
+            )
+            benchmark.error_log.extend(
+                f"Plugin error during cleanup: {outcome!r}"
+                for outcome in outcomes if isinstance(outcome, Exception)
+            )
             
-            return {
+            return BenchmarkResponse({
                 "benchmark_id": benchmark.id,
                 "status": "failed",
                 "error": str(e),
+                "error_type": error_type,
                 "duration": benchmark.duration()
-            }
+            })
     
     async def _execute_task(self, task: Task) -> Result:
         """Execute a single task with all plugins."""
         # Run pre-task hooks for all plugins
-        for plugin in self.plugins:
-            await plugin.pre_task(task)
+        hook_errors: List[str] = []
+        await self._fan_out(self._pre_task_hooks, hook_errors, task)
         
         # Update task status
         task.status = TaskStatus.RUNNING
         task.started_at = datetime.now()
         
+        # A plugin may supply a memoized result for an identical task
+        cached_result = task.parameters.pop("_cache_hit", None)
+        
         try:
-            # Execute the task using the specified strategy
-            strategy = create_strategy(task.strategy.value.lower() if hasattr(task.strategy, 'value') else task.strategy)
-            result = await strategy.execute(task)
+            if cached_result is not None:
+                result = cached_result
+            else:
+                # Execute the task using the specified strategy
+                strategy = self._get_strategy(task.strategy)
+                if getattr(type(strategy), "cpu_bound", False) or task.parameters.get("cpu_bound"):
+                    result = await self._execute_in_process(strategy, task)
+                else:
+                    result = await strategy.execute(task)
             
             # Update task status
             task.status = TaskStatus.COMPLETED
@@ -269,48 +473,206 @@ class UnifiedBenchmarkEngine:
                 errors=[str(e)]
             )
         
-        # Run post-task hooks for all plugins
-        for plugin in self.plugins:
+        # Run post-task hooks sequentially; each plugin may replace the result
+        for hook in self._post_task_hooks:
             try:
-                result = await plugin.post_task(task, result)
+                processed = await self._call_hook(hook, hook_errors, task, result)
+                if processed is not None:
+                    result = processed
             except Exception as e:
                 # Log plugin errors but don't fail the entire process
-                if not result.errors:
-                    result.errors = []
-                result.errors.append(f"Plugin error: {str(e)}")
+                hook_errors.append(f"Plugin error: {str(e)}")
+        
+        # Attach all hook errors to the final result in one step
+        if hook_errors:
+            result.errors = (result.errors or []) + hook_errors
         
         return result
     
-    async def _execute_parallel_tasks(self, tasks: List[Task]) -> List[Result]:
-        """Execute multiple tasks in parallel."""
-        # Create a semaphore to limit concurrency
-        semaphore = asyncio.Semaphore(self.config.max_agents or 5)
-        
-        async def execute_with_semaphore(task: Task) -> Result:
-            async with semaphore:
-                return await self._execute_task(task)
-        
-        # Execute all tasks concurrently with the semaphore
-        return await asyncio.gather(
-            *(execute_with_semaphore(task) for task in tasks),
-            return_exceptions=False
+    def _get_strategy(self, strategy_type: Union[StrategyType, str]) -> BaseStrategy:
+        """Get the strategy instance for a strategy type, creating it once per engine."""
+        strategy = self._strategy_cache.get(strategy_type)
+        if strategy is None:
+            name = strategy_type.value.lower() if isinstance(strategy_type, StrategyType) else strategy_type
+            strategy = create_strategy(name)
+            self._strategy_cache[strategy_type] = strategy
+        return strategy
+    
+    async def _execute_in_process(self, strategy: BaseStrategy, task: Task) -> Result:
+        """Run a CPU-bound strategy in the engine's process pool."""
+        if self._cpu_executor is None:
+            self._cpu_executor = ProcessPoolExecutor(max_workers=self.config.max_agents or None)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._cpu_executor, _run_strategy_in_process, strategy, task
         )
     
+    async def shutdown(self) -> None:
+        """Release worker processes started for CPU-bound strategies and output threads.
+        
+        Waiting for worker processes and pending writes blocks, so it runs
+        on a thread instead of the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        executor, self._cpu_executor = self._cpu_executor, None
+        if executor is not None:
+            await loop.run_in_executor(None, executor.shutdown)
+        await loop.run_in_executor(None, self.output_manager.close)
+    
+    async def _execute_parallel_tasks(self, tasks: List[Task]) -> List[Result]:
+        """Execute multiple tasks in parallel.
+
+        A fixed pool of ``max_agents`` workers pulls tasks from a bounded
+        queue, so the number of coroutines in flight does not grow with the
+        number of tasks. Results are returned in task order.
+        """
+        if not tasks:
+            return []
+        if len(tasks) == 1:
+            return [await self._execute_task(tasks[0])]
+        
+        max_workers = self.config.max_agents or 5
+        if len(tasks) <= max_workers:
+            # The concurrency limit can never be reached, so skip the pool
+            return list(await asyncio.gather(*(self._execute_task(task) for task in tasks)))
+        
+        num_workers = max_workers
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2 * num_workers)
+        results: List[Optional[Result]] = [None] * len(tasks)
+        errors: List[Exception] = []
+
+        async def worker() -> None:
+            while True:
+                index, task = await queue.get()
+                try:
+                    results[index] = await self._execute_task(task)
+                except Exception as e:
+                    # Keep the worker alive so the queue keeps draining
+                    errors.append(e)
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(num_workers)]
+        try:
+            for item in enumerate(tasks):
+                await queue.put(item)
+            await queue.join()
+        finally:
+            for worker_task in workers:
+                worker_task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        if errors:
+            raise errors[0]
+        return results
+    
     async def _save_benchmark_results(self, benchmark: Benchmark) -> None:
         """Save benchmark results to configured output formats."""
         output_dir = Path(self.config.output_directory)
-        output_dir.mkdir(exist_ok=True)
+        if output_dir not in self._created_output_dirs:
+            await asyncio.get_running_loop().run_in_executor(
+                None, lambda: output_dir.mkdir(parents=True, exist_ok=True)
+            )
+            self._created_output_dirs.add(output_dir)
+        
+        # Identical outcomes are recorded as a pointer to the first save
+        if self.config.deduplicate_output:
+            fingerprint = self._output_fingerprint(benchmark)
+            duplicate_of = await asyncio.get_running_loop().run_in_executor(
+                None, self._find_duplicate_output, output_dir, fingerprint, benchmark.id
+            )
+            if duplicate_of is not None:
+                benchmark.metadata["duplicate_of"] = duplicate_of
+                return
         
         # Use output manager to save in all configured formats
-        await self.output_manager.save_benchmark(
+        formats = self.config.output_formats or ["json"]
+        saved = await self.output_manager.save_benchmark(
             benchmark, 
             output_dir, 
-            formats=self.config.output_formats
+            formats=formats
         )
+        
+        # Only a complete save may stand in for later identical runs
+        if self.config.deduplicate_output and all(
+            fmt in saved for fmt in formats if fmt in self.output_manager.handlers
+        ):
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._record_output, output_dir, fingerprint, benchmark.id
+            )
     
-    def _create_benchmark_response(self, benchmark: Benchmark) -> Dict[str, Any]:
+    def _output_fingerprint(self, benchmark: Benchmark) -> str:
+        """Hash the parts of a benchmark that identify its outcome.
+        
+        Ids and timestamps are left out, since they differ on every run.
+        Timings and resource usage are kept, so only a run that measured
+        the same numbers is saved as a pointer.
+        """
+        content = {
+            "config": dataclasses.asdict(benchmark.config),
+            "tasks": [
+                [task.objective, str(task.strategy), str(task.mode)]
+                for task in benchmark.tasks
+            ],
+            "results": [
+                [
+                    str(result.status), result.output, result.errors, result.warnings,
+                    dataclasses.asdict(result.performance_metrics),
+                    dataclasses.asdict(result.resource_usage)
+                ]
+                for result in benchmark.results
+            ]
+        }
+        encoded = json.dumps(content, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+    
+    def _load_manifest(self, output_dir: Path) -> Dict[str, str]:
+        """Return the fingerprint manifest of a directory, read once per engine.
+        
+        Callers hold the output lock.
+        """
+        manifest = self._output_manifests.get(output_dir)
+        if manifest is None:
+            manifest = {}
+            manifest_path = output_dir / ".manifest.txt"
+            if manifest_path.exists():
+                for line in manifest_path.read_text().splitlines():
+                    known_fingerprint, _, known_id = line.partition(" ")
+                    manifest.setdefault(known_fingerprint, known_id)
+            self._output_manifests[output_dir] = manifest
+        return manifest
+    
+    def _find_duplicate_output(self, output_dir: Path, fingerprint: str, benchmark_id: str) -> Optional[str]:
+        """Look up a fingerprint in the directory manifest.
+        
+        Returns:
+            The id of the benchmark already saved with this fingerprint, in
+            which case a ``benchmark_<id>.ref`` pointer file is written
+            instead; None if the fingerprint is new.
+        """
+        with self._output_lock:
+            canonical_id = self._load_manifest(output_dir).get(fingerprint)
+            if canonical_id is not None:
+                (output_dir / f"benchmark_{benchmark_id}.ref").write_text(canonical_id + "\n")
+            return canonical_id
+    
+    def _record_output(self, output_dir: Path, fingerprint: str, benchmark_id: str) -> None:
+        """Record a saved benchmark's fingerprint in the directory manifest.
+        
+        Saves may run concurrently, so this holds the output lock while it
+        reads and appends to the manifest. The first recorded id stays
+        canonical when identical runs finish saving together.
+        """
+        with self._output_lock:
+            manifest = self._load_manifest(output_dir)
+            if fingerprint in manifest:
+                return
+            manifest[fingerprint] = benchmark_id
+            with open(output_dir / ".manifest.txt", "a") as f:
+                f.write(f"{fingerprint} {benchmark_id}\n")
+    
+    def _create_benchmark_response(self, benchmark: Benchmark) -> BenchmarkResponse:
         """Create a standardized benchmark response dictionary."""
-        return {
+        return BenchmarkResponse({
             "benchmark_id": benchmark.id,
             "name": benchmark.name,
             "status": "success",
@@ -325,32 +687,36 @@ class UnifiedBenchmarkEngine:
                 "peak_memory_mb": benchmark.metrics.peak_memory_usage,
                 "average_cpu_percent": benchmark.metrics.total_cpu_time
             },
-            "results": [self._result_to_dict(r) for r in benchmark.results],
             "metadata": benchmark.metadata
-        }
+        }, benchmark.results, self._result_to_dict)
     
     def _result_to_dict(self, result: Result) -> Dict[str, Any]:
         """Convert result to dictionary for JSON serialization."""
+        # Look up nested objects once per result
+        status = result.status
+        performance = result.performance_metrics
+        resources = result.resource_usage
+        completed_at = result.completed_at
         return {
             "id": result.id,
             "task_id": result.task_id,
             "agent_id": result.agent_id,
-            "status": result.status.value if hasattr(result.status, 'value') else str(result.status),
+            "status": status.value if isinstance(status, Enum) else str(status),
             "output_summary": self._summarize_output(result.output),
             "errors": result.errors,
             "warnings": result.warnings,
             "performance": {
-                "execution_time": result.performance_metrics.execution_time,
-                "success_rate": result.performance_metrics.success_rate,
-                "throughput": result.performance_metrics.throughput
+                "execution_time": performance.execution_time,
+                "success_rate": performance.success_rate,
+                "throughput": performance.throughput
             },
             "resources": {
-                "cpu_percent": result.resource_usage.cpu_percent,
-                "memory_mb": result.resource_usage.memory_mb,
-                "peak_memory_mb": result.resource_usage.peak_memory_mb
+                "cpu_percent": resources.cpu_percent,
+                "memory_mb": resources.memory_mb,
+                "peak_memory_mb": resources.peak_memory_mb
             },
             "created_at": result.created_at.isoformat(),
-            "completed_at": result.completed_at.isoformat() if result.completed_at else None
+            "completed_at": completed_at.isoformat() if completed_at else None
         }
     
     def _summarize_output(self, output: Dict[str, Any]) -> Dict[str, Any]:
@@ -361,9 +727,10 @@ class UnifiedBenchmarkEngine:
         # If output has raw_output, provide a truncated version
         if "raw_output" in output and isinstance(output["raw_output"], str):
             raw = output["raw_output"]
+            length = len(raw)
             return {
-                "truncated_output": raw[:200] + "..." if len(raw) > 200 else raw,
-                "output_length": len(raw),
+                "truncated_output": raw[:200] + "..." if length > 200 else raw,
+                "output_length": length,
                 "sections_count": len(output.get("sections", {}))
             }
             
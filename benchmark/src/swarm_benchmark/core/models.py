@@ -255,6 +255,7 @@ class BenchmarkConfig:
     timeout: int = 3600  # seconds
     task_timeout: int = 300  # seconds
     max_retries: int = 3
+    plugin_hook_timeout: Optional[float] = 5.0  # seconds, None disables
     parallel: bool = False
     background: bool = False
     monitoring: bool = True
@@ -266,6 +267,7 @@ class BenchmarkConfig:
     })
     output_formats: List[str] = field(default_factory=lambda: ["json"])
     output_directory: str = "./reports"
+    deduplicate_output: bool = False
     verbose: bool = False
 
 
@@ -1,30 +1,85 @@
 """Unified metrics collection system for benchmarks."""
 
 import asyncio
+import itertools
+import logging
 import time
+import numpy as np
 import psutil
 import threading
-from typing import Dict, List, Any, Optional, Set, Union
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 import json
 import os
+import random
+import sys
 from pathlib import Path
-import uuid
 import subprocess
 from contextlib import contextmanager
 
 from ..core.models import PerformanceMetrics, ResourceUsage, Result
 
+logger = logging.getLogger(__name__)
+
+# Sample history is kept in preallocated ring-buffer columns holding the
+# newest _HISTORY_CAPACITY samples (~27 minutes at 0.1s interval).
+_HISTORY_CAPACITY = 16384
+# Memory and I/O are stored in bytes and reported in MB
+_MB = 1 << 20
+# Per-process I/O counters can be re-read from an open /proc/<pid>/io
+_PROC_IO = sys.platform.startswith("linux")
+# CPU time, RSS and thread count come from one read of /proc/<pid>/stat on
+# Linux, where psutil would read stat, statm and status
+_PROC_STAT = sys.platform.startswith("linux")
+if _PROC_STAT:
+    _CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+# The monitored tree is walked through /proc/<pid>/task/<tid>/children
+# where the kernel provides it, instead of psutil scanning every process
+# on the host for parent pids
+_PROC_CHILDREN = os.path.exists(f"/proc/{os.getpid()}/task/{os.getpid()}/children")
+# System counters are parsed from /proc on Linux instead of through psutil
+_PROCFS = sys.platform.startswith("linux")
+_PROCFS_PATHS = {
+    "stat": "/proc/stat",
+    "meminfo": "/proc/meminfo",
+    "diskstats": "/proc/diskstats",
+    "net": "/proc/net/dev",
+}
+# /proc files are read with a single pread() at offset 0 into a buffer of
+# this size, doubled while a read fills it
+_PROC_READ_SIZE = 4096
+# /proc/diskstats counts 512-byte sectors regardless of device
+_SECTOR_SIZE = 512
+# cgroup v2 mount point
+_CGROUP_ROOT = "/sys/fs/cgroup"
+# Process names shared by all collectors, bounded by clearing when full
+_NAME_CACHE_SIZE = 4096
+# Collection errors logged per collection run; later ones are dropped
+_ERROR_LOG_BUDGET = 10
+# Errors a sample survives: psutil and file errors, and malformed /proc or
+# cgroup contents reaching the hand-written parsers
+_SAMPLE_ERRORS = (psutil.Error, OSError, ValueError, IndexError)
+# Child output is streamed in chunks and kept up to this many bytes per
+# stream; lines are still counted past the cap
+_OUTPUT_READ_CHUNK = 65536
+_OUTPUT_CAP = 16 * 1024 * 1024
+
 
 @dataclass
 class SystemMetrics:
     """System-wide metrics."""
-    timestamp: datetime
+    __slots__ = (
+        "timestamp", "cpu_percent", "memory_percent", "memory_available_bytes",
+        "memory_used_bytes", "disk_read_bytes", "disk_write_bytes",
+        "network_sent_bytes", "network_recv_bytes"
+    )
+    timestamp: int  # time.monotonic_ns()
     cpu_percent: float
     memory_percent: float
-    memory_available_mb: float
-    memory_used_mb: float
+    memory_available_bytes: int
+    memory_used_bytes: int
     disk_read_bytes: int
     disk_write_bytes: int
     network_sent_bytes: int
@@ -34,44 +89,498 @@ class SystemMetrics:
 @dataclass
 class ProcessSnapshot:
     """Snapshot of process metrics."""
+    __slots__ = (
+        "pid", "name", "cpu_percent", "memory_bytes", "threads",
+        "read_bytes", "write_bytes", "io_count", "timestamp"
+    )
     pid: int
     name: str
     cpu_percent: float
-    memory_mb: float
+    memory_bytes: int
     threads: int
     read_bytes: int
     write_bytes: int
     io_count: int
-    timestamp: datetime
+    timestamp: int  # time.monotonic_ns()
 
 
 @dataclass
 class MetricsSnapshot:
     """Complete metrics snapshot."""
-    id: str
-    timestamp: datetime
+    __slots__ = ("id", "timestamp", "system", "processes", "interval_ms")
+    id: int
+    timestamp: int  # time.monotonic_ns()
     system: SystemMetrics
-    processes: List[ProcessSnapshot]
+    processes: Tuple[ProcessSnapshot, ...]
     interval_ms: float
 
 
+class _SharedSystemSampler:
+    """System-wide metrics shared by every collector in the process.
+    
+    System counters are identical for all collectors, so concurrent
+    collectors reuse a recent reading instead of each querying psutil.
+    """
+    
+    def __init__(self):
+        """Initialize the sampler."""
+        # Serializes reads only; a fresh published reading is returned
+        # without taking it
+        self._lock = threading.Lock()
+        # (time.monotonic_ns() when taken, reading), replaced as a whole
+        self._latest: Optional[Tuple[int, tuple]] = None
+        # Open /proc handles, None until first read, {} if unavailable
+        self._proc_files: Optional[Dict[str, Any]] = None
+        self._disks: Set[bytes] = set()
+        self._last_cpu: Optional[Tuple[int, int]] = None
+    
+    def read(self, max_age_ns: int = 0) -> tuple:
+        """Return system metrics, reading them if the last reading is too old.
+        
+        Args:
+            max_age_ns: Age in nanoseconds up to which a reading is reused
+            
+        Returns:
+            Tuple in SystemMetrics field order, without the timestamp
+        """
+        latest = self._latest
+        if latest is not None and time.monotonic_ns() - latest[0] <= max_age_ns:
+            return latest[1]
+        
+        with self._lock:
+            # Another collector may have read while we waited
+            latest = self._latest
+            now = time.monotonic_ns()
+            if latest is None or now - latest[0] > max_age_ns:
+                latest = self._latest = (now, self._read())
+            return latest[1]
+    
+    def prime(self) -> None:
+        """Take a first reading if none was taken yet.
+        
+        CPU percent is measured against the previous reading, so without
+        this the first sample of a run would always report 0.
+        """
+        if self._latest is not None:
+            return
+        try:
+            self.read()
+        except _SAMPLE_ERRORS:
+            # Sampling reports its own errors
+            pass
+    
+    def _read(self) -> tuple:
+        """Read system-wide metrics.
+        
+        Returns:
+            Tuple in SystemMetrics field order, without the timestamp
+        """
+        if _PROCFS:
+            if self._proc_files is None:
+                self._proc_files = self._open_procfs()
+            if self._proc_files:
+                try:
+                    return self._read_procfs()
+                except (OSError, ValueError, IndexError):
+                    self._close_procfs()
+        
+        # Get CPU metrics
+        cpu_percent = psutil.cpu_percent(interval=None)
+        
+        # Get memory metrics
+        memory = psutil.virtual_memory()
+        memory_percent = memory.percent
+        memory_available_bytes = memory.available
+        memory_used_bytes = memory.used
+        
+        # Get disk I/O metrics
+        disk_io = psutil.disk_io_counters()
+        disk_read_bytes = disk_io.read_bytes if disk_io else 0
+        disk_write_bytes = disk_io.write_bytes if disk_io else 0
+        
+        # Get network I/O metrics
+        net_io = psutil.net_io_counters()
+        network_sent_bytes = net_io.bytes_sent if net_io else 0
+        network_recv_bytes = net_io.bytes_recv if net_io else 0
+        
+        return (
+            cpu_percent,
+            memory_percent,
+            memory_available_bytes,
+            memory_used_bytes,
+            disk_read_bytes,
+            disk_write_bytes,
+            network_sent_bytes,
+            network_recv_bytes
+        )
+    
+    def _open_procfs(self) -> Dict[str, Any]:
+        """Open the /proc files read on every sample.
+        
+        Returns:
+            Open files by name, empty if any of them is unavailable
+        """
+        files = {}
+        try:
+            for name, path in _PROCFS_PATHS.items():
+                files[name] = open(path, "rb", buffering=0)
+            # Same device set as psutil: whole disks listed in /sys/block
+            self._disks = {
+                os.fsencode(entry.replace("!", "/")) for entry in os.listdir("/sys/block")
+            }
+        except OSError:
+            for f in files.values():
+                f.close()
+            return {}
+        return files
+    
+    def _close_procfs(self) -> None:
+        """Close the /proc files and fall back to psutil."""
+        for f in self._proc_files.values():
+            f.close()
+        self._proc_files = {}
+    
+    def _read_procfs(self) -> tuple:
+        """Read system-wide metrics by parsing /proc directly.
+        
+        Returns:
+            Tuple in SystemMetrics field order, without the timestamp
+        """
+        files = self._proc_files
+        
+        # CPU percent from the aggregate line of /proc/stat, busy time
+        # over total time since the previous read (as psutil computes it)
+        buf = os.pread(files["stat"].fileno(), 512, 0)
+        times = [int(v) for v in buf[:buf.index(b"\n")].split()[1:9]]
+        total = sum(times)
+        busy = total - times[3] - times[4]  # minus idle and iowait
+        cpu_percent = 0.0
+        if self._last_cpu is not None:
+            total_delta = total - self._last_cpu[1]
+            if total_delta > 0:
+                busy_delta = busy - self._last_cpu[0]
+                cpu_percent = round(min(max(busy_delta / total_delta * 100, 0.0), 100.0), 1)
+        self._last_cpu = (busy, total)
+        
+        # Memory in kB
+        buf = _pread_all(files["meminfo"])
+        mem_total = _meminfo_kb(buf, b"MemTotal:")
+        mem_available = _meminfo_kb(buf, b"MemAvailable:")
+        mem_used = mem_total - mem_available
+        memory_percent = round(mem_used / mem_total * 100, 1) if mem_total else 0.0
+        
+        # Disk sectors read/written, summed over whole disks
+        disks = self._disks
+        read_sectors = 0
+        write_sectors = 0
+        for line in _pread_all(files["diskstats"]).splitlines():
+            fields = line.split()
+            if len(fields) > 9 and fields[2] in disks:
+                read_sectors += int(fields[5])
+                write_sectors += int(fields[9])
+        
+        # Network bytes, summed over all interfaces
+        recv_bytes = 0
+        sent_bytes = 0
+        for line in _pread_all(files["net"]).splitlines()[2:]:
+            fields = line.partition(b":")[2].split()
+            recv_bytes += int(fields[0])
+            sent_bytes += int(fields[8])
+        
+        return (
+            cpu_percent,
+            memory_percent,
+            mem_available * 1024,
+            mem_used * 1024,
+            read_sectors * _SECTOR_SIZE,
+            write_sectors * _SECTOR_SIZE,
+            sent_bytes,
+            recv_bytes
+        )
+
+
+def _cgroup_dir(pid: int) -> Optional[str]:
+    """Return the cgroup v2 directory of a process, if it has one.
+    
+    Args:
+        pid: Process to look up
+        
+    Returns:
+        Directory with the cgroup's stat files, or None without cgroup v2
+    """
+    try:
+        with open(f"/proc/{pid}/cgroup", "rb") as f:
+            for line in f.read().splitlines():
+                if line.startswith(b"0::"):
+                    path = _CGROUP_ROOT + os.fsdecode(line[3:]).rstrip("/")
+                    if os.path.exists(path + "/memory.current"):
+                        return path
+    except OSError:
+        pass
+    return None
+
+
+def _pread_all(f) -> bytes:
+    """Read a whole /proc or cgroup file from offset 0 without seeking.
+    
+    Args:
+        f: Open unbuffered file
+        
+    Returns:
+        File contents
+    """
+    fd = f.fileno()
+    size = _PROC_READ_SIZE
+    buf = os.pread(fd, size, 0)
+    while len(buf) == size:
+        size *= 2
+        buf = os.pread(fd, size, 0)
+    return buf
+
+
+def _descendant_pids(pid: int) -> List[int]:
+    """List a process's descendants from /proc/<pid>/task/<tid>/children.
+    
+    Children of every thread are included. Processes that exit during
+    the walk are skipped.
+    
+    Args:
+        pid: Root process
+        
+    Returns:
+        Descendant pids, parents before their children
+    """
+    descendants = []
+    pending = [pid]
+    while pending:
+        parent = pending.pop()
+        try:
+            tids = os.listdir(f"/proc/{parent}/task")
+        except OSError:
+            continue
+        for tid in tids:
+            try:
+                with open(f"/proc/{parent}/task/{tid}/children", "rb") as f:
+                    children = [int(child) for child in f.read().split()]
+            except OSError:
+                continue
+            descendants.extend(children)
+            pending.extend(children)
+    return descendants
+
+
+def _percentiles_and_peak(values: np.ndarray, percentiles: Tuple[float, ...]) -> Tuple[List[float], float]:
+    """Compute percentiles and the maximum with a single partition.
+    
+    Percentiles use linear interpolation, as np.percentile does by default.
+    
+    Args:
+        values: Non-empty 1-D array
+        percentiles: Percentiles in [0, 100]
+        
+    Returns:
+        Tuple of (percentile values, maximum)
+    """
+    last = len(values) - 1
+    positions = [q / 100 * last for q in percentiles]
+    kth = {last}
+    for pos in positions:
+        kth.add(int(pos))
+        kth.add(min(int(pos) + 1, last))
+    part = np.partition(values, sorted(kth))
+    
+    result = []
+    for pos in positions:
+        lo = int(pos)
+        low = float(part[lo])
+        result.append(low + (float(part[min(lo + 1, last)]) - low) * (pos - lo))
+    return result, float(part[last])
+
+
+def _meminfo_kb(buf: bytes, key: bytes) -> int:
+    """Return a kB field from /proc/meminfo contents."""
+    start = buf.index(key) + len(key)
+    return int(buf[start:buf.index(b"\n", start)].split()[0])
+
+
+def _process_name(proc: psutil.Process) -> str:
+    """Return a process's name, read once per process across collectors.
+    
+    Names are interned, so processes sharing a name share one string.
+    
+    Args:
+        proc: Process to name
+        
+    Returns:
+        Process name
+    """
+    # psutil reads create_time when the handle is made, so the key costs
+    # no syscall and a reused pid gets a new entry
+    key = (proc.pid, proc.create_time())
+    name = _PROCESS_NAMES.get(key)
+    if name is None:
+        name = sys.intern(proc.name())
+        if len(_PROCESS_NAMES) >= _NAME_CACHE_SIZE:
+            _PROCESS_NAMES.clear()
+        _PROCESS_NAMES[key] = name
+    return name
+
+
+def _merge_process_totals(
+    totals: Dict[str, List[float]], name: str, cpu_sum: float, count: int, peak_memory: int
+) -> None:
+    """Add one process's running totals to the per-name totals."""
+    a = totals.get(name)
+    if a is None:
+        totals[name] = [cpu_sum, count, peak_memory]
+        return
+    a[0] += cpu_sum
+    a[1] += count
+    if peak_memory > a[2]:
+        a[2] = peak_memory
+
+
+_SYSTEM_SAMPLER = _SharedSystemSampler()
+_PROCESS_NAMES: Dict[Tuple[int, float], str] = {}
+
+
 class MetricsCollector:
     """Base class for metrics collection."""
     
-    def __init__(self, sampling_interval: float = 0.1):
+    def __init__(
+        self,
+        sampling_interval: float = 0.1,
+        heartbeat_interval: Optional[float] = None,
+        sample_rate: float = 1.0
+    ):
         """Initialize metrics collector.
         
         Args:
             sampling_interval: Time between samples in seconds
+            heartbeat_interval: If given, sample on signal_transition() calls
+                and otherwise only every heartbeat_interval seconds, instead
+                of every sampling_interval
+            sample_rate: Probability that a tick takes a sample. Averages
+                and percentiles stay unbiased, and I/O totals are counter
+                deltas, so they need no rescaling.
         """
         self.sampling_interval = sampling_interval
-        self.snapshots: List[MetricsSnapshot] = []
+        self.heartbeat_interval = heartbeat_interval
+        self.sample_rate = sample_rate
+        # Shared system readings up to half an interval old are reused
+        self._system_max_age_ns = int(sampling_interval * 1e9) // 2
         self._running = False
         self._collection_thread: Optional[threading.Thread] = None
+        self._collection_task: Optional[asyncio.Task] = None
         self._stop_event = threading.Event()
+        # Wakes the event-driven loops early, see signal_transition()
+        self._wake_event = threading.Event()
+        self._async_wake: Optional[asyncio.Event] = None
+        # Set by signal_transition() until the loop samples it
+        self._transition_pending = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # time.monotonic() values; wall-clock times are derived for reports
         self._start_time: Optional[float] = None
         self._end_time: Optional[float] = None
+        # Samples target absolute deadlines start + N * interval
+        self._interval_ns = max(1, int(sampling_interval * 1e9))
+        self._deadline_ns = 0
+        self._missed_samples = 0
+        self._err_budget = _ERROR_LOG_BUDGET
         self._baseline_system = None
+        # Snapshot ids; next() on a count is atomic under the GIL
+        self._snapshot_ids = itertools.count()
+        # Summary reduced on first use after collection stops, so stopping
+        # does no aggregation work the caller may never ask for
+        self._cached_summary: Optional[Dict[str, Any]] = None
+        # Offset converting monotonic timestamps to wall-clock time
+        self._wall_offset_ns = time.time_ns() - time.monotonic_ns()
+        
+        # Column storage for samples. Columns of the same dtype share a
+        # 2-D block so the summary reduces them with one call per
+        # reduction. Percentages are float32; memory and I/O are raw
+        # int64 bytes, converted to MB only on aggregates.
+        # Samples ever written, the ring's only published index. The
+        # collection thread fills slot _written % capacity and then
+        # advances it, so a reader that loads it once sees whole samples.
+        self._written = 0
+        self._float_cols = np.empty((2, _HISTORY_CAPACITY), dtype=np.float32)
+        # System cpu, then process cpu summed per sample
+        self._sys_cpu, self._proc_cpu = self._float_cols
+        self._int_cols = np.empty((7, _HISTORY_CAPACITY), dtype=np.int64)
+        # time.monotonic_ns(), system and summed process memory, disk
+        # read/write and network sent/recv
+        (self._ts, self._sys_mem, self._proc_mem,
+         self._disk_r, self._disk_w, self._net_s, self._net_r) = self._int_cols
+        self._proc_count = np.empty(_HISTORY_CAPACITY, dtype=np.int32)
+        # (pid, create time) -> [name, cpu_sum, sample_count, peak_memory]
+        # for processes seen this run; a process's totals fold into
+        # _retired under its name once it is gone, so short-lived children
+        # leave one entry per name behind
+        self._processes: Dict[Tuple[int, Optional[float]], List[Any]] = {}
+        self._retired: Dict[str, List[float]] = {}
+        
+        # Process handles reused across samples; the tree is re-walked
+        # about once per second
+        self._proc_cache: Dict[int, psutil.Process] = {}
+        self._name_cache: Dict[int, str] = {}
+        self._io_files: Dict[int, Any] = {}
+        self._stat_files: Dict[int, Any] = {}
+        # pid -> (user + system cpu seconds, time.monotonic_ns()) at last sample
+        self._cpu_times: Dict[int, Tuple[float, int]] = {}
+        self._children_refresh_every = max(1, int(1.0 / (heartbeat_interval or sampling_interval)))
+        self._tick = 0
+        self._refresh_pending = True
+        # Monitored child measured through its own cgroup, see watch_cgroup()
+        self._cgroup: Optional[Dict[str, Any]] = None
+        
+        # Warm up the shared CPU counters so the first sample is meaningful
+        _SYSTEM_SAMPLER.prime()
+    
+    @property
+    def sample_count(self) -> int:
+        """Number of samples currently held."""
+        return min(self._written, _HISTORY_CAPACITY)
+    
+    def request_process_refresh(self) -> None:
+        """Re-walk the process tree at the next sample, e.g. after spawning a child."""
+        self._refresh_pending = True
+    
+    def signal_transition(self) -> None:
+        """Take a sample now, e.g. when a monitored process starts or exits.
+        
+        Only applies with a heartbeat_interval; fixed-interval sampling
+        keeps its schedule. Safe to call from any thread.
+        """
+        if self.heartbeat_interval is None:
+            return
+        self._transition_pending = True
+        if self._async_wake is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._async_wake.set)
+            except RuntimeError:
+                # Loop already closed
+                pass
+        else:
+            self._wake_event.set()
+    
+    def watch_cgroup(self, pid: int) -> bool:
+        """Measure a child process tree through its cgroup v2 stats.
+        
+        This replaces per-process enumeration with a few reads per sample.
+        It only applies when the child runs in a cgroup of its own; one
+        shared with this process also holds unrelated processes.
+        
+        Args:
+            pid: Child process id
+            
+        Returns:
+            True if process metrics now come from the child's cgroup
+        """
+        path = _cgroup_dir(pid)
+        if path is None or path == _cgroup_dir(os.getpid()):
+            return False
+        return self._open_cgroup(pid, path)
     
     def start_collection(self) -> None:
         """Start metrics collection."""
@@ -79,8 +588,13 @@ class MetricsCollector:
             return
             
         self._running = True
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
+        self._deadline_ns = time.monotonic_ns()
+        self._err_budget = _ERROR_LOG_BUDGET
+        self._cached_summary = None
         self._stop_event.clear()
+        self._wake_event.clear()
+        self._transition_pending = False
         self._collection_thread = threading.Thread(
             target=self._collection_loop,
             daemon=True
@@ -90,6 +604,29 @@ class MetricsCollector:
         # Take baseline system metrics
         self._baseline_system = self._collect_system_metrics()
     
+    async def start_collection_async(self) -> None:
+        """Start metrics collection as a task on the running event loop.
+        
+        Sampling then shares the loop with the caller's I/O instead of
+        running in a separate thread.
+        """
+        if self._running:
+            return
+            
+        self._running = True
+        self._start_time = time.monotonic()
+        self._deadline_ns = time.monotonic_ns()
+        self._err_budget = _ERROR_LOG_BUDGET
+        self._cached_summary = None
+        self._stop_event.clear()
+        self._transition_pending = False
+        self._baseline_system = self._collect_system_metrics()
+        self._loop = asyncio.get_running_loop()
+        self._async_wake = asyncio.Event()
+        self._collection_task = self._loop.create_task(
+            self._async_collection_loop()
+        )
+    
     def stop_collection(self) -> PerformanceMetrics:
         """Stop metrics collection and return aggregated metrics.
         
@@ -99,38 +636,241 @@ class MetricsCollector:
         if not self._running:
             return PerformanceMetrics()
             
-        self._end_time = time.time()
+        self._end_time = time.monotonic()
         self._stop_event.set()
+        self._wake_event.set()
         self._running = False
         
+        loop_finished = True
         if self._collection_thread:
             self._collection_thread.join(timeout=2.0)
+            loop_finished = not self._collection_thread.is_alive()
             self._collection_thread = None
+        if self._collection_task:
+            self._collection_task.cancel()
+            self._collection_task = None
+            self._async_wake = None
+            self._loop = None
+        # A transition signaled right before stopping, such as the
+        # monitored process exiting, would otherwise go unsampled
+        if self._transition_pending and loop_finished:
+            self._take_sample()
+        self._transition_pending = False
+        self._close_io_files()
+        self._release_cgroup()
             
         return self._aggregate_metrics()
     
+    async def stop_collection_async(self) -> PerformanceMetrics:
+        """Stop metrics collection started with start_collection_async.
+        
+        Returns:
+            Aggregated performance metrics
+        """
+        task = self._collection_task
+        metrics = self.stop_collection()
+        if task:
+            await asyncio.gather(task, return_exceptions=True)
+        return metrics
+    
     def _collection_loop(self) -> None:
         """Main collection loop."""
+        if self.heartbeat_interval is not None:
+            self._event_driven_loop()
+            return
+        
+        # Bound once, the loop body only does local lookups
+        wait = self._stop_event.wait
+        take_sample = self._take_sample
+        next_delay = self._next_delay
+        while True:
+            take_sample()
+            
+            # Sleep until the next sample is due, waking at once on stop
+            if wait(next_delay()):
+                break
+    
+    def _event_driven_loop(self) -> None:
+        """Collection loop sampling on transitions and heartbeats."""
+        stopped = self._stop_event.is_set
+        wake = self._wake_event
+        heartbeat = self.heartbeat_interval
+        while not stopped():
+            # Cleared before sampling so a transition during it still wakes us
+            wake.clear()
+            self._transition_pending = False
+            self._take_sample()
+            wake.wait(heartbeat)
+    
+    async def _async_collection_loop(self) -> None:
+        """Collection loop run as an event loop task."""
+        heartbeat = self.heartbeat_interval
+        wake = self._async_wake
         while not self._stop_event.is_set():
-            loop_start = time.time()
+            if heartbeat is None:
+                self._take_sample()
+                # Yield to the loop until the next sample is due
+                await asyncio.sleep(self._next_delay())
+                continue
             
+            wake.clear()
+            self._transition_pending = False
+            self._take_sample()
             try:
-                # Collect all metrics
-                snapshot = self._collect_snapshot()
-                self.snapshots.append(snapshot)
-                
-                # Limit snapshots to prevent memory issues
-                if len(self.snapshots) > 10000:  # ~16 minutes at 0.1s interval
-                    self.snapshots = self.snapshots[-5000:]
-            except Exception as e:
-                # Log error but continue collection
-                print(f"Error in metrics collection: {str(e)}")
-            
-            # Sleep for remainder of interval
-            elapsed = time.time() - loop_start
-            sleep_time = max(0, self.sampling_interval - elapsed)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+                await asyncio.wait_for(wake.wait(), heartbeat)
+            except asyncio.TimeoutError:
+                pass
+    
+    def _next_delay(self) -> float:
+        """Advance to the next sample deadline.
+        
+        Deadlines are absolute, so time spent sampling or oversleeping
+        does not accumulate as drift. A slot at least half an interval
+        overdue is skipped and counted as missed rather than taken late,
+        so falling behind never produces a burst of catch-up samples.
+        
+        Returns:
+            Seconds until the next sample is due, 0 if it is slightly overdue
+        """
+        interval_ns = self._interval_ns
+        self._deadline_ns += interval_ns
+        remaining = self._deadline_ns - time.monotonic_ns()
+        if remaining >= 0:
+            return remaining / 1e9
+        
+        # Round the lateness to the nearest slot
+        missed = (interval_ns // 2 - remaining) // interval_ns
+        if missed:
+            self._missed_samples += missed
+            self._deadline_ns += missed * interval_ns
+            remaining += missed * interval_ns
+        return max(remaining, 0) / 1e9
+    
+    def _take_sample(self) -> None:
+        """Collect one sample straight into the columns."""
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        
+        timestamp = time.monotonic_ns()
+        try:
+            cpu, _, _, memory_used, disk_r, disk_w, net_s, net_r = self._read_system(
+                self._system_max_age_ns
+            )
+        except _SAMPLE_ERRORS as e:
+            # Skip this sample but continue collection
+            self._log_error("Error in metrics collection", e)
+            return
+        
+        readings = self._read_processes()
+        record_process = self._record_process
+        process_key = self._process_key
+        total_cpu = 0.0
+        total_mem = 0
+        for pid, name, proc_cpu, proc_mem, _, _, _, _ in readings:
+            total_cpu += proc_cpu
+            total_mem += proc_mem
+            record_process(process_key(pid), name, proc_cpu, proc_mem)
+        
+        self._add_snapshot_raw(
+            timestamp, cpu, memory_used, disk_r, disk_w, net_s, net_r,
+            total_cpu, total_mem, len(readings)
+        )
+    
+    def _log_error(self, message: str, error: Exception) -> None:
+        """Log a collection error while the run's error budget lasts."""
+        if self._err_budget > 0:
+            self._err_budget -= 1
+            logger.warning("%s: %s", message, error)
+    
+    def _add_snapshot_raw(
+        self,
+        timestamp: int,
+        cpu_percent: float,
+        memory_used_bytes: int,
+        disk_read_bytes: int,
+        disk_write_bytes: int,
+        network_sent_bytes: int,
+        network_recv_bytes: int,
+        process_cpu_percent: float,
+        process_memory_bytes: int,
+        process_count: int
+    ) -> None:
+        """Append one sample to the columns, overwriting the oldest when full."""
+        written = self._written
+        i = written % _HISTORY_CAPACITY
+        self._ts[i] = timestamp
+        self._sys_cpu[i] = cpu_percent
+        self._sys_mem[i] = memory_used_bytes
+        self._disk_r[i] = disk_read_bytes
+        self._disk_w[i] = disk_write_bytes
+        self._net_s[i] = network_sent_bytes
+        self._net_r[i] = network_recv_bytes
+        self._proc_cpu[i] = process_cpu_percent
+        self._proc_mem[i] = process_memory_bytes
+        self._proc_count[i] = process_count
+        # Publish the sample only once its slot is complete
+        self._written = written + 1
+    
+    def _record_snapshot(self, snapshot: MetricsSnapshot) -> None:
+        """Store a snapshot in the sample columns.
+        
+        Args:
+            snapshot: Snapshot to store
+        """
+        total_cpu = 0.0
+        total_mem = 0
+        for proc in snapshot.processes:
+            total_cpu += proc.cpu_percent
+            total_mem += proc.memory_bytes
+            self._record_process(
+                self._process_key(proc.pid), proc.name, proc.cpu_percent, proc.memory_bytes
+            )
+        
+        system = snapshot.system
+        self._add_snapshot_raw(
+            snapshot.timestamp, system.cpu_percent, system.memory_used_bytes,
+            system.disk_read_bytes, system.disk_write_bytes,
+            system.network_sent_bytes, system.network_recv_bytes,
+            total_cpu, total_mem, len(snapshot.processes)
+        )
+        self._cached_summary = None
+    
+    def _process_key(self, pid: int) -> Tuple[int, Optional[float]]:
+        """Identify a process by pid and create time, so a reused pid starts afresh."""
+        proc = self._proc_cache.get(pid)
+        return (pid, proc.create_time() if proc is not None else None)
+    
+    def _record_process(
+        self, key: Tuple[int, Optional[float]], name: str, cpu_percent: float, memory_bytes: int
+    ) -> None:
+        """Add one sample to a process's running totals."""
+        entry = self._processes.get(key)
+        if entry is None:
+            self._processes[key] = [name, cpu_percent, 1, memory_bytes]
+            return
+        entry[1] += cpu_percent
+        entry[2] += 1
+        if memory_bytes > entry[3]:
+            entry[3] = memory_bytes
+    
+    def _retire_process(self, key: Tuple[int, Optional[float]]) -> None:
+        """Fold a finished process's totals into those of its name."""
+        entry = self._processes.pop(key, None)
+        if entry is not None:
+            _merge_process_totals(self._retired, *entry)
+    
+    def _sample_index(self, step: int = 1) -> np.ndarray:
+        """Ring slots of every step-th held sample, oldest first.
+        
+        Args:
+            step: Stride between returned samples
+            
+        Returns:
+            Index array into the sample columns
+        """
+        written = self._written
+        n = min(written, _HISTORY_CAPACITY)
+        return (written - n + np.arange(0, n, step)) % _HISTORY_CAPACITY
     
     def _collect_snapshot(self) -> MetricsSnapshot:
         """Collect a complete metrics snapshot.
@@ -138,174 +878,446 @@ class MetricsCollector:
         Returns:
             Complete metrics snapshot
         """
-        timestamp = datetime.now()
-        system_metrics = self._collect_system_metrics()
-        process_metrics = self._collect_process_metrics()
-        
+        timestamp = time.monotonic_ns()
+        system_metrics = self._collect_system_metrics(timestamp)
+        process_metrics = tuple(self._collect_process_metrics(timestamp))
         return MetricsSnapshot(
-            id=str(uuid.uuid4()),
+            id=next(self._snapshot_ids),
             timestamp=timestamp,
             system=system_metrics,
             processes=process_metrics,
             interval_ms=self.sampling_interval * 1000
         )
     
-    def _collect_system_metrics(self) -> SystemMetrics:
+    def _collect_system_metrics(self, timestamp: Optional[int] = None) -> SystemMetrics:
         """Collect system-wide metrics.
         
+        Like samples, this reuses a shared reading up to half an interval
+        old, so the baseline taken at start shares the first sample's read.
+        
+        Args:
+            timestamp: Sample time from time.monotonic_ns(), taken now if omitted
+            
         Returns:
             System metrics
         """
-        # Get CPU metrics
-        cpu_percent = psutil.cpu_percent(interval=None)
-        
-        # Get memory metrics
-        memory = psutil.virtual_memory()
-        memory_percent = memory.percent
-        memory_available_mb = memory.available / (1024 * 1024)
-        memory_used_mb = memory.used / (1024 * 1024)
-        
-        # Get disk I/O metrics
-        disk_io = psutil.disk_io_counters()
-        disk_read_bytes = disk_io.read_bytes if disk_io else 0
-        disk_write_bytes = disk_io.write_bytes if disk_io else 0
-        
-        # Get network I/O metrics
-        net_io = psutil.net_io_counters()
-        network_sent_bytes = net_io.bytes_sent if net_io else 0
-        network_recv_bytes = net_io.bytes_recv if net_io else 0
-        
         return SystemMetrics(
-            timestamp=datetime.now(),
-            cpu_percent=cpu_percent,
-            memory_percent=memory_percent,
-            memory_available_mb=memory_available_mb,
-            memory_used_mb=memory_used_mb,
-            disk_read_bytes=disk_read_bytes,
-            disk_write_bytes=disk_write_bytes,
-            network_sent_bytes=network_sent_bytes,
-            network_recv_bytes=network_recv_bytes
+            time.monotonic_ns() if timestamp is None else timestamp,
+            *self._read_system(self._system_max_age_ns)
         )
     
-    def _collect_process_metrics(self) -> List[ProcessSnapshot]:
+    def _read_system(self, max_age_ns: int = 0) -> tuple:
+        """Read system-wide metrics through the shared sampler.
+        
+        Args:
+            max_age_ns: Reuse another collector's reading up to this old
+            
+        Returns:
+            Tuple in SystemMetrics field order, without the timestamp
+        """
+        return _SYSTEM_SAMPLER.read(max_age_ns)
+    
+    def _collect_process_metrics(self, timestamp: Optional[int] = None) -> List[ProcessSnapshot]:
         """Collect metrics for all relevant processes.
         
+        Args:
+            timestamp: Sample time from time.monotonic_ns(), taken now if omitted
+            
         Returns:
             List of process snapshots
         """
-        process_snapshots = []
+        if timestamp is None:
+            timestamp = time.monotonic_ns()
+        return [ProcessSnapshot(*reading, timestamp) for reading in self._read_processes()]
+    
+    def _read_processes(self) -> List[tuple]:
+        """Read metrics for all relevant processes.
+        
+        Returns:
+            Tuples in ProcessSnapshot field order, without the timestamp
+        """
+        if self._cgroup is not None:
+            try:
+                return [self._read_cgroup()]
+            except (OSError, ValueError, IndexError) as e:
+                self._log_error("Error reading cgroup metrics", e)
+                self._release_cgroup()
+        
+        readings = []
         
         try:
             # Get current process and children
-            current_process = psutil.Process()
-            processes = [current_process] + current_process.children(recursive=True)
+            if self._refresh_pending or self._tick % self._children_refresh_every == 0:
+                self._refresh_pending = False
+                self._refresh_process_tree()
+            self._tick += 1
+            
+            # Unbound psutil methods and other per-process helpers are
+            # resolved once per sample rather than once per process
+            oneshot = psutil.Process.oneshot
+            memory_info = psutil.Process.memory_info
+            cpu_times = psutil.Process.cpu_times
+            num_threads = psutil.Process.num_threads
+            read_stat = self._read_proc_stat if _PROC_STAT else None
+            read_io_counters = self._read_io_counters
+            name_cache = self._name_cache
+            last_cpu_times = self._cpu_times
+            append = readings.append
+            now = time.monotonic_ns()
             
-            for proc in processes:
+            for pid, proc in list(self._proc_cache.items()):
                 try:
-                    with proc.oneshot():
-                        # Get memory info
-                        mem_info = proc.memory_info()
-                        
-                        # Get I/O counters (may not be available on all platforms)
-                        io_counters = proc.io_counters() if hasattr(proc, 'io_counters') else None
-                        
-                        snapshot = ProcessSnapshot(
-                            pid=proc.pid,
-                            name=proc.name(),
-                            cpu_percent=proc.cpu_percent(interval=None),
-                            memory_mb=mem_info.rss / (1024 * 1024),
-                            threads=proc.num_threads(),
-                            read_bytes=io_counters.read_bytes if io_counters else 0,
-                            write_bytes=io_counters.write_bytes if io_counters else 0,
-                            io_count=io_counters.read_count + io_counters.write_count if io_counters else 0,
-                            timestamp=datetime.now()
-                        )
-                        process_snapshots.append(snapshot)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    # Process may have terminated or we don't have access
+                    stat = read_stat(pid) if read_stat else None
+                    if stat is not None:
+                        cpu_time, rss, threads = stat
+                    else:
+                        with oneshot(proc):
+                            times = cpu_times(proc)
+                            cpu_time = times.user + times.system
+                            rss = memory_info(proc).rss
+                            threads = num_threads(proc)
+                    
+                    # CPU % from the cpu time delta since the last sample
+                    last = last_cpu_times.get(pid)
+                    last_cpu_times[pid] = (cpu_time, now)
+                    cpu_percent = 0.0
+                    if last is not None and now > last[1]:
+                        cpu_percent = (cpu_time - last[0]) * 1e9 / (now - last[1]) * 100
+                    
+                    read_bytes, write_bytes, io_count = read_io_counters(proc)
+                    append((
+                        pid,
+                        name_cache[pid],
+                        cpu_percent,
+                        rss,
+                        threads,
+                        read_bytes,
+                        write_bytes,
+                        io_count
+                    ))
+                except psutil.NoSuchProcess:
+                    # Process has terminated
+                    self._forget_process(pid)
+                except psutil.AccessDenied:
+                    # We don't have access
                     continue
-        except Exception as e:
+        except _SAMPLE_ERRORS as e:
             # Fallback to just the current process if there's an error
-            print(f"Error collecting process metrics: {str(e)}")
+            self._log_error("Error collecting process metrics", e)
             try:
                 current_process = psutil.Process()
                 mem_info = current_process.memory_info()
                 
-                snapshot = ProcessSnapshot(
-                    pid=current_process.pid,
-                    name=current_process.name(),
-                    cpu_percent=current_process.cpu_percent(interval=None),
-                    memory_mb=mem_info.rss / (1024 * 1024),
-                    threads=current_process.num_threads(),
-                    read_bytes=0,
-                    write_bytes=0,
-                    io_count=0,
-                    timestamp=datetime.now()
-                )
-                process_snapshots.append(snapshot)
-            except:
+                readings.append((
+                    current_process.pid,
+                    current_process.name(),
+                    current_process.cpu_percent(interval=None),
+                    mem_info.rss,
+                    current_process.num_threads(),
+                    0,
+                    0,
+                    0
+                ))
+            except psutil.Error:
                 pass
         
-        return process_snapshots
+        return readings
     
-    def _aggregate_metrics(self) -> PerformanceMetrics:
-        """Aggregate collected metrics into a performance metrics object.
+    def _refresh_process_tree(self) -> None:
+        """Re-walk the process tree, keeping handles for known processes."""
+        current = self._proc_cache.get(os.getpid()) or psutil.Process()
+        alive = {current.pid: current}
+        if _PROC_CHILDREN:
+            children = []
+            for pid in _descendant_pids(current.pid):
+                try:
+                    children.append(psutil.Process(pid))
+                except psutil.NoSuchProcess:
+                    continue
+        else:
+            children = current.children(recursive=True)
+        for child in children:
+            cached = self._proc_cache.get(child.pid)
+            # Process equality includes create time, so reused pids get a new handle
+            alive[child.pid] = cached if cached == child else child
         
+        for pid in list(self._proc_cache):
+            if alive.get(pid) is not self._proc_cache[pid]:
+                self._forget_process(pid)
+        for pid, proc in alive.items():
+            if pid not in self._name_cache:
+                try:
+                    self._name_cache[pid] = _process_name(proc)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            self._proc_cache[pid] = proc
+    
+    def _forget_process(self, pid: int) -> None:
+        """Drop cached state for a process that is gone."""
+        proc = self._proc_cache.pop(pid, None)
+        if proc is not None:
+            self._retire_process((pid, proc.create_time()))
+        self._name_cache.pop(pid, None)
+        self._cpu_times.pop(pid, None)
+        for files in (self._io_files, self._stat_files):
+            f = files.pop(pid, None)
+            if f is not None:
+                f.close()
+    
+    def _read_proc_stat(self, pid: int) -> Optional[tuple]:
+        """Read a process's CPU time, RSS and thread count from /proc/<pid>/stat.
+        
+        Args:
+            pid: Process to read
+            
         Returns:
-            Aggregated performance metrics
+            Tuple of (user + system cpu seconds, rss bytes, threads), or None
+            if the file can't be read, leaving the caller to ask psutil
         """
-        if not self.snapshots or self._start_time is None:
-            return PerformanceMetrics()
+        stat_file = self._stat_files.get(pid)
+        try:
+            if stat_file is None:
+                stat_file = open(f"/proc/{pid}/stat", "rb", buffering=0)
+                self._stat_files[pid] = stat_file
+            buf = os.pread(stat_file.fileno(), 1024, 0)
+            # Fields after the parenthesized command name, which may hold
+            # spaces; utime, stime, num_threads and rss are fields 14, 15,
+            # 20 and 24 of proc(5)
+            fields = buf[buf.rindex(b")") + 2:].split()
+            return (
+                (int(fields[11]) + int(fields[12])) / _CLOCK_TICKS,
+                int(fields[21]) * _PAGE_SIZE,
+                int(fields[17])
+            )
+        except (OSError, ValueError, IndexError):
+            return None
+    
+    def _read_io_counters(self, proc: psutil.Process) -> tuple:
+        """Read a process's I/O counters.
         
-        # Calculate execution time
-        execution_time = (self._end_time or time.time()) - self._start_time
+        Args:
+            proc: Process to read
+            
+        Returns:
+            Tuple of (read_bytes, write_bytes, read_count + write_count)
+        """
+        if _PROC_IO:
+            io_file = self._io_files.get(proc.pid)
+            try:
+                if io_file is None:
+                    io_file = open(f"/proc/{proc.pid}/io", "rb", buffering=0)
+                    self._io_files[proc.pid] = io_file
+                fields = os.pread(io_file.fileno(), 512, 0).split()
+                counters = dict(zip(fields[::2], fields[1::2]))
+                return (
+                    int(counters[b"read_bytes:"]),
+                    int(counters[b"write_bytes:"]),
+                    int(counters[b"syscr:"]) + int(counters[b"syscw:"])
+                )
+            except (OSError, KeyError, ValueError):
+                pass
         
-        # Calculate CPU and memory metrics
-        total_cpu = 0
-        peak_memory = 0
-        avg_memory = 0
+        # I/O counters may not be available on all platforms
+        io_counters = proc.io_counters() if hasattr(proc, 'io_counters') else None
+        if not io_counters:
+            return 0, 0, 0
+        return (
+            io_counters.read_bytes,
+            io_counters.write_bytes,
+            io_counters.read_count + io_counters.write_count
+        )
+    
+    def _open_cgroup(self, pid: int, path: str) -> bool:
+        """Open the stat files of a child's cgroup.
         
-        for snapshot in self.snapshots:
-            # Sum CPU across all processes
-            snapshot_cpu = sum(p.cpu_percent for p in snapshot.processes)
-            total_cpu += snapshot_cpu
+        Args:
+            pid: Child process id
+            path: cgroup v2 directory of the child
             
-            # Sum memory across all processes
-            snapshot_memory = sum(p.memory_mb for p in snapshot.processes)
-            peak_memory = max(peak_memory, snapshot_memory)
-            avg_memory += snapshot_memory
+        Returns:
+            True if the required files could be opened
+        """
+        files = {}
+        try:
+            for name in ("cpu.stat", "memory.current"):
+                files[name] = open(os.path.join(path, name), "rb", buffering=0)
+        except OSError:
+            for f in files.values():
+                f.close()
+            return False
+        # Depend on enabled controllers, reported as 0 when missing
+        for name in ("io.stat", "pids.current"):
+            try:
+                files[name] = open(os.path.join(path, name), "rb", buffering=0)
+            except OSError:
+                pass
         
-        avg_cpu = total_cpu / len(self.snapshots) if self.snapshots else 0
-        avg_memory = avg_memory / len(self.snapshots) if self.snapshots else 0
+        try:
+            name = _process_name(psutil.Process(pid))
+        except psutil.Error:
+            name = os.path.basename(path)
+        self._release_cgroup()
+        self._cgroup = {"pid": pid, "name": name, "files": files, "last_cpu": None}
+        return True
+    
+    def _read_cgroup(self) -> tuple:
+        """Read the watched cgroup as a single process reading.
         
-        # Calculate I/O metrics (delta between first and last snapshot)
-        if len(self.snapshots) >= 2:
-            first, last = self.snapshots[0], self.snapshots[-1]
-            
-            # Calculate disk I/O delta
-            disk_read_delta = last.system.disk_read_bytes - first.system.disk_read_bytes
-            disk_write_delta = last.system.disk_write_bytes - first.system.disk_write_bytes
-            
-            # Calculate network I/O delta
-            net_sent_delta = last.system.network_sent_bytes - first.system.network_sent_bytes
-            net_recv_delta = last.system.network_recv_bytes - first.system.network_recv_bytes
-        else:
-            disk_read_delta = 0
-            disk_write_delta = 0
-            net_sent_delta = 0
-            net_recv_delta = 0
-        
-        # Create resource usage object
-        resource_usage = ResourceUsage(
-            cpu_percent=avg_cpu,
-            memory_mb=avg_memory,
-            peak_memory_mb=peak_memory,
-            average_cpu_percent=avg_cpu,
-            network_bytes_sent=net_sent_delta,
-            network_bytes_recv=net_recv_delta,
-            disk_bytes_read=disk_read_delta,
-            disk_bytes_write=disk_write_delta
+        Returns:
+            Tuple in ProcessSnapshot field order, without the timestamp
+        """
+        cgroup = self._cgroup
+        files = cgroup["files"]
+        now = time.monotonic_ns()
+        
+        # CPU percent from cumulative usage over elapsed time
+        fields = _pread_all(files["cpu.stat"]).split()
+        usage_usec = int(fields[fields.index(b"usage_usec") + 1])
+        cpu_percent = 0.0
+        last = cgroup["last_cpu"]
+        if last is not None and now > last[1]:
+            cpu_percent = (usage_usec - last[0]) * 1000 / (now - last[1]) * 100
+        cgroup["last_cpu"] = (usage_usec, now)
+        
+        memory_bytes = int(_pread_all(files["memory.current"]))
+        
+        tasks = 0
+        f = files.get("pids.current")
+        if f is not None:
+            tasks = int(_pread_all(f))
+        
+        # Lines of "MAJ:MIN rbytes=N wbytes=N rios=N wios=N ..." per device
+        read_bytes = write_bytes = io_count = 0
+        f = files.get("io.stat")
+        if f is not None:
+            for field in _pread_all(f).split():
+                key, _, value = field.partition(b"=")
+                if key == b"rbytes":
+                    read_bytes += int(value)
+                elif key == b"wbytes":
+                    write_bytes += int(value)
+                elif key == b"rios" or key == b"wios":
+                    io_count += int(value)
+        
+        return (
+            cgroup["pid"],
+            cgroup["name"],
+            cpu_percent,
+            memory_bytes,
+            tasks,
+            read_bytes,
+            write_bytes,
+            io_count
         )
+    
+    def _release_cgroup(self) -> None:
+        """Stop reading the watched cgroup."""
+        if self._cgroup is not None:
+            for f in self._cgroup["files"].values():
+                f.close()
+            self._retire_process(self._process_key(self._cgroup["pid"]))
+            self._cgroup = None
+    
+    def _close_io_files(self) -> None:
+        """Close the cached /proc/<pid>/io and /proc/<pid>/stat handles."""
+        for files in (self._io_files, self._stat_files):
+            for f in files.values():
+                f.close()
+            files.clear()
+    
+    def _summarize(self) -> Dict[str, Any]:
+        """Reduce the sample columns to summary statistics.
+        
+        Returns:
+            Summary of system, process and per-name process metrics
+        """
+        written = self._written
+        n = min(written, _HISTORY_CAPACITY)
+        summary: Dict[str, Any] = {
+            "average_cpu_percent": 0.0,
+            "peak_cpu_percent": 0.0,
+            "p50_cpu_percent": 0.0,
+            "p90_cpu_percent": 0.0,
+            "p99_cpu_percent": 0.0,
+            "average_memory_mb": 0.0,
+            "peak_memory_mb": 0.0,
+            "disk_read_bytes": 0,
+            "disk_write_bytes": 0,
+            "network_sent_bytes": 0,
+            "network_recv_bytes": 0,
+            "process_average_cpu_percent": 0.0,
+            "process_average_memory_mb": 0.0,
+            "process_peak_memory_mb": 0.0,
+            "processes": {}
+        }
+        if not n:
+            return summary
+        
+        # One reduction call per statistic over each column block, and
+        # first-to-last deltas of all counters in a single subtraction.
+        # Means, peaks and percentiles ignore order, so the ring is
+        # reduced as stored.
+        floats = self._float_cols[:, :n]
+        sys_cpu_avg, proc_cpu_avg = floats.mean(axis=1).tolist()
+        (p50, p90, p99), sys_cpu_peak = _percentiles_and_peak(floats[0], (50, 90, 99))
+        memory = self._int_cols[1:3, :n]
+        sys_mem_avg, proc_mem_avg = (memory.mean(axis=1) / _MB).tolist()
+        sys_mem_peak, proc_mem_peak = (memory.max(axis=1) / _MB).tolist()
+        last = (written - 1) % _HISTORY_CAPACITY
+        first = (written - n) % _HISTORY_CAPACITY
+        _, _, _, disk_r, disk_w, net_s, net_r = (self._int_cols[:, last] - self._int_cols[:, first]).tolist()
+        summary.update(
+            average_cpu_percent=sys_cpu_avg,
+            peak_cpu_percent=sys_cpu_peak,
+            p50_cpu_percent=p50,
+            p90_cpu_percent=p90,
+            p99_cpu_percent=p99,
+            average_memory_mb=sys_mem_avg,
+            peak_memory_mb=sys_mem_peak,
+            # I/O as the delta between first and last sample
+            disk_read_bytes=disk_r,
+            disk_write_bytes=disk_w,
+            network_sent_bytes=net_s,
+            network_recv_bytes=net_r,
+            # CPU and memory summed across all processes per sample
+            process_average_cpu_percent=proc_cpu_avg,
+            process_average_memory_mb=proc_mem_avg,
+            process_peak_memory_mb=proc_mem_peak
+        )
+        
+        # Group processes by name: [cpu_sum, sample_count, peak_memory]
+        agg = {name: list(totals) for name, totals in self._retired.items()}
+        for entry in self._processes.values():
+            _merge_process_totals(agg, *entry)
+        summary["processes"] = {
+            proc_name: {
+                "average_cpu_percent": a[0] / a[1],
+                "peak_memory_mb": a[2] / _MB
+            }
+            for proc_name, a in agg.items()
+        }
+        return summary
+    
+    def _summary(self) -> Dict[str, Any]:
+        """Return the summary, cached once collection has stopped."""
+        if self._cached_summary is not None:
+            return self._cached_summary
+        summary = self._summarize()
+        if not self._running:
+            self._cached_summary = summary
+        return summary
+    
+    def _aggregate_metrics(self) -> PerformanceMetrics:
+        """Aggregate collected metrics into a performance metrics object.
+        
+        Returns:
+            Aggregated performance metrics
+        """
+        if not self._written or self._start_time is None:
+            return PerformanceMetrics()
+        
+        # Calculate execution time
+        execution_time = (self._end_time or time.monotonic()) - self._start_time
         
         # Create performance metrics
         return PerformanceMetrics(
@@ -317,60 +1329,167 @@ class MetricsCollector:
             coordination_overhead=0.0  # Will be updated by caller
         )
     
-    def save_metrics_report(self, filepath: Path) -> None:
+    def latest_resource_usage(self) -> ResourceUsage:
+        """Return process resource usage as of the last sample.
+        
+        Returns:
+            Resource usage, empty if no samples were taken
+        """
+        written = self._written
+        if not written:
+            return ResourceUsage()
+        
+        n = min(written, _HISTORY_CAPACITY)
+        last = (written - 1) % _HISTORY_CAPACITY
+        cpu = float(self._proc_cpu[last])
+        return ResourceUsage(
+            cpu_percent=cpu,
+            memory_mb=int(self._proc_mem[last]) / _MB,
+            peak_memory_mb=int(self._proc_mem[:n].max()) / _MB,
+            average_cpu_percent=cpu
+        )
+    
+    def save_metrics_report(self, filepath: Path, format: str = "json") -> None:
         """Save detailed metrics report to a file.
         
         Args:
             filepath: Path to save the report
+            format: "json" for the summary with a down-sampled time series,
+                or "npz" for every held sample as compressed columns
+                (np.savez_compressed adds a .npz suffix if missing)
         """
+        if format == "npz":
+            self._save_columns_npz(filepath)
+            return
+        if format != "json":
+            raise ValueError(f"Unknown metrics report format: {format}")
+        
+        n = self.sample_count
+        mb = _MB
+        duration = (self._end_time or time.monotonic()) - self._start_time if self._start_time else 0
+        wall_offset = self._wall_offset_ns / 1e9
+        summary = self._summary()
+        
         # Create report structure
         report = {
             "collection_info": {
-                "start_time": self._start_time,
-                "end_time": self._end_time,
-                "duration": (self._end_time or time.time()) - self._start_time if self._start_time else 0,
+                "start_time": self._start_time + wall_offset if self._start_time else None,
+                "end_time": self._end_time + wall_offset if self._end_time else None,
+                "duration": duration,
                 "sampling_interval": self.sampling_interval,
-                "samples_count": len(self.snapshots)
+                "samples_count": n,
+                "missed_samples": self._missed_samples
             },
             "summary": {
-                "execution_time": (self._end_time or time.time()) - self._start_time if self._start_time else 0,
-                "average_cpu_percent": sum(s.system.cpu_percent for s in self.snapshots) / len(self.snapshots) if self.snapshots else 0,
-                "peak_cpu_percent": max((s.system.cpu_percent for s in self.snapshots), default=0),
-                "average_memory_mb": sum(s.system.memory_used_mb for s in self.snapshots) / len(self.snapshots) if self.snapshots else 0,
-                "peak_memory_mb": max((s.system.memory_used_mb for s in self.snapshots), default=0),
-                "total_disk_read_mb": (self.snapshots[-1].system.disk_read_bytes - self.snapshots[0].system.disk_read_bytes) / (1024 * 1024) if len(self.snapshots) > 1 else 0,
-                "total_disk_write_mb": (self.snapshots[-1].system.disk_write_bytes - self.snapshots[0].system.disk_write_bytes) / (1024 * 1024) if len(self.snapshots) > 1 else 0,
-                "total_network_sent_mb": (self.snapshots[-1].system.network_sent_bytes - self.snapshots[0].system.network_sent_bytes) / (1024 * 1024) if len(self.snapshots) > 1 else 0,
-                "total_network_recv_mb": (self.snapshots[-1].system.network_recv_bytes - self.snapshots[0].system.network_recv_bytes) / (1024 * 1024) if len(self.snapshots) > 1 else 0,
+                "execution_time": duration,
+                "average_cpu_percent": summary["average_cpu_percent"],
+                "peak_cpu_percent": summary["peak_cpu_percent"],
+                "p50_cpu_percent": summary["p50_cpu_percent"],
+                "p90_cpu_percent": summary["p90_cpu_percent"],
+                "p99_cpu_percent": summary["p99_cpu_percent"],
+                "average_memory_mb": summary["average_memory_mb"],
+                "peak_memory_mb": summary["peak_memory_mb"],
+                "total_disk_read_mb": summary["disk_read_bytes"] / mb,
+                "total_disk_write_mb": summary["disk_write_bytes"] / mb,
+                "total_network_sent_mb": summary["network_sent_bytes"] / mb,
+                "total_network_recv_mb": summary["network_recv_bytes"] / mb,
             },
-            "processes": {
-                # Group processes by name
-                proc_name: {
-                    "average_cpu_percent": sum(s.cpu_percent for s in [p for snap in self.snapshots for p in snap.processes if p.name == proc_name]) / len([p for snap in self.snapshots for p in snap.processes if p.name == proc_name]) if [p for snap in self.snapshots for p in snap.processes if p.name == proc_name] else 0,
-                    "peak_memory_mb": max((p.memory_mb for snap in self.snapshots for p in snap.processes if p.name == proc_name), default=0)
-                }
-                for proc_name in set(p.name for snap in self.snapshots for p in snap.processes)
-            }
+            "processes": summary["processes"]
         }
         
         # Add time series data (down-sampled if there are many samples)
-        if len(self.snapshots) > 100:
-            # Take every Nth sample to get ~100 samples
-            n = len(self.snapshots) // 100
-            sampled_snapshots = self.snapshots[::n]
-        else:
-            sampled_snapshots = self.snapshots
-            
+        # Take every Nth sample to get ~100 samples
+        step = n // 100 if n > 100 else 1
+        index = self._sample_index(step)
+        # Only the sampled timestamps are converted to wall-clock strings
+        sampled_ts = ((self._ts[index] + self._wall_offset_ns) / 1e9).tolist()
         report["time_series"] = {
-            "timestamps": [s.timestamp.isoformat() for s in sampled_snapshots],
-            "system_cpu": [s.system.cpu_percent for s in sampled_snapshots],
-            "system_memory_mb": [s.system.memory_used_mb for s in sampled_snapshots],
-            "processes_count": [len(s.processes) for s in sampled_snapshots]
+            "timestamps": [datetime.fromtimestamp(t).isoformat(timespec='milliseconds') for t in sampled_ts],
+            "system_cpu": self._sys_cpu[index].tolist(),
+            "system_memory_mb": (self._sys_mem[index] / _MB).tolist(),
+            "processes_count": self._proc_count[index].tolist()
         }
         
-        # Save to file
+        # Save to file in a single write. The report is compact because
+        # json only uses its C encoder when no indent is requested.
         with open(filepath, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+            f.write(json.dumps(report, separators=(",", ":")))
+
+
+    def _save_columns_npz(self, filepath: Path) -> None:
+        """Save every held sample, oldest first, as compressed NumPy columns.
+        
+        Args:
+            filepath: Path to save the columns
+        """
+        index = self._sample_index()
+        ints = self._int_cols[:, index]
+        np.savez_compressed(
+            filepath,
+            timestamp_ns=ints[0] + self._wall_offset_ns,
+            system_cpu_percent=self._sys_cpu[index],
+            system_memory_bytes=ints[1],
+            process_cpu_percent=self._proc_cpu[index],
+            process_memory_bytes=ints[2],
+            disk_read_bytes=ints[3],
+            disk_write_bytes=ints[4],
+            network_sent_bytes=ints[5],
+            network_recv_bytes=ints[6],
+            processes_count=self._proc_count[index],
+            sampling_interval=np.float64(self.sampling_interval),
+            missed_samples=np.int64(self._missed_samples)
+        )
+
+
+class _OutputBuffer:
+    """Bounded buffer for a child's output stream that counts lines as it fills."""
+    
+    def __init__(self, cap: Optional[int] = None):
+        self.data = bytearray()
+        self.cap = _OUTPUT_CAP if cap is None else cap
+        self.lines = 0
+        self.truncated = False
+        self._ends_line = True
+    
+    def feed(self, chunk: bytes) -> None:
+        """Append a chunk read from the stream."""
+        if not chunk:
+            return
+        self.lines += chunk.count(b"\n")
+        self._ends_line = chunk.endswith(b"\n")
+        room = self.cap - len(self.data)
+        if len(chunk) > room:
+            self.truncated = True
+            chunk = chunk[:max(room, 0)]
+        self.data += chunk
+    
+    @property
+    def line_count(self) -> int:
+        """Number of lines, counting a final line without a newline."""
+        return self.lines + (not self._ends_line)
+    
+    def text(self) -> str:
+        """Decode the kept output."""
+        text = self.data.decode('utf-8', errors='replace')
+        if self.truncated:
+            text += f"\n[output truncated after {self.cap} bytes]"
+        return text
+
+
+async def _drain_stream(stream: asyncio.StreamReader, buffer: _OutputBuffer) -> None:
+    """Read an asyncio stream into a buffer until EOF."""
+    while True:
+        chunk = await stream.read(_OUTPUT_READ_CHUNK)
+        if not chunk:
+            return
+        buffer.feed(chunk)
+
+
+def _drain_pipe(pipe, buffer: _OutputBuffer) -> None:
+    """Read a pipe into a buffer until EOF, closing it afterwards."""
+    with pipe:
+        for chunk in iter(lambda: pipe.read1(_OUTPUT_READ_CHUNK), b""):
+            buffer.feed(chunk)
 
 
 class ProcessExecutionResult:
@@ -385,9 +1504,15 @@ class ProcessExecutionResult:
         start_time: float, 
         end_time: float,
         performance_metrics: PerformanceMetrics,
-        resource_usage: ResourceUsage
+        resource_usage: ResourceUsage,
+        output_size: Optional[int] = None,
+        error_count: Optional[int] = None
     ):
-        """Initialize process execution result."""
+        """Initialize process execution result.
+        
+        output_size and error_count are line counts of stdout and stderr;
+        they are derived from the text when not given.
+        """
         self.command = command
         self.exit_code = exit_code
         self.stdout = stdout
@@ -400,17 +1525,27 @@ class ProcessExecutionResult:
         self.resource_usage = resource_usage
         
         # Additional metrics
-        self.output_size = len(stdout.splitlines()) if stdout else 0
-        self.error_count = len(stderr.splitlines()) if stderr else 0
+        if output_size is None:
+            output_size = len(stdout.splitlines()) if stdout else 0
+        if error_count is None:
+            error_count = len(stderr.splitlines()) if stderr else 0
+        self.output_size = output_size
+        self.error_count = error_count
 
 
 class ProcessMonitor:
     """Monitor for process execution with metrics collection."""
     
-    def __init__(self, sampling_interval: float = 0.1):
-        """Initialize the process monitor."""
+    def __init__(self, sampling_interval: float = 0.1, heartbeat_interval: Optional[float] = None):
+        """Initialize the process monitor.
+        
+        Args:
+            sampling_interval: Time between samples in seconds
+            heartbeat_interval: Sample at process start plus every this
+                many seconds instead, see MetricsCollector
+        """
         self.sampling_interval = sampling_interval
-        self.metrics_collector = MetricsCollector(sampling_interval)
+        self.metrics_collector = MetricsCollector(sampling_interval, heartbeat_interval)
     
     @contextmanager
     def monitor_process(self, process: subprocess.Popen):
@@ -422,9 +1557,11 @@ class ProcessMonitor:
         try:
             # Start metrics collection for this process
             self.metrics_collector.start_collection()
+            self.metrics_collector.signal_transition()
             yield
         finally:
-            # Stop metrics collection
+            # Sample the exit, then stop metrics collection
+            self.metrics_collector.signal_transition()
             self.metrics_collector.stop_collection()
     
     async def execute_command_async(
@@ -449,9 +1586,13 @@ class ProcessMonitor:
             process_env.update(env)
             
         start_time = time.time()
+        out = _OutputBuffer()
+        err = _OutputBuffer()
+        # Lines the monitor adds to stderr, such as a timeout note
+        note_lines = 0
         
-        # Start metrics collection
-        self.metrics_collector.start_collection()
+        # Start metrics collection on this event loop
+        await self.metrics_collector.start_collection_async()
         
         try:
             # Create and run the process
@@ -461,15 +1602,22 @@ class ProcessMonitor:
                 stderr=asyncio.subprocess.PIPE,
                 env=process_env
             )
+            if not self.metrics_collector.watch_cgroup(process.pid):
+                self.metrics_collector.request_process_refresh()
+            self.metrics_collector.signal_transition()
             
-            # Wait for process to complete with timeout
+            # Stream output while waiting for the process, with timeout
             try:
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    process.communicate(), 
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        _drain_stream(process.stdout, out),
+                        _drain_stream(process.stderr, err),
+                        process.wait()
+                    ),
                     timeout=timeout
                 )
-                stdout = stdout_bytes.decode('utf-8', errors='replace')
-                stderr = stderr_bytes.decode('utf-8', errors='replace')
+                stdout = out.text()
+                stderr = err.text()
                 exit_code = process.returncode
                 
             except asyncio.TimeoutError:
@@ -481,35 +1629,30 @@ class ProcessMonitor:
                 except:
                     pass
                     
-                stdout = ""
-                stderr = "Process execution timed out"
+                # Keep the output streamed before the timeout
+                stdout = out.text()
+                stderr = err.text() + "\nProcess execution timed out"
+                note_lines = 1
                 exit_code = -1
+            
+            # Sample the exit before collection stops
+            self.metrics_collector.signal_transition()
                 
         except Exception as e:
             # Handle execution errors
+            out = _OutputBuffer()
+            err = _OutputBuffer()
             stdout = ""
             stderr = f"Error executing process: {str(e)}"
+            note_lines = 1
             exit_code = -1
             
         finally:
             end_time = time.time()
             
             # Stop metrics collection
-            metrics = self.metrics_collector.stop_collection()
-            resource_usage = ResourceUsage()
-            
-            # Get resource usage from the last snapshot if available
-            if self.metrics_collector.snapshots:
-                last_snapshot = self.metrics_collector.snapshots[-1]
-                total_memory_mb = sum(p.memory_mb for p in last_snapshot.processes)
-                avg_cpu = sum(p.cpu_percent for p in last_snapshot.processes)
-                
-                resource_usage = ResourceUsage(
-                    cpu_percent=avg_cpu,
-                    memory_mb=total_memory_mb,
-                    peak_memory_mb=max((sum(p.memory_mb for p in s.processes) for s in self.metrics_collector.snapshots), default=0),
-                    average_cpu_percent=avg_cpu
-                )
+            metrics = await self.metrics_collector.stop_collection_async()
+            resource_usage = self.metrics_collector.latest_resource_usage()
             
             # Create execution result
             return ProcessExecutionResult(
@@ -520,7 +1663,9 @@ class ProcessMonitor:
                 start_time=start_time,
                 end_time=end_time,
                 performance_metrics=metrics,
-                resource_usage=resource_usage
+                resource_usage=resource_usage,
+                output_size=out.line_count,
+                error_count=err.line_count + note_lines
             )
     
     def execute_command(
@@ -545,6 +1690,10 @@ class ProcessMonitor:
             process_env.update(env)
             
         start_time = time.time()
+        out = _OutputBuffer()
+        err = _OutputBuffer()
+        # Lines the monitor adds to stderr, such as a timeout note
+        note_lines = 0
         
         # Start metrics collection
         self.metrics_collector.start_collection()
@@ -555,25 +1704,47 @@ class ProcessMonitor:
                 command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                env=process_env,
-                universal_newlines=True  # Text mode
+                env=process_env
             )
+            if not self.metrics_collector.watch_cgroup(process.pid):
+                self.metrics_collector.request_process_refresh()
+            self.metrics_collector.signal_transition()
+            
+            # Stream output from reader threads while waiting
+            readers = [
+                threading.Thread(target=_drain_pipe, args=(process.stdout, out), daemon=True),
+                threading.Thread(target=_drain_pipe, args=(process.stderr, err), daemon=True),
+            ]
+            for reader in readers:
+                reader.start()
             
             try:
-                stdout, stderr = process.communicate(timeout=timeout)
-                exit_code = process.returncode
-                
+                exit_code = process.wait(timeout=timeout)
+                timed_out = False
             except subprocess.TimeoutExpired:
                 # Handle timeout
                 process.kill()
-                stdout, stderr = process.communicate()
+                process.wait()
                 exit_code = -1
+                timed_out = True
+            # Sample the exit before collection stops
+            self.metrics_collector.signal_transition()
+            
+            for reader in readers:
+                reader.join()
+            stdout = out.text()
+            stderr = err.text()
+            if timed_out:
                 stderr += "\nProcess execution timed out"
+                note_lines = 1
                 
         except Exception as e:
             # Handle execution errors
+            out = _OutputBuffer()
+            err = _OutputBuffer()
             stdout = ""
             stderr = f"Error executing process: {str(e)}"
+            note_lines = 1
             exit_code = -1
             
         finally:
@@ -581,20 +1752,7 @@ class ProcessMonitor:
             
             # Stop metrics collection
             metrics = self.metrics_collector.stop_collection()
-            resource_usage = ResourceUsage()
-            
-            # Get resource usage from the last snapshot if available
-            if self.metrics_collector.snapshots:
-                last_snapshot = self.metrics_collector.snapshots[-1]
-                total_memory_mb = sum(p.memory_mb for p in last_snapshot.processes)
-                avg_cpu = sum(p.cpu_percent for p in last_snapshot.processes)
-                
-                resource_usage = ResourceUsage(
-                    cpu_percent=avg_cpu,
-                    memory_mb=total_memory_mb,
-                    peak_memory_mb=max((sum(p.memory_mb for p in s.processes) for s in self.metrics_collector.snapshots), default=0),
-                    average_cpu_percent=avg_cpu
-                )
+            resource_usage = self.metrics_collector.latest_resource_usage()
             
             # Create execution result
             return ProcessExecutionResult(
@@ -605,5 +1763,7 @@ class ProcessMonitor:
                 start_time=start_time,
                 end_time=end_time,
                 performance_metrics=metrics,
-                resource_usage=resource_usage
+                resource_usage=resource_usage,
+                output_size=out.line_count,
+                error_count=err.line_count + note_lines
             )
\ No newline at end of file
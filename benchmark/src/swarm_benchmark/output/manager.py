@@ -1,18 +1,132 @@
 """Unified output manager for benchmark results."""
 
 import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Set, Union
+import csv
 import json
 import sqlite3
 
-from ..core.models import Benchmark, Result
+from ..core.models import Benchmark, Result, Task
+
+# Worker threads shared by all handlers of an OutputManager
+_OUTPUT_WORKERS = 4
+# Benchmarks with up to this many tasks plus results write their CSV
+# files in a single worker call instead of one call per file
+_SMALL_CSV_ROWS = 1000
+
+
+def _enum_str(value: Any) -> str:
+    """Return an enum's value, or the string form of anything else."""
+    return value.value if isinstance(value, Enum) else str(value)
+
+
+@dataclass(frozen=True)
+class _BenchmarkView:
+    """Benchmark fields preformatted once for all output formats.
+    
+    The task, result and error rows are built on first use, in whichever
+    worker thread needs them first, and then shared by every handler.
+    """
+    benchmark: Benchmark
+    status: str
+    created_at: str
+    started_at: Optional[str]
+    completed_at: Optional[str]
+    duration: Optional[float]
+    strategy: str
+    mode: str
+    
+    @classmethod
+    def of(cls, benchmark: Benchmark) -> "_BenchmarkView":
+        """Format a benchmark's shared fields."""
+        return cls(
+            benchmark=benchmark,
+            status=_enum_str(benchmark.status),
+            created_at=benchmark.created_at.isoformat(),
+            started_at=benchmark.started_at.isoformat() if benchmark.started_at else None,
+            completed_at=benchmark.completed_at.isoformat() if benchmark.completed_at else None,
+            duration=benchmark.duration(),
+            strategy=_enum_str(benchmark.config.strategy),
+            mode=_enum_str(benchmark.config.mode)
+        )
+    
+    @cached_property
+    def task_rows(self) -> List[tuple]:
+        """Rows of (id, benchmark_id, objective, strategy, status, duration)."""
+        benchmark_id = self.benchmark.id
+        enum_str = _enum_str
+        return [
+            (task.id, benchmark_id, task.objective, enum_str(task.strategy), enum_str(task.status), task.duration())
+            for task in self.benchmark.tasks
+        ]
+    
+    @cached_property
+    def result_rows(self) -> List[tuple]:
+        """Rows of (id, task_id, agent_id, status, execution_time, cpu_percent,
+        memory_mb, created_at, completed_at)."""
+        enum_str = _enum_str
+        return [
+            (
+                result.id,
+                result.task_id,
+                result.agent_id,
+                enum_str(result.status),
+                result.performance_metrics.execution_time,
+                result.resource_usage.cpu_percent,
+                result.resource_usage.memory_mb,
+                result.created_at.isoformat(),
+                result.completed_at.isoformat() if result.completed_at else None
+            )
+            for result in self.benchmark.results
+        ]
+    
+    @cached_property
+    def error_rows(self) -> List[tuple]:
+        """Rows of (result_id, error_text)."""
+        return [(result.id, error) for result in self.benchmark.results for error in result.errors]
+
+
+# View of the benchmark OutputManager is saving, seen by its handler tasks
+_current_view: ContextVar[Optional[_BenchmarkView]] = ContextVar("benchmark_view", default=None)
+
+
+def _benchmark_view(benchmark: Benchmark) -> _BenchmarkView:
+    """Return the shared view of a benchmark, building it if none is set."""
+    view = _current_view.get()
+    if view is None or view.benchmark is not benchmark:
+        view = _BenchmarkView.of(benchmark)
+    return view
+
+
+def _shared_rows(view: _BenchmarkView, name: str):
+    """Yield one of a view's row lists, building it only once iterated.
+    
+    Keeps row building in the worker thread that writes the rows.
+    """
+    yield from getattr(view, name)
+
+
+def _write_csv(path: Path, header: List[str], rows) -> None:
+    """Write one CSV file from a header and an iterable of rows."""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
 
 
 class OutputHandler:
     """Base class for output handlers."""
     
+    # Pool for blocking file and database work; None uses the loop's default
+    executor: Optional[Executor] = None
+    
     async def save_benchmark(
         self, benchmark: Benchmark, output_dir: Path
     ) -> Path:
@@ -31,6 +145,16 @@ class OutputHandler:
 class JSONOutputHandler(OutputHandler):
     """Handler for JSON output format."""
     
+    def __init__(self, indent: Optional[int] = None):
+        """Initialize the handler.
+        
+        Args:
+            indent: Indent the top-level object for humans; compact if None
+        """
+        self.indent = indent
+        # Reused for every record; compact encoding runs in the C encoder
+        self._encode = json.JSONEncoder(default=str).encode
+    
     async def save_benchmark(
         self, benchmark: Benchmark, output_dir: Path
     ) -> Path:
@@ -43,40 +167,85 @@ class JSONOutputHandler(OutputHandler):
         Returns:
             Path to the saved JSON file
         """
-        # Ensure the output directory exists
-        output_dir.mkdir(exist_ok=True, parents=True)
-        
         # Generate filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{benchmark.name}_{benchmark.id}_{timestamp}.json"
         output_path = output_dir / filename
         
-        # Convert benchmark to dict
-        benchmark_dict = self._benchmark_to_dict(benchmark)
+        view = _benchmark_view(benchmark)
         
-        # Write to file
-        async def write_file():
+        # Write to file; directory creation and JSON encoding run off the event loop
+        def write_file():
+            output_dir.mkdir(exist_ok=True, parents=True)
             with open(output_path, 'w') as f:
-                json.dump(benchmark_dict, f, indent=2, default=str)
+                self._write_benchmark(benchmark, f, view)
                 
-        await asyncio.get_event_loop().run_in_executor(None, write_file)
+        await asyncio.get_running_loop().run_in_executor(self.executor, write_file)
         
         return output_path
     
+    def _write_benchmark(self, benchmark: Benchmark, f, view: Optional[_BenchmarkView] = None) -> None:
+        """Stream a benchmark to f as JSON.
+        
+        Tasks and results are encoded one record at a time, so the full
+        list of record dicts is never held in memory.
+        """
+        indent = self.indent
+        # Line break before top-level members and array records when pretty
+        newline = "\n" + " " * indent if indent else ""
+        
+        # Header object left open, footer object spliced in after the arrays
+        header = json.dumps(self._benchmark_header(benchmark, view), indent=indent, default=str)
+        f.write(header[:header.rindex("}")].rstrip())
+        view = view or _benchmark_view(benchmark)
+        self._write_records(f, "tasks", map(self._task_record, view.task_rows), newline)
+        self._write_records(
+            f, "results", map(self._result_record, benchmark.results, view.result_rows), newline
+        )
+        footer = json.dumps(
+            {"error_log": benchmark.error_log, "metadata": benchmark.metadata},
+            indent=indent,
+            default=str
+        )
+        f.write("," + (newline or " ") + footer[1:].lstrip())
+    
+    def _write_records(self, f, key: str, records, newline: str) -> None:
+        """Write a top-level JSON array member, one record per line when pretty."""
+        f.write(f',{newline or " "}"{key}": [')
+        # Records sit one indent level deeper than the member
+        item_newline = newline + newline[1:]
+        separator = item_newline
+        encode = self._encode
+        for record in records:
+            f.write(separator)
+            f.write(encode(record))
+            separator = "," + (item_newline or " ")
+        f.write((newline if separator != item_newline else "") + "]")
+    
     def _benchmark_to_dict(self, benchmark: Benchmark) -> Dict[str, Any]:
         """Convert benchmark to serializable dictionary."""
+        benchmark_dict = self._benchmark_header(benchmark)
+        benchmark_dict["tasks"] = [self._task_to_dict(task) for task in benchmark.tasks]
+        benchmark_dict["results"] = [self._result_to_dict(result) for result in benchmark.results]
+        benchmark_dict["error_log"] = benchmark.error_log
+        benchmark_dict["metadata"] = benchmark.metadata
+        return benchmark_dict
+    
+    def _benchmark_header(self, benchmark: Benchmark, view: Optional[_BenchmarkView] = None) -> Dict[str, Any]:
+        """Convert the fixed-size part of a benchmark to a dictionary."""
+        view = view or _benchmark_view(benchmark)
         return {
             "id": benchmark.id,
             "name": benchmark.name,
             "description": benchmark.description,
-            "status": benchmark.status.value if hasattr(benchmark.status, 'value') else str(benchmark.status),
-            "created_at": benchmark.created_at.isoformat(),
-            "started_at": benchmark.started_at.isoformat() if benchmark.started_at else None,
-            "completed_at": benchmark.completed_at.isoformat() if benchmark.completed_at else None,
-            "duration": benchmark.duration(),
+            "status": view.status,
+            "created_at": view.created_at,
+            "started_at": view.started_at,
+            "completed_at": view.completed_at,
+            "duration": view.duration,
             "config": {
-                "strategy": benchmark.config.strategy.value if hasattr(benchmark.config.strategy, 'value') else str(benchmark.config.strategy),
-                "mode": benchmark.config.mode.value if hasattr(benchmark.config.mode, 'value') else str(benchmark.config.mode),
+                "strategy": view.strategy,
+                "mode": view.mode,
                 "max_agents": benchmark.config.max_agents,
                 "parallel": benchmark.config.parallel,
                 "timeout": benchmark.config.timeout
@@ -91,51 +260,81 @@ class JSONOutputHandler(OutputHandler):
                 "throughput": benchmark.metrics.throughput,
                 "quality_score": benchmark.metrics.quality_score,
                 "peak_memory_usage": benchmark.metrics.peak_memory_usage
+            }
+        }
+    
+    def _task_to_dict(self, task: Task) -> Dict[str, Any]:
+        """Convert a task to a serializable dictionary."""
+        return {
+            "id": task.id,
+            "objective": task.objective,
+            "strategy": _enum_str(task.strategy),
+            "status": _enum_str(task.status),
+            "duration": task.duration()
+        }
+    
+    def _task_record(self, row: tuple) -> Dict[str, Any]:
+        """Convert a shared task row to the dictionary _task_to_dict returns."""
+        task_id, _, objective, strategy, status, duration = row
+        return {
+            "id": task_id,
+            "objective": objective,
+            "strategy": strategy,
+            "status": status,
+            "duration": duration
+        }
+    
+    def _result_to_dict(self, result: Result) -> Dict[str, Any]:
+        """Convert a result to a serializable dictionary."""
+        return self._result_record(result)
+    
+    def _result_record(self, result: Result, row: Optional[tuple] = None) -> Dict[str, Any]:
+        """Convert a result to a dictionary, reusing its shared row if given."""
+        return {
+            "id": result.id,
+            "task_id": result.task_id,
+            "agent_id": result.agent_id,
+            "status": row[3] if row else _enum_str(result.status),
+            "errors": result.errors,
+            "warnings": result.warnings,
+            "performance_metrics": {
+                "execution_time": result.performance_metrics.execution_time,
+                "success_rate": result.performance_metrics.success_rate,
+                "throughput": result.performance_metrics.throughput
             },
-            "tasks": [
-                {
-                    "id": task.id,
-                    "objective": task.objective,
-                    "strategy": task.strategy.value if hasattr(task.strategy, 'value') else str(task.strategy),
-                    "status": task.status.value if hasattr(task.status, 'value') else str(task.status),
-                    "duration": task.duration()
-                }
-                for task in benchmark.tasks
-            ],
-            "results": [
-                {
-                    "id": result.id,
-                    "task_id": result.task_id,
-                    "agent_id": result.agent_id,
-                    "status": result.status.value if hasattr(result.status, 'value') else str(result.status),
-                    "errors": result.errors,
-                    "warnings": result.warnings,
-                    "performance_metrics": {
-                        "execution_time": result.performance_metrics.execution_time,
-                        "success_rate": result.performance_metrics.success_rate,
-                        "throughput": result.performance_metrics.throughput
-                    },
-                    "resource_usage": {
-                        "cpu_percent": result.resource_usage.cpu_percent,
-                        "memory_mb": result.resource_usage.memory_mb,
-                        "peak_memory_mb": result.resource_usage.peak_memory_mb
-                    }
-                }
-                for result in benchmark.results
-            ],
-            "error_log": benchmark.error_log,
-            "metadata": benchmark.metadata
+            "resource_usage": {
+                "cpu_percent": result.resource_usage.cpu_percent,
+                "memory_mb": result.resource_usage.memory_mb,
+                "peak_memory_mb": result.resource_usage.peak_memory_mb
+            }
         }
 
 
 class SQLiteOutputHandler(OutputHandler):
-    """Handler for SQLite output format."""
+    """Handler for SQLite output format.
+    
+    All database work runs on one dedicated writer thread instead of the
+    shared executor, so saves are serialized without locks and the cached
+    connection is only ever used from that thread.
+    """
+    
+    def __init__(self):
+        """Initialize the handler with no open database."""
+        # One writer connection reused across saves to the same database
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_path: Optional[Path] = None
+        # Databases whose tables this handler has already created
+        self._schema_initialized: Set[Path] = set()
+        # Started on first save and stopped by close()
+        self._writer: Optional[ThreadPoolExecutor] = None
     
     async def save_benchmark(
         self, benchmark: Benchmark, output_dir: Path
     ) -> Path:
         """Save benchmark results to SQLite format.
         
+        Benchmarks without tasks or results are not written.
+        
         Args:
             benchmark: The benchmark to save
             output_dir: Directory to save results in
@@ -143,44 +342,101 @@ class SQLiteOutputHandler(OutputHandler):
         Returns:
             Path to the saved SQLite file
         """
-        # Ensure the output directory exists
-        output_dir.mkdir(exist_ok=True, parents=True)
-        
         # Generate DB filename
         db_path = output_dir / "benchmarks.db"
         
-        # Define async function for SQLite operations
-        async def save_to_sqlite():
-            conn = sqlite3.connect(str(db_path))
-            cursor = conn.cursor()
-            
-            # Create tables if they don't exist
-            self._create_tables(cursor)
-            
-            # Insert benchmark
-            self._insert_benchmark(cursor, benchmark)
-            
-            # Insert tasks
-            for task in benchmark.tasks:
-                self._insert_task(cursor, task, benchmark.id)
-            
-            # Insert results
-            for result in benchmark.results:
-                self._insert_result(cursor, result)
-            
-            # Commit and close
-            conn.commit()
-            conn.close()
-            
-        # Run SQLite operations in a thread pool
-        await asyncio.get_event_loop().run_in_executor(None, save_to_sqlite)
+        # Nothing ran, so skip the write (and creating the database)
+        if not benchmark.tasks and not benchmark.results:
+            return db_path
+        
+        view = _benchmark_view(benchmark)
+        
+        # Define blocking function for SQLite operations
+        def save_to_sqlite():
+            conn = self._get_connection(output_dir, db_path)
+            # The connection commits on exit and rolls back on error
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                
+                # Insert benchmark
+                self._insert_benchmark(conn, benchmark, view)
+                
+                # Insert tasks
+                self._insert_tasks(conn, view.task_rows)
+                
+                # Insert results
+                self._insert_results(conn, view.result_rows, view.error_rows)
+        
+        # Queued saves run one at a time on the writer thread
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="flowx-sqlite")
+        await asyncio.get_running_loop().run_in_executor(self._writer, save_to_sqlite)
         
         return db_path
     
-    def _create_tables(self, cursor: sqlite3.Cursor) -> None:
+    def close(self) -> None:
+        """Wait for queued saves, then close the connection and writer thread."""
+        if self._writer is None:
+            return
+        self._writer.submit(self._close_connection).result()
+        self._writer.shutdown(wait=True)
+        self._writer = None
+    
+    def _close_connection(self) -> None:
+        """Close the cached database connection, if any."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._db_path = None
+    
+    def _get_connection(self, output_dir: Path, db_path: Path) -> sqlite3.Connection:
+        """Return the cached connection for db_path, opening it if needed.
+        
+        Tables are created the first time a database is opened.
+        """
+        if self._conn is not None and self._db_path == db_path:
+            return self._conn
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        
+        # Ensure the output directory exists
+        output_dir.mkdir(exist_ok=True, parents=True)
+        conn = self._connect(db_path)
+        if db_path not in self._schema_initialized:
+            try:
+                with conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    self._create_tables(conn)
+            except BaseException:
+                conn.close()
+                raise
+            self._schema_initialized.add(db_path)
+        
+        self._conn = conn
+        self._db_path = db_path
+        return conn
+    
+    def _connect(self, db_path: Path) -> sqlite3.Connection:
+        """Open a connection tuned for bulk benchmark writes.
+        
+        The connection is in autocommit mode so each save runs in one
+        explicit transaction. WAL with synchronous=NORMAL avoids an fsync
+        per commit; journal mode must be set outside a transaction.
+        """
+        # Only the writer thread touches the connection, but that thread
+        # belongs to the executor rather than to this handler
+        conn = sqlite3.connect(str(db_path), isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        return conn
+    
+    def _create_tables(self, conn: sqlite3.Connection) -> None:
         """Create database tables if they don't exist."""
         # Benchmarks table
-        cursor.execute('''
+        conn.execute('''
         CREATE TABLE IF NOT EXISTS benchmarks (
             id TEXT PRIMARY KEY,
             name TEXT,
@@ -200,7 +456,7 @@ class SQLiteOutputHandler(OutputHandler):
         ''')
         
         # Tasks table
-        cursor.execute('''
+        conn.execute('''
         CREATE TABLE IF NOT EXISTS tasks (
             id TEXT PRIMARY KEY,
             benchmark_id TEXT,
@@ -213,7 +469,7 @@ class SQLiteOutputHandler(OutputHandler):
         ''')
         
         # Results table
-        cursor.execute('''
+        conn.execute('''
         CREATE TABLE IF NOT EXISTS results (
             id TEXT PRIMARY KEY,
             task_id TEXT,
@@ -229,7 +485,7 @@ class SQLiteOutputHandler(OutputHandler):
         ''')
         
         # Errors table
-        cursor.execute('''
+        conn.execute('''
         CREATE TABLE IF NOT EXISTS errors (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             result_id TEXT,
@@ -239,7 +495,7 @@ class SQLiteOutputHandler(OutputHandler):
         ''')
         
         # Metrics table
-        cursor.execute('''
+        conn.execute('''
         CREATE TABLE IF NOT EXISTS metrics (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             benchmark_id TEXT,
@@ -248,22 +504,31 @@ class SQLiteOutputHandler(OutputHandler):
             FOREIGN KEY (benchmark_id) REFERENCES benchmarks (id)
         )
         ''')
+        
+        # SQLite does not index foreign key columns on its own
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_benchmark ON tasks (benchmark_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_results_task ON results (task_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_errors_result ON errors (result_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_metrics_benchmark ON metrics (benchmark_id)")
     
-    def _insert_benchmark(self, cursor: sqlite3.Cursor, benchmark: Benchmark) -> None:
+    def _insert_benchmark(
+        self, conn: sqlite3.Connection, benchmark: Benchmark, view: Optional[_BenchmarkView] = None
+    ) -> None:
         """Insert benchmark record into database."""
-        cursor.execute('''
+        view = view or _benchmark_view(benchmark)
+        conn.execute('''
         INSERT OR REPLACE INTO benchmarks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         ''', (
             benchmark.id,
             benchmark.name,
             benchmark.description,
-            benchmark.status.value if hasattr(benchmark.status, 'value') else str(benchmark.status),
-            benchmark.created_at.isoformat(),
-            benchmark.started_at.isoformat() if benchmark.started_at else None,
-            benchmark.completed_at.isoformat() if benchmark.completed_at else None,
-            benchmark.duration(),
-            benchmark.config.strategy.value if hasattr(benchmark.config.strategy, 'value') else str(benchmark.config.strategy),
-            benchmark.config.mode.value if hasattr(benchmark.config.mode, 'value') else str(benchmark.config.mode),
+            view.status,
+            view.created_at,
+            view.started_at,
+            view.completed_at,
+            view.duration,
+            view.strategy,
+            view.mode,
             benchmark.config.max_agents,
             1 if benchmark.config.parallel else 0,
             benchmark.metrics.success_rate,
@@ -271,44 +536,28 @@ class SQLiteOutputHandler(OutputHandler):
         ))
         
         # Insert metrics
-        self._insert_metrics(cursor, benchmark)
+        self._insert_metrics(conn, benchmark)
     
-    def _insert_task(self, cursor: sqlite3.Cursor, task, benchmark_id: str) -> None:
-        """Insert task record into database."""
-        cursor.execute('''
+    def _insert_tasks(self, conn: sqlite3.Connection, task_rows: List[tuple]) -> None:
+        """Insert task rows (see _BenchmarkView.task_rows) into database."""
+        conn.executemany('''
         INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
-            task.id,
-            benchmark_id,
-            task.objective,
-            task.strategy.value if hasattr(task.strategy, 'value') else str(task.strategy),
-            task.status.value if hasattr(task.status, 'value') else str(task.status),
-            task.duration()
-        ))
+        ''', task_rows)
     
-    def _insert_result(self, cursor: sqlite3.Cursor, result: Result) -> None:
-        """Insert result record into database."""
-        cursor.execute('''
+    def _insert_results(
+        self, conn: sqlite3.Connection, result_rows: List[tuple], error_rows: List[tuple]
+    ) -> None:
+        """Insert result rows and their error rows into database."""
+        conn.executemany('''
         INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            result.id,
-            result.task_id,
-            result.agent_id,
-            result.status.value if hasattr(result.status, 'value') else str(result.status),
-            result.performance_metrics.execution_time,
-            result.resource_usage.cpu_percent,
-            result.resource_usage.memory_mb,
-            result.created_at.isoformat(),
-            result.completed_at.isoformat() if result.completed_at else None
-        ))
+        ''', result_rows)
         
         # Insert errors
-        for error in result.errors:
-            cursor.execute('''
-            INSERT INTO errors (result_id, error_text) VALUES (?, ?)
-            ''', (result.id, error))
+        conn.executemany('''
+        INSERT INTO errors (result_id, error_text) VALUES (?, ?)
+        ''', error_rows)
     
-    def _insert_metrics(self, cursor: sqlite3.Cursor, benchmark: Benchmark) -> None:
+    def _insert_metrics(self, conn: sqlite3.Connection, benchmark: Benchmark) -> None:
         """Insert benchmark metrics into database."""
         metrics = [
             ("total_tasks", benchmark.metrics.total_tasks),
@@ -323,10 +572,9 @@ class SQLiteOutputHandler(OutputHandler):
             ("total_cpu_time", benchmark.metrics.total_cpu_time)
         ]
         
-        for name, value in metrics:
-            cursor.execute('''
-            INSERT INTO metrics (benchmark_id, metric_name, metric_value) VALUES (?, ?, ?)
-            ''', (benchmark.id, name, value))
+        conn.executemany('''
+        INSERT INTO metrics (benchmark_id, metric_name, metric_value) VALUES (?, ?, ?)
+        ''', [(benchmark.id, name, value) for name, value in metrics])
 
 
 class CSVOutputHandler(OutputHandler):
@@ -344,58 +592,86 @@ class CSVOutputHandler(OutputHandler):
         Returns:
             Path to the saved CSV directory
         """
-        # Ensure the output directory exists
         csv_dir = output_dir / f"benchmark_{benchmark.id}"
-        csv_dir.mkdir(exist_ok=True, parents=True)
-        
-        # Write CSV files in a thread pool
-        async def write_csv_files():
-            # Write benchmark summary
-            with open(csv_dir / "benchmark.csv", "w") as f:
-                f.write("id,name,description,status,created_at,started_at,completed_at,duration,strategy,mode\n")
-                f.write(f"{benchmark.id},{benchmark.name},{benchmark.description},{benchmark.status.value if hasattr(benchmark.status, 'value') else benchmark.status},{benchmark.created_at.isoformat()},{benchmark.started_at.isoformat() if benchmark.started_at else ''},{benchmark.completed_at.isoformat() if benchmark.completed_at else ''},{benchmark.duration()},{benchmark.config.strategy.value if hasattr(benchmark.config.strategy, 'value') else benchmark.config.strategy},{benchmark.config.mode.value if hasattr(benchmark.config.mode, 'value') else benchmark.config.mode}\n")
-            
-            # Write metrics
-            with open(csv_dir / "metrics.csv", "w") as f:
-                f.write("benchmark_id,metric_name,metric_value\n")
-                metrics = [
-                    ("total_tasks", benchmark.metrics.total_tasks),
-                    ("completed_tasks", benchmark.metrics.completed_tasks),
-                    ("failed_tasks", benchmark.metrics.failed_tasks),
-                    ("success_rate", benchmark.metrics.success_rate),
-                    ("average_execution_time", benchmark.metrics.average_execution_time),
-                    ("total_execution_time", benchmark.metrics.total_execution_time),
-                    ("throughput", benchmark.metrics.throughput),
-                    ("quality_score", benchmark.metrics.quality_score),
-                    ("peak_memory_usage", benchmark.metrics.peak_memory_usage)
-                ]
-                for name, value in metrics:
-                    f.write(f"{benchmark.id},{name},{value}\n")
-            
-            # Write tasks
-            with open(csv_dir / "tasks.csv", "w") as f:
-                f.write("id,benchmark_id,objective,strategy,status,duration\n")
-                for task in benchmark.tasks:
-                    f.write(f"{task.id},{benchmark.id},{task.objective},{task.strategy.value if hasattr(task.strategy, 'value') else task.strategy},{task.status.value if hasattr(task.status, 'value') else task.status},{task.duration() or ''}\n")
-            
-            # Write results
-            with open(csv_dir / "results.csv", "w") as f:
-                f.write("id,task_id,agent_id,status,execution_time,cpu_percent,memory_mb\n")
-                for result in benchmark.results:
-                    f.write(f"{result.id},{result.task_id},{result.agent_id},{result.status.value if hasattr(result.status, 'value') else result.status},{result.performance_metrics.execution_time},{result.resource_usage.cpu_percent},{result.resource_usage.memory_mb}\n")
-            
-            # Write errors
-            with open(csv_dir / "errors.csv", "w") as f:
-                f.write("result_id,error_text\n")
-                for result in benchmark.results:
-                    for error in result.errors:
-                        # Escape commas and quotes in error text
-                        error_text = error.replace('"', '""')
-                        f.write(f"{result.id},\"{error_text}\"\n")
+        loop = asyncio.get_running_loop()
+        tables = self._csv_tables(benchmark)
+        
+        def write_tables(tables):
+            # Ensure the output directory exists
+            csv_dir.mkdir(exist_ok=True, parents=True)
+            for filename, header, rows in tables:
+                _write_csv(csv_dir / filename, header, rows)
         
-        await asyncio.get_event_loop().run_in_executor(None, write_csv_files)
+        if len(benchmark.tasks) + len(benchmark.results) <= _SMALL_CSV_ROWS:
+            # Small outputs take a few ms to write; one worker hop is enough
+            await loop.run_in_executor(self.executor, write_tables, tables)
+        else:
+            # The files are independent, so each is written on its own worker thread
+            await asyncio.gather(*(
+                loop.run_in_executor(self.executor, write_tables, [table])
+                for table in tables
+            ))
         
         return csv_dir
+    
+    def _csv_tables(self, benchmark: Benchmark) -> List[tuple]:
+        """Return (filename, header, rows) for each CSV file of a benchmark.
+        
+        Row lists are shared with the other handlers through the view and
+        are built by the first thread that needs them.
+        """
+        view = _benchmark_view(benchmark)
+        metrics = [
+            ("total_tasks", benchmark.metrics.total_tasks),
+            ("completed_tasks", benchmark.metrics.completed_tasks),
+            ("failed_tasks", benchmark.metrics.failed_tasks),
+            ("success_rate", benchmark.metrics.success_rate),
+            ("average_execution_time", benchmark.metrics.average_execution_time),
+            ("total_execution_time", benchmark.metrics.total_execution_time),
+            ("throughput", benchmark.metrics.throughput),
+            ("quality_score", benchmark.metrics.quality_score),
+            ("peak_memory_usage", benchmark.metrics.peak_memory_usage)
+        ]
+        return [
+            (
+                "benchmark.csv",
+                ["id", "name", "description", "status", "created_at", "started_at", "completed_at", "duration", "strategy", "mode"],
+                [(
+                    benchmark.id,
+                    benchmark.name,
+                    benchmark.description,
+                    view.status,
+                    view.created_at,
+                    view.started_at or "",
+                    view.completed_at or "",
+                    view.duration,
+                    view.strategy,
+                    view.mode
+                )]
+            ),
+            (
+                "metrics.csv",
+                ["benchmark_id", "metric_name", "metric_value"],
+                ((benchmark.id, name, value) for name, value in metrics)
+            ),
+            (
+                "tasks.csv",
+                ["id", "benchmark_id", "objective", "strategy", "status", "duration"],
+                # csv writes None as an empty field
+                _shared_rows(view, "task_rows")
+            ),
+            (
+                "results.csv",
+                ["id", "task_id", "agent_id", "status", "execution_time", "cpu_percent", "memory_mb"],
+                (row[:7] for row in _shared_rows(view, "result_rows"))
+            ),
+            (
+                # csv quotes commas, quotes and newlines in the error text
+                "errors.csv",
+                ["result_id", "error_text"],
+                _shared_rows(view, "error_rows")
+            ),
+        ]
 
 
 class OutputManager:
@@ -403,11 +679,14 @@ class OutputManager:
     
     def __init__(self):
         """Initialize the output manager."""
-        self.handlers = {
-            "json": JSONOutputHandler(),
-            "sqlite": SQLiteOutputHandler(),
-            "csv": CSVOutputHandler()
-        }
+        # Output I/O gets its own small pool instead of the loop's default;
+        # close() releases it and the next save starts a new one
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        self.handlers: Dict[str, OutputHandler] = {}
+        self._start_executor()
+        self.register_handler("json", JSONOutputHandler())
+        self.register_handler("sqlite", SQLiteOutputHandler())
+        self.register_handler("csv", CSVOutputHandler())
     
     async def save_benchmark(
         self, 
@@ -427,15 +706,20 @@ class OutputManager:
         """
         # Default to JSON if no formats specified
         formats = formats or ["json"]
+        self._start_executor()
         
-        # Run all handlers concurrently
+        # Run all handlers concurrently; each task inherits the shared view
         tasks = []
-        for fmt in formats:
-            if fmt in self.handlers:
-                task = asyncio.create_task(
-                    self.handlers[fmt].save_benchmark(benchmark, output_dir)
-                )
-                tasks.append((fmt, task))
+        token = _current_view.set(_BenchmarkView.of(benchmark))
+        try:
+            for fmt in formats:
+                if fmt in self.handlers:
+                    task = asyncio.create_task(
+                        self.handlers[fmt].save_benchmark(benchmark, output_dir)
+                    )
+                    tasks.append((fmt, task))
+        finally:
+            _current_view.reset(token)
         
         # Wait for all handlers to complete
         results = {}
@@ -454,4 +738,29 @@ class OutputManager:
             format_name: Format name (e.g., "json", "sqlite")
             handler: Handler instance
         """
-        self.handlers[format_name] = handler
\ No newline at end of file
+        handler.executor = self._io_executor
+        self.handlers[format_name] = handler
+    
+    def _start_executor(self) -> None:
+        """Create the output pool if it is not running and hand it to the handlers."""
+        if self._io_executor is not None:
+            return
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=_OUTPUT_WORKERS, thread_name_prefix="flowx-output"
+        )
+        for handler in self.handlers.values():
+            handler.executor = self._io_executor
+    
+    def close(self) -> None:
+        """Close handler resources and wait for pending output writes.
+        
+        This blocks, so async callers should run it on a thread. The
+        manager stays usable; a later save starts new workers.
+        """
+        for handler in self.handlers.values():
+            close = getattr(handler, "close", None)
+            if close is not None:
+                close()
+        if self._io_executor is not None:
+            self._io_executor.shutdown(wait=True)
+            self._io_executor = None
\ No newline at end of file
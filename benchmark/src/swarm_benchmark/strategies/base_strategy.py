@@ -8,6 +8,10 @@ from swarm_benchmark.core.models import Task, Result
 class BaseStrategy(ABC):
     """Abstract base class for all swarm strategies."""
     
+    # Strategies whose execute() is CPU-bound set this so the engine runs
+    # them in a worker process instead of on the event loop
+    cpu_bound: bool = False
+    
     def __init__(self):
         """Initialize the base strategy."""
         self.execution_count = 0
@@ -3,9 +3,10 @@
 import traceback
 import sys
 import logging
-import asyncio
+import time
 from typing import Dict, Any, Optional, Callable, TypeVar, Tuple, List, Union
-from functools import wraps
+from collections import Counter
+from functools import cached_property, wraps
 
 # Set up logging
 logger = logging.getLogger("benchmark")
@@ -27,14 +28,16 @@ class BenchmarkError(Exception):
         """
         self.message = message
         self.cause = cause
-        self.traceback = None
-        
-        if cause:
-            self.traceback = traceback.format_exception(
-                type(cause), cause, cause.__traceback__
-            )
-        
         super().__init__(message)
+    
+    @cached_property
+    def traceback(self) -> Optional[List[str]]:
+        """Formatted traceback of the cause, computed on first access."""
+        if self.cause is None:
+            return None
+        return traceback.format_exception(
+            type(self.cause), self.cause, self.cause.__traceback__
+        )
 
 
 class ConfigurationError(BenchmarkError):
@@ -87,20 +90,21 @@ class ErrorContext:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Handle exceptions in the context."""
         if exc_type is not None:
+            # Already wrapped by an inner context, which logged the traceback
+            if isinstance(exc_val, BenchmarkError):
+                logger.debug(f"Error in {self.context_name}: {exc_val}")
+                return False  # Re-raise the exception
+            
             # Log the error
             logger.error(
                 f"Error in {self.context_name}: {exc_val}",
                 exc_info=(exc_type, exc_val, exc_tb)
             )
             
-            # If it's not already a BenchmarkError, wrap it
-            if not isinstance(exc_val, BenchmarkError):
-                raise self.error_class(
-                    f"Error in {self.context_name}: {str(exc_val)}",
-                    cause=exc_val
-                ) from exc_val
-                
-            return False  # Re-raise the exception
+            raise self.error_class(
+                f"Error in {self.context_name}: {str(exc_val)}",
+                cause=exc_val
+            ) from exc_val
         return True
 
 
@@ -124,20 +128,21 @@ class AsyncErrorContext:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Handle exceptions in the context."""
         if exc_type is not None:
+            # Already wrapped by an inner context, which logged the traceback
+            if isinstance(exc_val, BenchmarkError):
+                logger.debug(f"Error in {self.context_name}: {exc_val}")
+                return False  # Re-raise the exception
+            
             # Log the error
             logger.error(
                 f"Error in {self.context_name}: {exc_val}",
                 exc_info=(exc_type, exc_val, exc_tb)
             )
             
-            # If it's not already a BenchmarkError, wrap it
-            if not isinstance(exc_val, BenchmarkError):
-                raise self.error_class(
-                    f"Error in {self.context_name}: {str(exc_val)}",
-                    cause=exc_val
-                ) from exc_val
-                
-            return False  # Re-raise the exception
+            raise self.error_class(
+                f"Error in {self.context_name}: {str(exc_val)}",
+                cause=exc_val
+            ) from exc_val
         return True
 
 
@@ -176,11 +181,20 @@ def with_async_error_handling(error_class=BenchmarkError, context: Optional[str]
 
 
 class ErrorReporter:
-    """Utility for reporting and aggregating errors."""
+    """Utility for reporting and aggregating errors.
+    
+    Besides the per-error dictionaries in ``errors``, the reporter keeps
+    ``messages`` and ``severities`` as parallel columns, so counting and
+    filtering by severity never touches the dictionaries.
+    """
     
     def __init__(self):
         """Initialize error reporter."""
         self.errors: List[Dict[str, Any]] = []
+        self.messages: List[str] = []
+        self.severities: List[str] = []
+        # Exception entries whose traceback has not been formatted yet
+        self._pending_tracebacks: List[Tuple[Dict[str, Any], BaseException]] = []
     
     def report_error(
         self, 
@@ -199,21 +213,23 @@ class ErrorReporter:
         """
         error_info = {
             "message": message,
-            "timestamp": asyncio.get_event_loop().time(),
+            "timestamp": time.monotonic(),
             "context": context or "unknown",
             "severity": severity
         }
         
         if exception:
+            # The traceback is formatted on first read (see get_errors)
             error_info["exception"] = {
                 "type": type(exception).__name__,
                 "message": str(exception),
-                "traceback": traceback.format_exception(
-                    type(exception), exception, exception.__traceback__
-                ) if hasattr(exception, "__traceback__") else None
+                "traceback": None
             }
+            self._pending_tracebacks.append((error_info["exception"], exception))
             
         self.errors.append(error_info)
+        self.messages.append(message)
+        self.severities.append(severity)
         
         # Log the error
         log_func = getattr(logger, severity, logger.error)
@@ -228,13 +244,26 @@ class ErrorReporter:
         Returns:
             List of error information dictionaries
         """
+        if self._pending_tracebacks:
+            self._format_tracebacks()
         if severity:
-            return [e for e in self.errors if e["severity"] == severity]
+            return [e for e, s in zip(self.errors, self.severities) if s == severity]
         return self.errors
     
+    def _format_tracebacks(self) -> None:
+        """Format the tracebacks of exceptions reported since the last read."""
+        for exception_info, exception in self._pending_tracebacks:
+            exception_info["traceback"] = traceback.format_exception(
+                type(exception), exception, exception.__traceback__
+            )
+        self._pending_tracebacks = []
+    
     def clear(self) -> None:
         """Clear all reported errors."""
         self.errors = []
+        self.messages = []
+        self.severities = []
+        self._pending_tracebacks = []
     
     def has_errors(self, severity: Optional[str] = None) -> bool:
         """Check if there are any reported errors.
@@ -245,7 +274,9 @@ class ErrorReporter:
         Returns:
             True if there are errors, False otherwise
         """
-        return len(self.get_errors(severity)) > 0
+        if severity:
+            return severity in self.severities
+        return bool(self.errors)
     
     def get_summary(self) -> Dict[str, int]:
         """Get error summary counts by severity.
@@ -253,11 +284,7 @@ class ErrorReporter:
         Returns:
             Dictionary of severity to count
         """
-        summary = {}
-        for error in self.errors:
-            severity = error["severity"]
-            summary[severity] = summary.get(severity, 0) + 1
-        return summary
+        return dict(Counter(self.severities))
 
 
 def safe_execute(func: Callable[..., T], *args, **kwargs) -> Tuple[bool, Optional[T], Optional[Exception]]:
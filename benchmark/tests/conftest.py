@@ -0,0 +1,16 @@
+"""Shared pytest configuration for the benchmark test suite."""
+
+import asyncio
+import sys
+
+# Run the async tests on uvloop when it is installed; every loop the tests
+# create (asyncio.run, new_event_loop, IsolatedAsyncioTestCase) goes through
+# the policy. Without uvloop the default asyncio loop is used.
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -2,32 +2,103 @@
 
 import unittest
 import asyncio
+import copy
+import json
+import os
 from unittest.mock import patch, MagicMock, AsyncMock
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 
+from swarm_benchmark.core import unified_benchmark_engine
 from swarm_benchmark.core.unified_benchmark_engine import (
     UnifiedBenchmarkEngine, EnginePlugin, OptimizationPlugin, MetricsCollectionPlugin
 )
 from swarm_benchmark.core.models import (
-    BenchmarkConfig, Task, Result, StrategyType, CoordinationMode,
+    Benchmark, BenchmarkConfig, Task, Result, StrategyType, CoordinationMode,
     TaskStatus, ResultStatus
 )
+from swarm_benchmark.strategies import BaseStrategy
+
+
+# Built once at import; tests that run them work on copies
+PARALLEL_TASKS = tuple(Task(objective=f"Task {i}") for i in range(3))
+
+
+def fast_async_return(value):
+    """Build a coroutine function returning value that counts its awaits.
+    
+    A lighter stand-in for AsyncMock(return_value=value) when only the
+    await count is checked.
+    """
+    async def hook(*args, **kwargs):
+        hook.await_count += 1
+        return value
+    hook.await_count = 0
+    return hook
+
+
+class WorkerPidStrategy(BaseStrategy):
+    """CPU-bound strategy reporting the process it ran in.
+    
+    Defined at module level so it can be pickled into a worker process.
+    """
+    
+    cpu_bound = True
+    name = "worker-pid"
+    description = "Reports the pid of the executing process"
+    
+    async def execute(self, task):
+        return Result(task_id=task.id, status=ResultStatus.SUCCESS, output={"pid": os.getpid()})
+    
+    def get_metrics(self):
+        return {}
+
+
+def make_plugin(post_task_result):
+    """Build a plugin stub whose hooks are AsyncMocks.
+    
+    A bare MagicMock with the hooks assigned is much cheaper to build than
+    MagicMock(spec=EnginePlugin), which introspects every spec attribute.
+    """
+    plugin = MagicMock()
+    plugin.pre_benchmark = AsyncMock()
+    plugin.post_benchmark = AsyncMock()
+    plugin.pre_task = AsyncMock()
+    plugin.post_task = fast_async_return(post_task_result)
+    return plugin
 
 
 class TestUnifiedBenchmarkEngine(unittest.TestCase):
     """Tests for the UnifiedBenchmarkEngine class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.config = BenchmarkConfig(
+    @classmethod
+    def setUpClass(cls):
+        """Create the event loop and base config shared by the class."""
+        cls.loop = asyncio.new_event_loop()
+        # Patched once for the class; setUp resets the mock between tests
+        cls.strategy_patcher = patch.object(unified_benchmark_engine, "create_strategy")
+        cls.mock_create_strategy = cls.strategy_patcher.start()
+        cls.base_config = BenchmarkConfig(
             name="Test Benchmark",
             strategy=StrategyType.AUTO,
             mode=CoordinationMode.CENTRALIZED,
             max_agents=3,
             output_formats=["json"]
         )
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the class-wide patch and close the shared event loop."""
+        cls.strategy_patcher.stop()
+        cls.loop.close()
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        # Tests change scalar config fields, so each engine gets its own copy
+        self.config = copy.copy(self.base_config)
         self.engine = UnifiedBenchmarkEngine(self.config)
+        self.mock_create_strategy.reset_mock(return_value=True, side_effect=True)
     
     def test_initialization(self):
         """Test engine initialization."""
@@ -48,7 +119,25 @@ class TestUnifiedBenchmarkEngine(unittest.TestCase):
         self.assertEqual(len(self.engine.plugins), 2)
         self.assertIs(self.engine.plugins[0], plugin1)
         self.assertIs(self.engine.plugins[1], plugin2)
-    
+
+    def test_add_plugin_skips_inherited_hooks(self):
+        """Test that only overridden hooks are dispatched."""
+        class PreTaskOnlyPlugin(EnginePlugin):
+            async def pre_task(self, task):
+                pass
+
+        plugin = PreTaskOnlyPlugin()
+        self.engine.add_plugin(EnginePlugin())
+        self.engine.add_plugin(plugin)
+
+        self.assertEqual(
+            self.engine._pre_task_hooks,
+            [("PreTaskOnlyPlugin.pre_task", plugin.pre_task)]
+        )
+        self.assertEqual(self.engine._post_task_hooks, [])
+        self.assertEqual(self.engine._pre_benchmark_hooks, [])
+        self.assertEqual(self.engine._post_benchmark_hooks, [])
+
     def test_submit_task(self):
         """Test task submission."""
         task = Task(objective="Test task")
@@ -57,16 +146,15 @@ class TestUnifiedBenchmarkEngine(unittest.TestCase):
         self.assertEqual(len(self.engine.task_queue), 1)
         self.assertEqual(self.engine.task_queue[0].objective, "Test task")
     
-    @patch('swarm_benchmark.core.unified_benchmark_engine.create_strategy')
     @patch('swarm_benchmark.core.unified_benchmark_engine.OutputManager')
-    def test_run_benchmark_success(self, mock_output_manager, mock_create_strategy):
+    def test_run_benchmark_success(self, mock_output_manager):
         """Test successful benchmark execution."""
         # Create mocks
         mock_strategy = AsyncMock()
         mock_result = MagicMock()
         mock_result.status = ResultStatus.SUCCESS
         mock_strategy.execute.return_value = mock_result
-        mock_create_strategy.return_value = mock_strategy
+        self.mock_create_strategy.return_value = mock_strategy
         
         # Mock output manager
         mock_output = MagicMock()
@@ -74,11 +162,7 @@ class TestUnifiedBenchmarkEngine(unittest.TestCase):
         mock_output_manager.return_value = mock_output
         
         # Run test
-        async def run_test():
-            result = await self.engine.run_benchmark("Test objective")
-            return result
-        
-        result = asyncio.run(run_test())
+        result = self.loop.run_until_complete(self.engine.run_benchmark("Test objective"))
         
         # Verify result
         self.assertEqual(result["status"], "success")
@@ -86,85 +170,62 @@ class TestUnifiedBenchmarkEngine(unittest.TestCase):
         self.assertIn("duration", result)
         
         # Verify strategy was called
-        mock_create_strategy.assert_called_once()
-        mock_strategy.execute.assert_called_once()
-        mock_output.save_benchmark.assert_awaited_once()
+        self.assertEqual(self.mock_create_strategy.call_count, 1)
+        self.assertEqual(mock_strategy.execute.call_count, 1)
+        self.assertEqual(mock_output.save_benchmark.await_count, 1)
     
-    @patch('swarm_benchmark.core.unified_benchmark_engine.create_strategy')
-    def test_run_benchmark_with_plugins(self, mock_create_strategy):
+    def test_run_benchmark_with_plugins(self):
         """Test benchmark execution with plugins."""
         # Create mocks
         mock_strategy = AsyncMock()
         mock_result = MagicMock()
         mock_result.status = ResultStatus.SUCCESS
         mock_strategy.execute.return_value = mock_result
-        mock_create_strategy.return_value = mock_strategy
+        self.mock_create_strategy.return_value = mock_strategy
         
         # Create plugins
-        plugin1 = MagicMock(spec=EnginePlugin)
-        plugin1.pre_benchmark = AsyncMock()
-        plugin1.post_benchmark = AsyncMock()
-        plugin1.pre_task = AsyncMock()
-        plugin1.post_task = AsyncMock(return_value=mock_result)
-        
-        plugin2 = MagicMock(spec=EnginePlugin)
-        plugin2.pre_benchmark = AsyncMock()
-        plugin2.post_benchmark = AsyncMock()
-        plugin2.pre_task = AsyncMock()
-        plugin2.post_task = AsyncMock(return_value=mock_result)
+        plugin1 = make_plugin(mock_result)
+        plugin2 = make_plugin(mock_result)
         
         # Add plugins to engine
         self.engine.add_plugin(plugin1)
         self.engine.add_plugin(plugin2)
         
         # Run test
-        async def run_test():
-            result = await self.engine.run_benchmark("Test with plugins")
-            return result
-        
-        result = asyncio.run(run_test())
+        result = self.loop.run_until_complete(self.engine.run_benchmark("Test with plugins"))
         
         # Verify result
         self.assertEqual(result["status"], "success")
         
-        # Verify plugins were called
-        plugin1.pre_benchmark.assert_awaited_once()
-        plugin1.post_benchmark.assert_awaited_once()
-        plugin1.pre_task.assert_awaited_once()
-        plugin1.post_task.assert_awaited_once()
-        
-        plugin2.pre_benchmark.assert_awaited_once()
-        plugin2.post_benchmark.assert_awaited_once()
-        plugin2.pre_task.assert_awaited_once()
-        plugin2.post_task.assert_awaited_once()
+        # Verify every hook of both plugins was awaited exactly once
+        hooks = [
+            getattr(plugin, name)
+            for plugin in (plugin1, plugin2)
+            for name in ("pre_benchmark", "post_benchmark", "pre_task", "post_task")
+        ]
+        self.assertEqual([hook.await_count for hook in hooks], [1] * 8)
     
-    @patch('swarm_benchmark.core.unified_benchmark_engine.create_strategy')
-    def test_run_benchmark_failure(self, mock_create_strategy):
+    def test_run_benchmark_failure(self):
         """Test benchmark execution with failure."""
         # Mock strategy to raise exception
-        mock_create_strategy.side_effect = Exception("Strategy failed")
+        self.mock_create_strategy.side_effect = Exception("Strategy failed")
         
         # Run test
-        async def run_test():
-            result = await self.engine.run_benchmark("Test failure")
-            return result
-        
-        result = asyncio.run(run_test())
+        result = self.loop.run_until_complete(self.engine.run_benchmark("Test failure"))
         
         # Verify result indicates failure
         self.assertEqual(result["status"], "failed")
         self.assertIn("error", result)
         self.assertEqual(result["error"], "Strategy failed")
     
-    @patch('swarm_benchmark.core.unified_benchmark_engine.create_strategy')
-    def test_execute_task(self, mock_create_strategy):
+    def test_execute_task(self):
         """Test individual task execution."""
         # Create mocks
         mock_strategy = AsyncMock()
         mock_result = MagicMock()
         mock_result.status = ResultStatus.SUCCESS
         mock_strategy.execute.return_value = mock_result
-        mock_create_strategy.return_value = mock_strategy
+        self.mock_create_strategy.return_value = mock_strategy
         
         # Create task
         task = Task(
@@ -173,11 +234,7 @@ class TestUnifiedBenchmarkEngine(unittest.TestCase):
         )
         
         # Run test
-        async def run_test():
-            result = await self.engine._execute_task(task)
-            return result
-        
-        result = asyncio.run(run_test())
+        result = self.loop.run_until_complete(self.engine._execute_task(task))
         
         # Verify task status was updated
         self.assertEqual(task.status, TaskStatus.COMPLETED)
@@ -186,13 +243,12 @@ class TestUnifiedBenchmarkEngine(unittest.TestCase):
         
         # Verify result
         self.assertEqual(result.status, ResultStatus.SUCCESS)
-        mock_strategy.execute.assert_called_once()
+        self.assertEqual(mock_strategy.execute.call_count, 1)
     
-    @patch('swarm_benchmark.core.unified_benchmark_engine.create_strategy')
-    def test_execute_task_failure(self, mock_create_strategy):
+    def test_execute_task_failure(self):
         """Test task execution with failure."""
         # Mock strategy to raise exception
-        mock_create_strategy.side_effect = Exception("Task failed")
+        self.mock_create_strategy.side_effect = Exception("Task failed")
         
         # Create task
         task = Task(
@@ -201,11 +257,7 @@ class TestUnifiedBenchmarkEngine(unittest.TestCase):
         )
         
         # Run test
-        async def run_test():
-            result = await self.engine._execute_task(task)
-            return result
-        
-        result = asyncio.run(run_test())
+        result = self.loop.run_until_complete(self.engine._execute_task(task))
         
         # Verify task status was updated to FAILED
         self.assertEqual(task.status, TaskStatus.FAILED)
@@ -215,45 +267,162 @@ class TestUnifiedBenchmarkEngine(unittest.TestCase):
         self.assertEqual(len(result.errors), 1)
         self.assertEqual(result.errors[0], "Task failed")
     
-    @patch('swarm_benchmark.core.unified_benchmark_engine.create_strategy')
-    def test_execute_parallel_tasks(self, mock_create_strategy):
+    def test_execute_task_hook_timeout(self):
+        """Test that a slow plugin hook is abandoned and reported."""
+        mock_strategy = AsyncMock()
+        mock_strategy.execute.return_value = Result(status=ResultStatus.SUCCESS)
+        self.mock_create_strategy.return_value = mock_strategy
+
+        class SlowPlugin(EnginePlugin):
+            async def pre_task(self, task):
+                await asyncio.sleep(1)
+
+        self.engine.plugin_hook_timeout = 0.01
+        self.engine.add_plugin(SlowPlugin())
+        task = Task(objective="Slow hook task")
+
+        result = self.loop.run_until_complete(self.engine._execute_task(task))
+
+        self.assertEqual(task.status, TaskStatus.COMPLETED)
+        self.assertEqual(result.errors, ["SlowPlugin.pre_task timeout"])
+
+    def test_execute_parallel_tasks(self):
         """Test parallel task execution."""
         # Create mocks
         mock_strategy = AsyncMock()
         
         def create_result(task_id):
-            result = MagicMock()
-            result.task_id = task_id
-            result.status = ResultStatus.SUCCESS
-            return result
-            
-        mock_strategy.execute.side_effect = lambda task: asyncio.sleep(0.1).then(
-            lambda _: create_result(task.id)
-        )
-        mock_create_strategy.return_value = mock_strategy
+            return SimpleNamespace(task_id=task_id, status=ResultStatus.SUCCESS)
         
-        # Create tasks
-        tasks = [
-            Task(objective=f"Task {i}") for i in range(3)
-        ]
+        async def execute(task):
+            await asyncio.sleep(0)
+            return create_result(task.id)
+        
+        mock_strategy.execute.side_effect = execute
+        self.mock_create_strategy.return_value = mock_strategy
+        
+        # Copy the prebuilt tasks; the engine updates their status
+        tasks = [copy.copy(task) for task in PARALLEL_TASKS]
         
         # Configure engine for parallel execution
         self.engine.config.parallel = True
         self.engine.config.max_agents = 3
         
-        # Run test
-        async def run_test():
-            results = await self.engine._execute_parallel_tasks(tasks)
-            return results
-        
-        results = asyncio.run(run_test())
+        # Run test; eager tasks (Python 3.12+) start inline instead of
+        # waiting a loop iteration each
+        if hasattr(asyncio, "eager_task_factory"):
+            self.loop.set_task_factory(asyncio.eager_task_factory)
+        try:
+            results = self.loop.run_until_complete(self.engine._execute_parallel_tasks(tasks))
+        finally:
+            self.loop.set_task_factory(None)
         
         # Verify results
         self.assertEqual(len(results), 3)
+        self.assertEqual([result.task_id for result in results], [task.id for task in tasks])
         
         # Verify strategy was called for each task
         self.assertEqual(mock_strategy.execute.call_count, 3)
     
+    def test_cpu_bound_strategy_runs_in_worker_process(self):
+        """Test that CPU-bound strategies run in the process pool, released by shutdown."""
+        task = Task(objective="Report pid")
+        
+        result = self.loop.run_until_complete(
+            self.engine._execute_in_process(WorkerPidStrategy(), task)
+        )
+        self.assertEqual(result.task_id, task.id)
+        self.assertNotEqual(result.output["pid"], os.getpid())
+        
+        executor = self.engine._cpu_executor
+        self.loop.run_until_complete(self.engine.shutdown())
+        self.assertIsNone(self.engine._cpu_executor)
+        with self.assertRaises(RuntimeError):
+            executor.submit(os.getpid)
+    
+    def test_save_benchmark_results_deduplicates(self):
+        """Test that an identical outcome is saved as a pointer file."""
+        def make_benchmark():
+            benchmark = Benchmark(name="Dedup")
+            benchmark.add_task(Task(objective="Same objective"))
+            benchmark.results.append(Result(status=ResultStatus.SUCCESS, output={"answer": 42}))
+            return benchmark
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.engine.config.output_directory = temp_dir
+            self.engine.config.deduplicate_output = True
+            self.engine.output_manager.save_benchmark = AsyncMock(return_value={"json": Path(temp_dir)})
+
+            first, second = make_benchmark(), make_benchmark()
+            self.loop.run_until_complete(self.engine._save_benchmark_results(first))
+            self.loop.run_until_complete(self.engine._save_benchmark_results(second))
+
+            self.assertEqual(self.engine.output_manager.save_benchmark.await_count, 1)
+            self.assertEqual(second.metadata["duplicate_of"], first.id)
+            ref_file = Path(temp_dir) / f"benchmark_{second.id}.ref"
+            self.assertEqual(ref_file.read_text().strip(), first.id)
+
+    def test_failed_save_is_not_deduplicated_against(self):
+        """Test that a run whose save failed never becomes the canonical copy."""
+        def make_benchmark():
+            benchmark = Benchmark(name="Dedup")
+            benchmark.add_task(Task(objective="Same objective"))
+            benchmark.results.append(Result(status=ResultStatus.SUCCESS, output={"answer": 42}))
+            return benchmark
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.engine.config.output_directory = temp_dir
+            self.engine.config.deduplicate_output = True
+            # Raises, then loses the only format, then saves in full
+            self.engine.output_manager.save_benchmark = AsyncMock(
+                side_effect=[OSError("disk full"), {}, {"json": Path(temp_dir)}, {"json": Path(temp_dir)}]
+            )
+
+            runs = [make_benchmark() for _ in range(4)]
+            with self.assertRaises(OSError):
+                self.loop.run_until_complete(self.engine._save_benchmark_results(runs[0]))
+            for benchmark in runs[1:]:
+                self.loop.run_until_complete(self.engine._save_benchmark_results(benchmark))
+
+            self.assertEqual(self.engine.output_manager.save_benchmark.await_count, 3)
+            self.assertNotIn("duplicate_of", runs[2].metadata)
+            self.assertEqual(runs[3].metadata["duplicate_of"], runs[2].id)
+            manifest = (Path(temp_dir) / ".manifest.txt").read_text().split()
+            self.assertEqual(manifest[1:], [runs[2].id])
+
+    def test_output_fingerprint_includes_measurements(self):
+        """Test that runs with different timings or resource usage are not deduplicated."""
+        def make_benchmark(execution_time, peak_memory_mb):
+            benchmark = Benchmark(name="Dedup")
+            benchmark.add_task(Task(objective="Same objective"))
+            result = Result(status=ResultStatus.SUCCESS, output={"answer": 42})
+            result.performance_metrics.execution_time = execution_time
+            result.resource_usage.peak_memory_mb = peak_memory_mb
+            benchmark.results.append(result)
+            return benchmark
+
+        fingerprint = self.engine._output_fingerprint
+        baseline = fingerprint(make_benchmark(1.0, 10.0))
+        self.assertEqual(fingerprint(make_benchmark(1.0, 10.0)), baseline)
+        self.assertNotEqual(fingerprint(make_benchmark(2.0, 10.0)), baseline)
+        self.assertNotEqual(fingerprint(make_benchmark(1.0, 20.0)), baseline)
+
+    def test_record_output_is_serialized(self):
+        """Test that concurrent saves of one outcome record a single canonical id."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(
+                    lambda i: self.engine._record_output(output_dir, "same", f"id{i}"), range(32)
+                ))
+
+            lines = (output_dir / ".manifest.txt").read_text().splitlines()
+            self.assertEqual(len(lines), 1)
+            canonical_id = lines[0].split()[1]
+            self.assertEqual(self.engine._find_duplicate_output(output_dir, "same", "later"), canonical_id)
+
     def test_result_to_dict(self):
         """Test result to dictionary conversion."""
         # Create test result
@@ -277,10 +446,83 @@ class TestUnifiedBenchmarkEngine(unittest.TestCase):
         self.assertEqual(result_dict["warnings"], ["Test warning"])
         self.assertIn("output_summary", result_dict)
 
+    def test_benchmark_response_results_are_lazy(self):
+        """Test that result dictionaries are built on first access."""
+        benchmark = Benchmark(name="Lazy")
+        benchmark.results.append(Result(task_id="task1", status=ResultStatus.SUCCESS))
+
+        with patch.object(self.engine, "_result_to_dict", wraps=self.engine._result_to_dict) as convert:
+            response = self.engine._create_benchmark_response(benchmark)
+            self.assertEqual(response["summary"], "Completed 1 tasks")
+            self.assertIn("results", response)
+            convert.assert_not_called()
+
+            self.assertEqual(response["results"][0]["task_id"], "task1")
+            self.assertEqual(json.loads(json.dumps(response.to_dict()))["results"][0]["task_id"], "task1")
+            self.assertEqual(convert.call_count, 1)
+
+    def test_benchmark_response_json_round_trip(self):
+        """Test that to_dict() round-trips through JSON and results stay pending until read."""
+        benchmark = Benchmark(name="Lazy")
+        benchmark.results.append(Result(task_id="task1", status=ResultStatus.SUCCESS))
+        response = self.engine._create_benchmark_response(benchmark)
+
+        self.assertEqual(response["name"], "Lazy")
+        self.assertIsNotNone(response._pending)
+        self.assertIsNotNone(response["results"])
+        self.assertIsNone(response._pending)
+
+        response = self.engine._create_benchmark_response(benchmark)
+        plain = response.to_dict()
+        self.assertIs(type(plain), dict)
+        self.assertEqual(json.loads(json.dumps(plain)), plain)
+
+    def test_run_benchmark_failure_returns_response(self):
+        """Test that the failure path returns the same response type as success."""
+        self.engine._save_benchmark_results = AsyncMock(side_effect=OSError("disk full"))
+
+        response = self.loop.run_until_complete(self.engine.run_benchmark("Test failure"))
+
+        self.assertIsInstance(response, unified_benchmark_engine.BenchmarkResponse)
+        self.assertEqual(response["status"], "failed")
+        self.assertNotIn("results", response)
+        self.assertEqual(json.loads(json.dumps(response.to_dict()))["error"], "disk full")
+
+    def test_benchmark_response_mapping_protocol(self):
+        """Test that mapping methods see results before they are accessed."""
+        benchmark = Benchmark(name="Lazy")
+        benchmark.results.append(Result(task_id="task1", status=ResultStatus.SUCCESS))
+
+        expected = self.engine._create_benchmark_response(benchmark).to_dict()
+        self.assertFalse(self.engine._create_benchmark_response(benchmark) != expected)
+        self.assertEqual(self.engine._create_benchmark_response(benchmark), expected)
+
+        response = self.engine._create_benchmark_response(benchmark)
+        self.assertEqual(response.pop("results", None), expected["results"])
+        self.assertNotIn("results", response)
+
+        response = self.engine._create_benchmark_response(benchmark)
+        self.assertEqual(response.setdefault("results", []), expected["results"])
+        self.assertEqual(len(response), len(expected))
+
+        response = self.engine._create_benchmark_response(benchmark)
+        self.assertEqual(dict(response.popitem() for _ in range(len(expected))), expected)
+        self.assertEqual(len(response), 0)
+
 
 class TestOptimizationPlugin(unittest.TestCase):
     """Tests for the OptimizationPlugin class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one event loop for all async tests in the class."""
+        cls.loop = asyncio.new_event_loop()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Close the shared event loop."""
+        cls.loop.close()
+    
     def test_initialization(self):
         """Test plugin initialization."""
         plugin = OptimizationPlugin()
@@ -298,10 +540,7 @@ class TestOptimizationPlugin(unittest.TestCase):
         plugin = OptimizationPlugin()
         mock_benchmark.metadata = {}
         
-        async def run_test():
-            await plugin.pre_benchmark(mock_benchmark)
-        
-        asyncio.run(run_test())
+        self.loop.run_until_complete(plugin.pre_benchmark(mock_benchmark))
         
         # Verify metadata was updated
         self.assertTrue(mock_benchmark.metadata["optimized"])
@@ -314,20 +553,83 @@ class TestOptimizationPlugin(unittest.TestCase):
         plugin.execution_history = ["task1", "task2"]
         mock_benchmark.metadata = {}
         
-        async def run_test():
-            await plugin.post_benchmark(mock_benchmark)
-        
-        asyncio.run(run_test())
+        self.loop.run_until_complete(plugin.post_benchmark(mock_benchmark))
         
         # Verify metrics were added to metadata
         self.assertIn("optimization_metrics", mock_benchmark.metadata)
         self.assertEqual(mock_benchmark.metadata["optimization_metrics"]["cache_hits"], 2)
         self.assertEqual(mock_benchmark.metadata["optimization_metrics"]["execution_history"], 2)
 
+    def test_memoized_result_reused(self):
+        """Test that a cached result is offered for an identical task."""
+        plugin = OptimizationPlugin({"memoize_results": True, "max_cache_size": 1})
+        first = Task(objective="Same objective")
+        second = Task(objective="Same objective")
+        result = Result(task_id=first.id, status=ResultStatus.SUCCESS)
+
+        async def run_test():
+            await plugin.pre_task(first)
+            await plugin.post_task(first, result)
+            await plugin.pre_task(second)
+
+        self.loop.run_until_complete(run_test())
+
+        self.assertNotIn("_cache_hit", first.parameters)
+        cached = second.parameters["_cache_hit"]
+        self.assertEqual(cached.task_id, second.id)
+        self.assertNotEqual(cached.id, result.id)
+        self.assertEqual(len(plugin.result_cache), 1)
+
+    def test_cache_hit_is_not_copied_back(self):
+        """Test that a result served from the cache is not deep-copied into it again."""
+        plugin = OptimizationPlugin({"memoize_results": True})
+        first = Task(objective="Same objective")
+        second = Task(objective="Same objective")
+
+        async def run_test():
+            await plugin.pre_task(first)
+            await plugin.post_task(first, Result(task_id=first.id, status=ResultStatus.SUCCESS))
+            await plugin.pre_task(second)
+            cached = second.parameters.pop("_cache_hit")
+            with patch.object(unified_benchmark_engine.copy, "deepcopy") as deepcopy:
+                await plugin.post_task(second, cached)
+            return deepcopy
+
+        deepcopy = self.loop.run_until_complete(run_test())
+
+        deepcopy.assert_not_called()
+        self.assertEqual(len(plugin.result_cache), 1)
+        self.assertEqual(plugin._served_from_cache, set())
+
+    def test_intern_table_bounded_by_cache_size(self):
+        """Test that only key parts are interned, bounded by the cache size."""
+        plugin = OptimizationPlugin({"memoize_results": True, "max_cache_size": 2})
+
+        async def run_test():
+            for i in range(10):
+                task = Task(objective=f"Objective {i}")
+                await plugin.post_task(task, Result(task_id=task.id, status=ResultStatus.SUCCESS))
+
+        self.loop.run_until_complete(run_test())
+
+        self.assertEqual(len(plugin.result_cache), 2)
+        self.assertLessEqual(len(plugin._interned), 4)
+        self.assertNotIn(plugin.execution_history[0]["timestamp"], plugin._interned)
+
 
 class TestMetricsCollectionPlugin(unittest.TestCase):
     """Tests for the MetricsCollectionPlugin class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one event loop for all async tests in the class."""
+        cls.loop = asyncio.new_event_loop()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Close the shared event loop."""
+        cls.loop.close()
+    
     def test_initialization(self):
         """Test plugin initialization."""
         plugin = MetricsCollectionPlugin()
@@ -345,10 +647,7 @@ class TestMetricsCollectionPlugin(unittest.TestCase):
         plugin = MetricsCollectionPlugin()
         mock_benchmark.metadata = {}
         
-        async def run_test():
-            await plugin.pre_benchmark(mock_benchmark)
-        
-        asyncio.run(run_test())
+        self.loop.run_until_complete(plugin.pre_benchmark(mock_benchmark))
         
         # Verify metrics collection was initialized
         self.assertIn("metrics_collection", mock_benchmark.metadata)
@@ -364,21 +663,17 @@ class TestMetricsCollectionPlugin(unittest.TestCase):
         plugin = MetricsCollectionPlugin()
         mock_benchmark.metadata = {"metrics_collection": {"started_at": "2022-01-01T00:00:00"}}
         
-        # Create mock results with resource usage
-        mock_result1 = MagicMock()
-        mock_result1.resource_usage.peak_memory_mb = 100
-        mock_result1.resource_usage.average_cpu_percent = 25
-        
-        mock_result2 = MagicMock()
-        mock_result2.resource_usage.peak_memory_mb = 200
-        mock_result2.resource_usage.average_cpu_percent = 50
+        # Create stub results with resource usage; the plugin only reads them
+        mock_result1 = SimpleNamespace(
+            resource_usage=SimpleNamespace(peak_memory_mb=100, average_cpu_percent=25)
+        )
+        mock_result2 = SimpleNamespace(
+            resource_usage=SimpleNamespace(peak_memory_mb=200, average_cpu_percent=50)
+        )
         
         mock_benchmark.results = [mock_result1, mock_result2]
         
-        async def run_test():
-            await plugin.post_benchmark(mock_benchmark)
-        
-        asyncio.run(run_test())
+        self.loop.run_until_complete(plugin.post_benchmark(mock_benchmark))
         
         # Verify metrics were added
         self.assertIn("completed_at", mock_benchmark.metadata["metrics_collection"])
@@ -3,10 +3,12 @@
 import unittest
 import asyncio
 import logging
+from collections import Counter
 from unittest.mock import patch, MagicMock
 import tempfile
 from pathlib import Path
-import os
+
+import pytest
 
 from swarm_benchmark.utils.error_handling import (
     BenchmarkError, ConfigurationError, ExecutionError,
@@ -17,6 +19,26 @@ from swarm_benchmark.utils.error_handling import (
 )
 
 
+# One event loop shared by every async test in the module
+_loop = None
+
+
+def setUpModule():
+    """Create the shared event loop."""
+    global _loop
+    _loop = asyncio.new_event_loop()
+
+
+def tearDownModule():
+    """Close the shared event loop."""
+    _loop.close()
+
+
+def run_async(coro):
+    """Run a coroutine to completion on the shared event loop."""
+    return _loop.run_until_complete(coro)
+
+
 class TestErrorClasses(unittest.TestCase):
     """Tests for error classes."""
     
@@ -38,6 +60,18 @@ class TestErrorClasses(unittest.TestCase):
         self.assertIsNotNone(error.traceback)
         self.assertTrue(isinstance(error.traceback, list))
     
+    def test_benchmark_error_traceback_is_lazy(self):
+        """Test that the cause traceback is formatted on first access only."""
+        cause = ValueError("Original error")
+        with patch("traceback.format_exception", return_value=["formatted"]) as mock_format:
+            error = BenchmarkError("Wrapped error", cause)
+            mock_format.assert_not_called()
+            
+            self.assertEqual(error.traceback, ["formatted"])
+            self.assertEqual(error.traceback, ["formatted"])
+        
+        mock_format.assert_called_once()
+    
     def test_specialized_errors(self):
         """Test specialized error classes."""
         config_error = ConfigurationError("Config error")
@@ -61,48 +95,67 @@ class TestErrorContext(unittest.TestCase):
     
     def test_error_context_with_error(self):
         """Test ErrorContext with error."""
-        with self.assertRaises(BenchmarkError) as ctx:
+        with pytest.raises(BenchmarkError) as exc_info:
             with ErrorContext("test_error"):
                 # Raise an error
                 raise ValueError("Test error")
         
-        error = ctx.exception
+        error = exc_info.value
         self.assertEqual(error.message, "Error in test_error: Test error")
         self.assertTrue(isinstance(error.cause, ValueError))
     
     def test_error_context_with_custom_error_class(self):
         """Test ErrorContext with custom error class."""
-        with self.assertRaises(ConfigurationError) as ctx:
+        with pytest.raises(ConfigurationError) as exc_info:
             with ErrorContext("test_config", error_class=ConfigurationError):
                 # Raise an error
                 raise ValueError("Config error")
         
-        error = ctx.exception
+        error = exc_info.value
         self.assertTrue(isinstance(error, ConfigurationError))
         self.assertEqual(error.message, "Error in test_config: Config error")
+    
+    def test_error_context_nested_does_not_rewrap(self):
+        """Test that nested contexts pass an existing BenchmarkError through."""
+        with patch("swarm_benchmark.utils.error_handling.logger") as mock_logger:
+            with pytest.raises(BenchmarkError) as exc_info:
+                with ErrorContext("outer"):
+                    with ErrorContext("inner"):
+                        raise ValueError("Nested error")
+        
+        error = exc_info.value
+        self.assertEqual(error.message, "Error in inner: Nested error")
+        self.assertTrue(isinstance(error.cause, ValueError))
+        mock_logger.error.assert_called_once()
+        mock_logger.debug.assert_called_once()
 
 
-class TestAsyncErrorContext(unittest.IsolatedAsyncioTestCase):
+class TestAsyncErrorContext(unittest.TestCase):
     """Tests for async error context managers."""
     
-    async def test_async_error_context_no_error(self):
+    def test_async_error_context_no_error(self):
         """Test AsyncErrorContext with no errors."""
-        async with AsyncErrorContext("test_async"):
-            # No error should occur
-            await asyncio.sleep(0.01)
+        async def run_test():
+            async with AsyncErrorContext("test_async"):
+                # No error should occur
+                await asyncio.sleep(0)
+        
+        run_async(run_test())
     
-    async def test_async_error_context_with_error(self):
+    def test_async_error_context_with_error(self):
         """Test AsyncErrorContext with error."""
-        with self.assertRaises(BenchmarkError) as ctx:
+        async def run_test():
             async with AsyncErrorContext("test_async_error"):
                 # Raise an error
                 raise ValueError("Async error")
         
-        error = ctx.exception
+        with pytest.raises(BenchmarkError) as exc_info:
+            run_async(run_test())
+        
+        error = exc_info.value
         self.assertEqual(error.message, "Error in test_async_error: Async error")
         self.assertTrue(isinstance(error.cause, ValueError))
 
-
 class TestErrorDecorators(unittest.TestCase):
     """Tests for error handling decorators."""
     
@@ -115,62 +168,54 @@ class TestErrorDecorators(unittest.TestCase):
         result = test_func()
         self.assertEqual(result, 42)
     
-    def test_with_error_handling_with_error(self):
-        """Test with_error_handling decorator with error."""
-        @with_error_handling(error_class=ConfigurationError)
-        def test_func():
-            raise ValueError("Function error")
-        
-        with self.assertRaises(ConfigurationError) as ctx:
-            test_func()
-        
-        error = ctx.exception
-        self.assertTrue(isinstance(error, ConfigurationError))
-        self.assertEqual(error.message, "Error in test_func: Function error")
-        self.assertTrue(isinstance(error.cause, ValueError))
-    
-    def test_with_error_handling_custom_context(self):
-        """Test with_error_handling decorator with custom context."""
-        @with_error_handling(context="custom_context")
-        def test_func():
-            raise ValueError("Custom context error")
-        
-        with self.assertRaises(BenchmarkError) as ctx:
-            test_func()
-        
-        error = ctx.exception
-        self.assertEqual(error.message, "Error in custom_context: Custom context error")
+    def test_with_error_handling_wraps_errors(self):
+        """Test with_error_handling decorator wrapping errors."""
+        cases = [
+            ({"error_class": ConfigurationError}, ConfigurationError, "Error in test_func: Function error"),
+            ({"context": "custom_context"}, BenchmarkError, "Error in custom_context: Function error"),
+        ]
+        for kwargs, error_class, message in cases:
+            with self.subTest(**kwargs):
+                @with_error_handling(**kwargs)
+                def test_func():
+                    raise ValueError("Function error")
+                
+                with pytest.raises(error_class) as exc_info:
+                    test_func()
+                
+                error = exc_info.value
+                self.assertEqual(error.message, message)
+                self.assertTrue(isinstance(error.cause, ValueError))
 
 
-class TestAsyncErrorDecorators(unittest.IsolatedAsyncioTestCase):
+class TestAsyncErrorDecorators(unittest.TestCase):
     """Tests for async error handling decorators."""
     
-    async def test_with_async_error_handling_no_error(self):
+    def test_with_async_error_handling_no_error(self):
         """Test with_async_error_handling decorator with no errors."""
         @with_async_error_handling()
         async def test_func():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
             return 42
         
-        result = await test_func()
+        result = run_async(test_func())
         self.assertEqual(result, 42)
     
-    async def test_with_async_error_handling_with_error(self):
+    def test_with_async_error_handling_with_error(self):
         """Test with_async_error_handling decorator with error."""
         @with_async_error_handling(error_class=ExecutionError)
         async def test_func():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
             raise ValueError("Async function error")
         
-        with self.assertRaises(ExecutionError) as ctx:
-            await test_func()
+        with pytest.raises(ExecutionError) as exc_info:
+            run_async(test_func())
         
-        error = ctx.exception
+        error = exc_info.value
         self.assertTrue(isinstance(error, ExecutionError))
         self.assertEqual(error.message, "Error in test_func: Async function error")
         self.assertTrue(isinstance(error.cause, ValueError))
 
-
 class TestErrorReporter(unittest.TestCase):
     """Tests for ErrorReporter class."""
     
@@ -178,71 +223,62 @@ class TestErrorReporter(unittest.TestCase):
         """Set up test fixtures."""
         self.reporter = ErrorReporter()
     
-    def test_report_error_basic(self):
-        """Test basic error reporting."""
-        self.reporter.report_error("Test error")
+    def test_error_reporter_api(self):
+        """Test reporting, filtering, summarizing and clearing on one reporter."""
+        reporter = self.reporter
+        self.assertFalse(reporter.has_errors())
         
-        errors = self.reporter.get_errors()
+        reporter.report_error("Error 1")
+        errors = reporter.get_errors()
         self.assertEqual(len(errors), 1)
-        self.assertEqual(errors[0]["message"], "Test error")
+        self.assertEqual(errors[0]["message"], "Error 1")
         self.assertEqual(errors[0]["context"], "unknown")
         self.assertEqual(errors[0]["severity"], "error")
+        self.assertNotIn("exception", errors[0])
+        self.assertTrue(reporter.has_errors())
+        
+        reporter.report_error("Context error", context="test_context")
+        self.assertEqual(reporter.get_errors()[1]["context"], "test_context")
+        
+        reporter.report_error("Error with exception", exception=ValueError("Exception error"))
+        exception_info = reporter.get_errors()[2]["exception"]
+        self.assertEqual(exception_info["type"], "ValueError")
+        self.assertEqual(exception_info["message"], "Exception error")
+        self.assertIsNotNone(exception_info["traceback"])
+        
+        reporter.report_error("Warning message", severity="warning")
+        reporter.report_error("Info message", severity="info")
+        self.assertEqual(len(reporter.get_errors()), 5)
+        self.assertEqual(
+            [e["message"] for e in reporter.get_errors(severity="warning")], ["Warning message"]
+        )
+        self.assertTrue(reporter.has_errors(severity="info"))
+        self.assertEqual(Counter(reporter.severities), {"error": 3, "warning": 1, "info": 1})
+        self.assertEqual(reporter.get_summary(), {"error": 3, "warning": 1, "info": 1})
+        self.assertEqual(reporter.messages[-2:], ["Warning message", "Info message"])
+        
+        reporter.clear()
+        self.assertFalse(reporter.has_errors())
+        self.assertEqual(reporter.severities, [])
+        self.assertEqual(reporter.get_summary(), {})
     
-    def test_report_error_with_context(self):
-        """Test error reporting with context."""
-        self.reporter.report_error("Context error", context="test_context")
-        
-        errors = self.reporter.get_errors()
-        self.assertEqual(errors[0]["context"], "test_context")
-    
-    def test_report_error_with_exception(self):
-        """Test error reporting with exception."""
-        ex = ValueError("Exception error")
-        self.reporter.report_error("Error with exception", exception=ex)
-        
-        errors = self.reporter.get_errors()
-        self.assertEqual(errors[0]["exception"]["type"], "ValueError")
-        self.assertEqual(errors[0]["exception"]["message"], "Exception error")
-        self.assertIsNotNone(errors[0]["exception"]["traceback"])
-    
-    def test_report_error_severity(self):
-        """Test error reporting with different severities."""
-        self.reporter.report_error("Error message", severity="error")
-        self.reporter.report_error("Warning message", severity="warning")
-        self.reporter.report_error("Info message", severity="info")
-        
-        all_errors = self.reporter.get_errors()
-        self.assertEqual(len(all_errors), 3)
-        
-        error_only = self.reporter.get_errors(severity="error")
-        self.assertEqual(len(error_only), 1)
-        self.assertEqual(error_only[0]["message"], "Error message")
-        
-        warning_only = self.reporter.get_errors(severity="warning")
-        self.assertEqual(len(warning_only), 1)
-        self.assertEqual(warning_only[0]["message"], "Warning message")
-    
-    def test_has_errors(self):
-        """Test has_errors method."""
-        self.assertFalse(self.reporter.has_errors())
-        
-        self.reporter.report_error("Test error")
-        self.assertTrue(self.reporter.has_errors())
-        
-        self.reporter.clear()
-        self.assertFalse(self.reporter.has_errors())
-    
-    def test_get_summary(self):
-        """Test get_summary method."""
-        self.reporter.report_error("Error 1", severity="error")
-        self.reporter.report_error("Error 2", severity="error")
-        self.reporter.report_error("Warning", severity="warning")
-        self.reporter.report_error("Info", severity="info")
+    def test_report_error_traceback_is_formatted_on_read(self):
+        """Test that exception tracebacks are only formatted when read."""
+        try:
+            raise ValueError("Raised error")
+        except ValueError as e:
+            ex = e
+        
+        with patch("traceback.format_exception", return_value=["formatted"]) as mock_format:
+            self.reporter.report_error("Raised", exception=ex)
+            self.assertTrue(self.reporter.has_errors())
+            mock_format.assert_not_called()
+            
+            errors = self.reporter.get_errors()
+            self.reporter.get_errors()
         
-        summary = self.reporter.get_summary()
-        self.assertEqual(summary["error"], 2)
-        self.assertEqual(summary["warning"], 1)
-        self.assertEqual(summary["info"], 1)
+        mock_format.assert_called_once()
+        self.assertEqual(errors[0]["exception"]["traceback"], ["formatted"])
 
 
 class TestSafeExecute(unittest.TestCase):
@@ -290,33 +326,32 @@ class TestSafeExecute(unittest.TestCase):
         self.assertIsNone(exception)
 
 
-class TestSafeExecuteAsync(unittest.IsolatedAsyncioTestCase):
+class TestSafeExecuteAsync(unittest.TestCase):
     """Tests for safe_execute_async function."""
     
-    async def test_safe_execute_async_success(self):
+    def test_safe_execute_async_success(self):
         """Test safe_execute_async with successful function."""
         async def success_func():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
             return 42
         
-        success, result, exception = await safe_execute_async(success_func)
+        success, result, exception = run_async(safe_execute_async(success_func))
         self.assertTrue(success)
         self.assertEqual(result, 42)
         self.assertIsNone(exception)
     
-    async def test_safe_execute_async_failure(self):
+    def test_safe_execute_async_failure(self):
         """Test safe_execute_async with failing function."""
         async def fail_func():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
             raise ValueError("Async fail")
         
-        success, result, exception = await safe_execute_async(fail_func)
+        success, result, exception = run_async(safe_execute_async(fail_func))
         self.assertFalse(success)
         self.assertIsNone(result)
         self.assertTrue(isinstance(exception, ValueError))
         self.assertEqual(str(exception), "Async fail")
 
-
 class TestLoggingConfiguration(unittest.TestCase):
     """Tests for logging configuration."""
     
@@ -339,41 +374,38 @@ class TestLoggingConfiguration(unittest.TestCase):
     
     def test_configure_logging_with_file(self):
         """Test logging configuration with file handler."""
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            log_path = temp_file.name
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = Path(temp_dir) / "benchmark.log"
+            configure_logging(log_file=str(log_path))
             
-            try:
-                configure_logging(log_file=log_path)
-                
-                root_logger = logging.getLogger()
-                self.assertEqual(len(root_logger.handlers), 2)
-                
-                # Check handler types
-                handlers = root_logger.handlers
-                self.assertTrue(any(isinstance(h, logging.StreamHandler) for h in handlers))
-                self.assertTrue(any(isinstance(h, logging.FileHandler) for h in handlers))
-                
-                # Write a log message
-                logging.error("Test log message")
-                
-                # Verify file contains the message
-                with open(log_path, 'r') as f:
-                    content = f.read()
-                    self.assertIn("Test log message", content)
-                    
-            finally:
-                # Clean up the file
-                try:
-                    os.unlink(log_path)
-                except:
-                    pass
+            root_logger = logging.getLogger()
+            self.assertEqual(len(root_logger.handlers), 2)
+            
+            # Check handler types; the file handler targets the requested path
+            file_handlers = [h for h in root_logger.handlers if isinstance(h, logging.FileHandler)]
+            self.assertEqual(len(file_handlers), 1)
+            self.assertEqual(file_handlers[0].baseFilename, str(log_path))
+            self.assertTrue(any(
+                type(h) is logging.StreamHandler for h in root_logger.handlers
+            ))
+            
+            file_handlers[0].close()
 
 
 class TestFormatException(unittest.TestCase):
     """Tests for format_exception function."""
     
+    def test_format_regular_exception_joins_traceback_lines(self):
+        """Test that a regular exception's traceback lines are concatenated."""
+        lines = ["Traceback (most recent call last):\n", "ValueError: Regular error\n"]
+        with patch("traceback.format_exception", return_value=lines) as mock_format:
+            result = format_exception(ValueError("Regular error"))
+        
+        mock_format.assert_called_once()
+        self.assertEqual(result, "".join(lines))
+    
     def test_format_regular_exception(self):
-        """Test formatting a regular exception."""
+        """Test formatting a regular exception with a real traceback."""
         try:
             # Raise a regular exception
             raise ValueError("Regular error")
@@ -4,8 +4,10 @@ import unittest
 import asyncio
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock, AsyncMock
 import json
+import sys
 import time
 import psutil
 
@@ -23,20 +25,25 @@ from swarm_benchmark.core.models import (
 )
 
 
+def wait_for_samples(collector, count, timeout=2.0):
+    """Poll until a collector holds at least count samples or timeout passes."""
+    deadline = time.monotonic() + timeout
+    while collector.sample_count < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
 class TestSystemMetrics(unittest.TestCase):
     """Tests for SystemMetrics class."""
     
     def test_initialization(self):
         """Test SystemMetrics initialization."""
-        from datetime import datetime
-        
-        timestamp = datetime.now()
+        timestamp = time.monotonic_ns()
         metrics = SystemMetrics(
             timestamp=timestamp,
             cpu_percent=10.5,
             memory_percent=25.0,
-            memory_available_mb=1024.0,
-            memory_used_mb=512.0,
+            memory_available_bytes=1024 * 1024 * 1024,
+            memory_used_bytes=512 * 1024 * 1024,
             disk_read_bytes=1024,
             disk_write_bytes=2048,
             network_sent_bytes=4096,
@@ -46,12 +53,17 @@ class TestSystemMetrics(unittest.TestCase):
         self.assertEqual(metrics.timestamp, timestamp)
         self.assertEqual(metrics.cpu_percent, 10.5)
         self.assertEqual(metrics.memory_percent, 25.0)
-        self.assertEqual(metrics.memory_available_mb, 1024.0)
-        self.assertEqual(metrics.memory_used_mb, 512.0)
+        self.assertEqual(metrics.memory_available_bytes, 1024 * 1024 * 1024)
+        self.assertEqual(metrics.memory_used_bytes, 512 * 1024 * 1024)
         self.assertEqual(metrics.disk_read_bytes, 1024)
         self.assertEqual(metrics.disk_write_bytes, 2048)
         self.assertEqual(metrics.network_sent_bytes, 4096)
         self.assertEqual(metrics.network_recv_bytes, 8192)
+    
+    def test_slots(self):
+        """Test that instances carry no per-instance __dict__."""
+        metrics = SystemMetrics(time.monotonic_ns(), 10.5, 25.0, 1 << 30, 1 << 29, 0, 0, 0, 0)
+        self.assertFalse(hasattr(metrics, "__dict__"))
 
 
 class TestProcessSnapshot(unittest.TestCase):
@@ -59,14 +71,12 @@ class TestProcessSnapshot(unittest.TestCase):
     
     def test_initialization(self):
         """Test ProcessSnapshot initialization."""
-        from datetime import datetime
-        
-        timestamp = datetime.now()
+        timestamp = time.monotonic_ns()
         snapshot = ProcessSnapshot(
             pid=1234,
             name="test_process",
             cpu_percent=5.0,
-            memory_mb=256.0,
+            memory_bytes=256 * 1024 * 1024,
             threads=4,
             read_bytes=1024,
             write_bytes=2048,
@@ -77,7 +87,7 @@ class TestProcessSnapshot(unittest.TestCase):
         self.assertEqual(snapshot.pid, 1234)
         self.assertEqual(snapshot.name, "test_process")
         self.assertEqual(snapshot.cpu_percent, 5.0)
-        self.assertEqual(snapshot.memory_mb, 256.0)
+        self.assertEqual(snapshot.memory_bytes, 256 * 1024 * 1024)
         self.assertEqual(snapshot.threads, 4)
         self.assertEqual(snapshot.read_bytes, 1024)
         self.assertEqual(snapshot.write_bytes, 2048)
@@ -90,22 +100,20 @@ class TestMetricsSnapshot(unittest.TestCase):
     
     def test_initialization(self):
         """Test MetricsSnapshot initialization."""
-        from datetime import datetime
-        
-        timestamp = datetime.now()
-        system = MagicMock()
-        process1 = MagicMock()
-        process2 = MagicMock()
+        timestamp = time.monotonic_ns()
+        system = SimpleNamespace(cpu_percent=10.0)
+        process1 = SimpleNamespace(pid=1)
+        process2 = SimpleNamespace(pid=2)
         
         snapshot = MetricsSnapshot(
-            id="test-id",
+            id=1,
             timestamp=timestamp,
             system=system,
             processes=[process1, process2],
             interval_ms=100.0
         )
         
-        self.assertEqual(snapshot.id, "test-id")
+        self.assertEqual(snapshot.id, 1)
         self.assertEqual(snapshot.timestamp, timestamp)
         self.assertEqual(snapshot.system, system)
         self.assertEqual(snapshot.processes, [process1, process2])
@@ -115,16 +123,20 @@ class TestMetricsSnapshot(unittest.TestCase):
 class TestMetricsCollector(unittest.TestCase):
     """Tests for MetricsCollector class."""
     
+    # cpu, memory %, available/used bytes, disk read/write, net sent/recv
+    SYSTEM_READING = (10.0, 20.0, 1024 * 1024 * 1024, 512 * 1024 * 1024, 0, 0, 0, 0)
+    
     def setUp(self):
         """Set up test fixtures."""
         self.collector = MetricsCollector(sampling_interval=0.01)
     
-    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._collect_snapshot')
-    def test_start_stop_collection(self, mock_collect):
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._read_processes')
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._read_system')
+    def test_start_stop_collection(self, mock_read_system, mock_read_processes):
         """Test starting and stopping metrics collection."""
-        # Mock snapshot collection
-        mock_snapshot = MagicMock()
-        mock_collect.return_value = mock_snapshot
+        # Mock metric readings
+        mock_read_system.return_value = self.SYSTEM_READING
+        mock_read_processes.return_value = []
         
         # Start collection
         self.collector.start_collection()
@@ -132,71 +144,520 @@ class TestMetricsCollector(unittest.TestCase):
         self.assertIsNotNone(self.collector._collection_thread)
         self.assertIsNotNone(self.collector._start_time)
         
-        # Give it time to collect a few snapshots
-        time.sleep(0.05)
+        # Wait for a few samples rather than a fixed time
+        wait_for_samples(self.collector, 3)
         
         # Stop collection
         metrics = self.collector.stop_collection()
         self.assertFalse(self.collector._running)
         self.assertIsNotNone(self.collector._end_time)
         
-        # Check that we got metrics and snapshots
+        # Check that we got metrics and samples
         self.assertIsInstance(metrics, PerformanceMetrics)
-        self.assertTrue(len(self.collector.snapshots) > 0)
+        self.assertGreaterEqual(self.collector.sample_count, 3)
+        # The summary is only reduced once something asks for it
+        self.assertIsNone(self.collector._cached_summary)
+        summary = self.collector._summary()
+        self.assertIs(self.collector._summary(), summary)
         
         # Clean up
         if self.collector._collection_thread and self.collector._collection_thread.is_alive():
             self.collector._collection_thread.join(timeout=1.0)
     
-    @patch('swarm_benchmark.metrics.unified_metrics_collector.psutil')
-    def test_collect_system_metrics(self, mock_psutil):
-        """Test collecting system metrics."""
-        # Mock psutil functions
-        mock_cpu = MagicMock(return_value=10.0)
-        mock_psutil.cpu_percent = mock_cpu
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._read_processes')
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._read_system')
+    def test_start_stop_collection_async(self, mock_read_system, mock_read_processes):
+        """Test sampling as a task on the running event loop."""
+        mock_read_system.return_value = self.SYSTEM_READING
+        mock_read_processes.return_value = []
+        
+        async def run_test():
+            await self.collector.start_collection_async()
+            self.assertIsNone(self.collector._collection_thread)
+            self.assertIsNotNone(self.collector._collection_task)
+            deadline = time.monotonic() + 2.0
+            while self.collector.sample_count < 3 and time.monotonic() < deadline:
+                await asyncio.sleep(0.001)
+            return await self.collector.stop_collection_async()
+        
+        metrics = asyncio.run(run_test())
+        self.assertIsInstance(metrics, PerformanceMetrics)
+        self.assertFalse(self.collector._running)
+        self.assertIsNone(self.collector._collection_task)
+        self.assertGreaterEqual(self.collector.sample_count, 3)
+    
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._read_processes')
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._read_system')
+    def test_event_driven_collection(self, mock_read_system, mock_read_processes):
+        """Test that a heartbeat collector samples on transitions, not on a timer."""
+        mock_read_system.return_value = self.SYSTEM_READING
+        mock_read_processes.return_value = []
+        collector = MetricsCollector(sampling_interval=0.01, heartbeat_interval=60.0)
+        
+        collector.start_collection()
+        wait_for_samples(collector, 1)
+        for expected in (2, 3):
+            collector.signal_transition()
+            wait_for_samples(collector, expected)
+        time.sleep(0.05)
         
-        mock_virtual_memory = MagicMock()
-        mock_virtual_memory.percent = 25.0
-        mock_virtual_memory.available = 1024 * 1024 * 1024  # 1 GB
-        mock_virtual_memory.used = 512 * 1024 * 1024  # 512 MB
-        mock_psutil.virtual_memory.return_value = mock_virtual_memory
+        started = time.monotonic()
+        collector.stop_collection()
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(collector.sample_count, 3)
+    
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._read_processes')
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._read_system')
+    def test_transition_before_stop_is_sampled(self, mock_read_system, mock_read_processes):
+        """Test that a transition signaled right before stopping still gets its sample."""
+        mock_read_system.return_value = self.SYSTEM_READING
+        mock_read_processes.return_value = []
+        collector = MetricsCollector(sampling_interval=0.01, heartbeat_interval=60.0)
+        
+        collector.start_collection()
+        wait_for_samples(collector, 1)
+        collector.signal_transition()
+        collector.stop_collection()
+        self.assertEqual(collector.sample_count, 2)
+    
+    def test_cgroup_metrics_replace_process_enumeration(self):
+        """Test reading a child's cgroup v2 stat files as one process."""
+        import os
+        
+        with tempfile.TemporaryDirectory() as cgroup:
+            def write(name, content):
+                with open(os.path.join(cgroup, name), "w") as f:
+                    f.write(content)
+            
+            write("cpu.stat", "usage_usec 1000000\nuser_usec 800000\nsystem_usec 200000\n")
+            write("memory.current", str(64 * 1024 * 1024))
+            write("io.stat", "8:0 rbytes=100 wbytes=200 rios=1 wios=2 dbytes=0 dios=0\n"
+                             "8:16 rbytes=300 wbytes=400 rios=3 wios=4 dbytes=0 dios=0\n")
+            
+            self.assertTrue(self.collector._open_cgroup(os.getpid(), cgroup))
+            first = self.collector._read_processes()
+            
+            write("cpu.stat", "usage_usec 1050000\nuser_usec 840000\nsystem_usec 210000\n")
+            second = self.collector._read_processes()
+            self.collector._release_cgroup()
+        
+        self.assertEqual(len(first), 1)
+        pid, name, cpu, memory_bytes, _, read_bytes, write_bytes, io_count = first[0]
+        self.assertEqual(pid, os.getpid())
+        self.assertEqual(cpu, 0.0)
+        self.assertEqual(memory_bytes, 64 * 1024 * 1024)
+        self.assertEqual((read_bytes, write_bytes, io_count), (400, 600, 10))
+        self.assertGreater(second[0][2], 0.0)
+        self.assertIsNone(self.collector._cgroup)
+        self.assertEqual(self.collector._proc_cache, {})
+    
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._read_system')
+    def test_collection_errors_are_rate_limited(self, mock_read_system):
+        """Test that repeated sampling errors are logged a bounded number of times."""
+        mock_read_system.side_effect = psutil.Error("boom")
         
-        mock_disk_io = MagicMock()
-        mock_disk_io.read_bytes = 1024
-        mock_disk_io.write_bytes = 2048
-        mock_psutil.disk_io_counters.return_value = mock_disk_io
+        with self.assertLogs(level='WARNING') as logs:
+            for _ in range(25):
+                self.collector._take_sample()
         
-        mock_net_io = MagicMock()
-        mock_net_io.bytes_sent = 4096
-        mock_net_io.bytes_recv = 8192
-        mock_psutil.net_io_counters.return_value = mock_net_io
+        self.assertEqual(len(logs.output), 10)
+        self.assertEqual(self.collector.sample_count, 0)
+    
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._refresh_process_tree')
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._read_system')
+    def test_malformed_proc_contents_skip_sample(self, mock_read_system, mock_refresh):
+        """Test that parser errors skip a sample instead of ending collection."""
+        mock_read_system.side_effect = [ValueError("bad meminfo"), self.SYSTEM_READING]
+        mock_refresh.side_effect = IndexError("bad stat")
+        
+        with self.assertLogs(level='WARNING') as logs:
+            self.collector._take_sample()
+            self.collector._take_sample()
+        
+        self.assertEqual(len(logs.output), 2)
+        # The second sample falls back to the current process
+        self.assertEqual(self.collector.sample_count, 1)
+        self.assertEqual(self.collector._proc_count[0], 1)
+    
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._read_processes')
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._read_system')
+    def test_sampled_collection(self, mock_read_system, mock_read_processes):
+        """Test that a sample rate stores about that fraction of ticks."""
+        import random
+        
+        mock_read_system.return_value = self.SYSTEM_READING
+        mock_read_processes.return_value = []
+        collector = MetricsCollector(sampling_interval=0.01, sample_rate=0.1)
+        
+        random.seed(1234)
+        for _ in range(2000):
+            collector._take_sample()
+        
+        self.assertGreater(collector.sample_count, 120)
+        self.assertLess(collector.sample_count, 280)
+        self.assertEqual(mock_read_system.call_count, collector.sample_count)
+    
+    @patch('swarm_benchmark.metrics.unified_metrics_collector._HISTORY_CAPACITY', 8)
+    def test_sample_history_wraps_around(self):
+        """Test that the oldest samples are overwritten once the ring is full."""
+        for i in range(11):
+            self.collector._add_snapshot_raw(i, float(i), i, i * 100, 0, 0, 0, 0.0, 0, 1)
+        
+        self.assertEqual(self.collector.sample_count, 8)
+        self.assertEqual(self.collector._written, 11)
+        self.assertEqual(self.collector._ts[self.collector._sample_index()].tolist(), list(range(3, 11)))
+        summary = self.collector._summarize()
+        self.assertEqual(summary["disk_read_bytes"], 700)
+        self.assertEqual(summary["peak_cpu_percent"], 10.0)
+        self.assertEqual(summary["average_cpu_percent"], 6.5)
+    
+    def test_percentiles_and_peak_match_numpy(self):
+        """Test the single-partition percentiles against np.percentile."""
+        import numpy as np
+        from swarm_benchmark.metrics.unified_metrics_collector import _percentiles_and_peak
+        
+        rng = np.random.default_rng(0)
+        for size in (1, 2, 7, 1000):
+            with self.subTest(size=size):
+                values = (rng.random(size) * 100).astype(np.float32)
+                percentiles, peak = _percentiles_and_peak(values, (0, 50, 90, 99, 100))
+                
+                expected = np.percentile(values.astype(np.float64), [0, 50, 90, 99, 100])
+                for actual, reference in zip(percentiles, expected):
+                    self.assertAlmostEqual(actual, reference, places=4)
+                self.assertEqual(peak, float(values.max()))
+    
+    def test_next_delay_uses_absolute_deadlines(self):
+        """Test that sample deadlines don't drift and overdue slots are skipped."""
+        interval_ns = self.collector._interval_ns
+        start = time.monotonic_ns()
+        self.collector._deadline_ns = start
+        
+        delay = self.collector._next_delay()
+        self.assertEqual(self.collector._deadline_ns, start + interval_ns)
+        self.assertLessEqual(delay, self.collector.sampling_interval)
+        
+        # Slightly late samples are taken at once
+        self.collector._deadline_ns = time.monotonic_ns() - int(1.2 * interval_ns)
+        self.assertEqual(self.collector._next_delay(), 0.0)
+        self.assertEqual(self.collector._missed_samples, 0)
+        
+        # Three and a half intervals behind skips to the next slot on the grid
+        self.collector._deadline_ns = time.monotonic_ns() - int(4.5 * interval_ns)
+        delay = self.collector._next_delay()
+        self.assertEqual(self.collector._missed_samples, 4)
+        self.assertGreater(delay, 0.0)
+        self.assertLessEqual(delay, self.collector.sampling_interval / 2)
+        self.assertGreater(self.collector._deadline_ns, time.monotonic_ns())
+    
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._read_processes')
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._read_system')
+    def test_no_catchup_after_stall(self, mock_read_system, mock_read_processes):
+        """Test that a stalled sampler skips slots instead of bursting afterwards."""
+        calls = []
+        
+        def read_system(max_age_ns=0):
+            calls.append(None)
+            if len(calls) == 3:
+                time.sleep(0.1)
+            return self.SYSTEM_READING
         
-        # Collect metrics
-        metrics = self.collector._collect_system_metrics()
+        mock_read_system.side_effect = read_system
+        mock_read_processes.return_value = []
+        
+        self.collector.start_collection()
+        time.sleep(0.2)
+        self.collector.stop_collection()
+        
+        self.assertGreater(self.collector._missed_samples, 0)
+        timestamps = self.collector._ts[self.collector._sample_index()]
+        gaps = timestamps[1:] - timestamps[:-1]
+        self.assertGreater(int(gaps.min()), self.collector._interval_ns // 4)
+    
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._read_processes')
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._read_system')
+    def test_snapshot_ids_are_sequential_ints(self, mock_read_system, mock_read_processes):
+        """Test that snapshots are numbered with a per-collector int counter."""
+        mock_read_system.return_value = self.SYSTEM_READING
+        mock_read_processes.return_value = []
+        
+        ids = [self.collector._collect_snapshot().id for _ in range(3)]
+        self.assertEqual(ids, [0, 1, 2])
+    
+    @patch('swarm_benchmark.metrics.unified_metrics_collector._PROCFS', False)
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.psutil')
+    def test_collect_system_metrics(self, mock_psutil):
+        """Test collecting system metrics."""
+        # Mock psutil functions
+        mock_psutil.cpu_percent.return_value = 10.0
+        mock_psutil.virtual_memory.return_value = SimpleNamespace(
+            percent=25.0,
+            available=1024 * 1024 * 1024,  # 1 GB
+            used=512 * 1024 * 1024  # 512 MB
+        )
+        mock_psutil.disk_io_counters.return_value = SimpleNamespace(read_bytes=1024, write_bytes=2048)
+        mock_psutil.net_io_counters.return_value = SimpleNamespace(bytes_sent=4096, bytes_recv=8192)
+        
+        # Collect metrics twice within half a sampling interval, through a
+        # sampler no other test has filled
+        from swarm_benchmark.metrics import unified_metrics_collector
+        with patch.object(unified_metrics_collector, '_SYSTEM_SAMPLER',
+                          unified_metrics_collector._SharedSystemSampler()), \
+                patch.object(self.collector, '_system_max_age_ns', 60 * 10**9):
+            metrics = self.collector._collect_system_metrics()
+            again = self.collector._collect_system_metrics()
+        self.assertEqual(mock_psutil.disk_io_counters.call_count, 1)
+        self.assertEqual(again.disk_read_bytes, metrics.disk_read_bytes)
         
         # Verify metrics
         self.assertEqual(metrics.cpu_percent, 10.0)
         self.assertEqual(metrics.memory_percent, 25.0)
-        self.assertAlmostEqual(metrics.memory_available_mb, 1024.0, delta=0.1)
-        self.assertAlmostEqual(metrics.memory_used_mb, 512.0, delta=0.1)
+        self.assertEqual(metrics.memory_available_bytes, 1024 * 1024 * 1024)
+        self.assertEqual(metrics.memory_used_bytes, 512 * 1024 * 1024)
         self.assertEqual(metrics.disk_read_bytes, 1024)
         self.assertEqual(metrics.disk_write_bytes, 2048)
         self.assertEqual(metrics.network_sent_bytes, 4096)
         self.assertEqual(metrics.network_recv_bytes, 8192)
     
+    @unittest.skipUnless(sys.platform.startswith("linux"), "reads /proc")
+    def test_procfs_system_metrics_match_psutil(self):
+        """Test that /proc parsing agrees with psutil on Linux."""
+        from swarm_benchmark.metrics.unified_metrics_collector import _SharedSystemSampler
+        
+        sampler = _SharedSystemSampler()
+        reading = sampler.read()
+        self.assertTrue(sampler._proc_files)
+        
+        memory = psutil.virtual_memory()
+        self.assertAlmostEqual(reading[2], memory.available, delta=64 * 1024 * 1024)
+        self.assertAlmostEqual(reading[3], memory.used, delta=64 * 1024 * 1024)
+        disk_io = psutil.disk_io_counters()
+        if disk_io:
+            self.assertLessEqual(abs(reading[4] - disk_io.read_bytes), 64 * 1024 * 1024)
+        net_io = psutil.net_io_counters()
+        self.assertLessEqual(abs(reading[6] - net_io.bytes_sent), 1024 * 1024)
+        self.assertLessEqual(abs(reading[7] - net_io.bytes_recv), 1024 * 1024)
+        
+        time.sleep(0.01)
+        cpu_percent = sampler.read()[0]
+        self.assertGreaterEqual(cpu_percent, 0.0)
+        self.assertLessEqual(cpu_percent, 100.0)
+        sampler._close_procfs()
+    
+    def test_pread_all_reads_past_initial_buffer(self):
+        """Test that whole files are read without seeking, growing the buffer."""
+        from swarm_benchmark.metrics.unified_metrics_collector import _pread_all
+        
+        content = b"x" * 10000 + b"\n"
+        with tempfile.TemporaryFile() as f:
+            f.write(content)
+            f.flush()
+            self.assertEqual(_pread_all(f), content)
+            self.assertEqual(_pread_all(f), content)
+    
+    def test_first_sample_nonzero(self):
+        """Test that creating a collector primes CPU counters for the first sample."""
+        from swarm_benchmark.metrics import unified_metrics_collector
+        
+        sampler = unified_metrics_collector._SharedSystemSampler()
+        with patch.object(unified_metrics_collector, '_SYSTEM_SAMPLER', sampler):
+            collector = MetricsCollector(sampling_interval=0.01)
+            self.assertIsNotNone(sampler._latest)
+            
+            # Keep a core busy across several clock ticks
+            deadline = time.monotonic() + 0.1
+            while time.monotonic() < deadline:
+                pass
+            cpu_percent = collector._read_system(0)[0]
+        
+        self.assertGreater(cpu_percent, 0.0)
+        if sampler._proc_files:
+            sampler._close_procfs()
+    
+    @patch('swarm_benchmark.metrics.unified_metrics_collector._PROCFS', False)
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.psutil')
+    def test_shared_system_sampler_reuses_recent_reading(self, mock_psutil):
+        """Test that system metrics are read once for concurrent collectors."""
+        from swarm_benchmark.metrics.unified_metrics_collector import _SharedSystemSampler
+        
+        mock_psutil.cpu_percent.return_value = 10.0
+        sampler = _SharedSystemSampler()
+        
+        first = sampler.read(max_age_ns=10**9)
+        second = sampler.read(max_age_ns=10**9)
+        self.assertIs(first, second)
+        self.assertEqual(mock_psutil.virtual_memory.call_count, 1)
+        
+        sampler.read(max_age_ns=0)
+        self.assertEqual(mock_psutil.virtual_memory.call_count, 2)
+    
+    @patch('swarm_benchmark.metrics.unified_metrics_collector._PROCFS', False)
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.psutil')
+    def test_shared_system_sampler_fresh_reads_skip_lock(self, mock_psutil):
+        """Test that threads reuse a fresh reading while another holds the lock."""
+        import threading
+        from swarm_benchmark.metrics.unified_metrics_collector import _SharedSystemSampler
+        
+        mock_psutil.cpu_percent.return_value = 10.0
+        sampler = _SharedSystemSampler()
+        reading = sampler.read()
+        results = []
+        
+        with sampler._lock:
+            threads = [
+                threading.Thread(target=lambda: results.append(sampler.read(max_age_ns=60 * 10**9)))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=1.0)
+        
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(result is reading for result in results))
+        self.assertEqual(mock_psutil.virtual_memory.call_count, 1)
+    
+    def test_collect_process_metrics_reuses_handles(self):
+        """Test that process handles and names are cached between samples."""
+        import os
+        
+        first = self.collector._collect_process_metrics()
+        handle = self.collector._proc_cache[os.getpid()]
+        second = self.collector._collect_process_metrics()
+        
+        self.assertIn(os.getpid(), [p.pid for p in first])
+        self.assertIn(os.getpid(), [p.pid for p in second])
+        self.assertIs(self.collector._proc_cache[os.getpid()], handle)
+        self.assertEqual(self.collector._name_cache[os.getpid()], psutil.Process().name())
+        self.collector._close_io_files()
+    
+    @unittest.skipUnless(sys.platform.startswith("linux"), "reads /proc")
+    def test_proc_stat_matches_psutil(self):
+        """Test that one /proc/<pid>/stat read agrees with psutil's separate reads."""
+        import os
+        
+        proc = psutil.Process()
+        cpu_time, rss, threads = self.collector._read_proc_stat(os.getpid())
+        times = proc.cpu_times()
+        
+        self.assertAlmostEqual(cpu_time, times.user + times.system, delta=0.1)
+        self.assertAlmostEqual(rss, proc.memory_info().rss, delta=16 * 1024 * 1024)
+        self.assertEqual(threads, proc.num_threads())
+        self.assertIn(os.getpid(), self.collector._stat_files)
+        self.assertIsNone(self.collector._read_proc_stat(2 ** 22 + 1))
+        self.collector._close_io_files()
+        self.assertEqual(self.collector._stat_files, {})
+    
+    @unittest.skipUnless(sys.platform.startswith("linux"), "reads /proc")
+    def test_descendant_pids_match_psutil(self):
+        """Test that walking /proc/<pid>/task/<tid>/children finds the whole tree."""
+        import os
+        import subprocess
+        from swarm_benchmark.metrics import unified_metrics_collector
+        
+        if not unified_metrics_collector._PROC_CHILDREN:
+            self.skipTest("kernel without /proc/<pid>/task/<tid>/children")
+        
+        # A shell with a child of its own
+        child = subprocess.Popen(["sh", "-c", "sleep 5 & wait"])
+        try:
+            deadline = time.monotonic() + 2.0
+            while len(psutil.Process(child.pid).children()) < 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            expected = {p.pid for p in psutil.Process().children(recursive=True)}
+            
+            self.assertEqual(set(unified_metrics_collector._descendant_pids(os.getpid())), expected)
+            self.assertGreaterEqual(len(expected), 2)
+        finally:
+            for p in psutil.Process(child.pid).children(recursive=True):
+                p.kill()
+            child.kill()
+            child.wait()
+    
+    def test_process_names_shared_across_collectors(self):
+        """Test that each process's name is read once for all collectors."""
+        import os
+        from swarm_benchmark.metrics import unified_metrics_collector
+        
+        other = MetricsCollector(sampling_interval=0.01)
+        with patch.dict(unified_metrics_collector._PROCESS_NAMES, clear=True), \
+                patch.object(psutil.Process, 'name', autospec=True, return_value="python") as mock_name:
+            self.collector._collect_process_metrics()
+            other._collect_process_metrics()
+            other.request_process_refresh()
+            other._collect_process_metrics()
+        
+        pids = [call.args[0].pid for call in mock_name.call_args_list]
+        self.assertEqual(pids.count(os.getpid()), 1)
+        self.assertEqual(other._name_cache[os.getpid()], "python")
+        self.collector._close_io_files()
+        other._close_io_files()
+    
+    def test_name_interning(self):
+        """Test that processes with the same name share one name string."""
+        from swarm_benchmark.metrics import unified_metrics_collector
+        
+        procs = [
+            SimpleNamespace(pid=pid, create_time=lambda: 1.0, name=lambda: "".join(["no", "de"]))
+            for pid in (101, 102)
+        ]
+        with patch.dict(unified_metrics_collector._PROCESS_NAMES, clear=True):
+            names = [unified_metrics_collector._process_name(proc) for proc in procs]
+        
+        self.assertEqual(names, ["node", "node"])
+        self.assertIs(names[0], names[1])
+    
+    @patch('swarm_benchmark.metrics.unified_metrics_collector._PROC_STAT', False)
+    def test_process_cpu_percent_from_cpu_time_deltas(self):
+        """Test that process CPU % is derived from cpu_times() between samples."""
+        import os
+        
+        times = [SimpleNamespace(user=1.0, system=0.5), SimpleNamespace(user=1.2, system=0.5)]
+        clock = [10_000_000_000, 10_500_000_000, 10_500_000_000, 11_000_000_000]
+        with patch.object(psutil.Process, 'cpu_times', side_effect=lambda proc: times.pop(0)), \
+                patch('time.monotonic_ns', side_effect=lambda: clock.pop(0)), \
+                patch.object(self.collector, '_refresh_process_tree'):
+            self.collector._proc_cache = {os.getpid(): psutil.Process()}
+            self.collector._name_cache = {os.getpid(): "python"}
+            first = self.collector._collect_process_metrics()
+            second = self.collector._collect_process_metrics()
+        
+        self.assertEqual(first[0].cpu_percent, 0.0)
+        self.assertAlmostEqual(second[0].cpu_percent, 40.0)
+        self.collector._close_io_files()
+    
+    def test_exited_processes_fold_into_name_totals(self):
+        """Test that exited processes keep only per-name totals and reused pids start afresh."""
+        mb = 1024 * 1024
+        collector = self.collector
+        collector._proc_cache = {101: SimpleNamespace(pid=101, create_time=lambda: 1.0)}
+        collector._record_process(collector._process_key(101), "worker", 10.0, 100 * mb)
+        collector._record_process(collector._process_key(101), "worker", 20.0, 80 * mb)
+        collector._forget_process(101)
+        
+        # Same pid, new process
+        collector._proc_cache = {101: SimpleNamespace(pid=101, create_time=lambda: 2.0)}
+        collector._record_process(collector._process_key(101), "other", 30.0, 50 * mb)
+        
+        self.assertEqual(list(collector._processes), [(101, 2.0)])
+        self.assertEqual(collector._retired, {"worker": [30.0, 2, 100 * mb]})
+        
+        collector._add_snapshot_raw(time.monotonic_ns(), 0.0, 0, 0, 0, 0, 0, 0.0, 0, 0)
+        processes = collector._summarize()["processes"]
+        self.assertEqual(processes["worker"], {"average_cpu_percent": 15.0, "peak_memory_mb": 100.0})
+        self.assertEqual(processes["other"], {"average_cpu_percent": 30.0, "peak_memory_mb": 50.0})
+    
     @patch('swarm_benchmark.metrics.unified_metrics_collector.Path')
     def test_save_metrics_report(self, mock_path):
         """Test saving metrics report to file."""
         # Create mock snapshots
-        from datetime import datetime
-        
-        timestamp1 = datetime.now()
+        timestamp1 = time.monotonic_ns()
         system1 = SystemMetrics(
             timestamp=timestamp1,
             cpu_percent=10.0,
             memory_percent=20.0,
-            memory_available_mb=1024.0,
-            memory_used_mb=512.0,
+            memory_available_bytes=1024 * 1024 * 1024,
+            memory_used_bytes=512 * 1024 * 1024,
             disk_read_bytes=1000,
             disk_write_bytes=2000,
             network_sent_bytes=3000,
@@ -207,7 +668,7 @@ class TestMetricsCollector(unittest.TestCase):
             pid=1000,
             name="process1",
             cpu_percent=5.0,
-            memory_mb=200.0,
+            memory_bytes=200 * 1024 * 1024,
             threads=2,
             read_bytes=500,
             write_bytes=1000,
@@ -216,20 +677,20 @@ class TestMetricsCollector(unittest.TestCase):
         )
         
         snapshot1 = MetricsSnapshot(
-            id="snap1",
+            id=0,
             timestamp=timestamp1,
             system=system1,
             processes=[process1],
             interval_ms=10.0
         )
         
-        timestamp2 = datetime.now()
+        timestamp2 = time.monotonic_ns()
         system2 = SystemMetrics(
             timestamp=timestamp2,
             cpu_percent=15.0,
             memory_percent=25.0,
-            memory_available_mb=900.0,
-            memory_used_mb=600.0,
+            memory_available_bytes=900 * 1024 * 1024,
+            memory_used_bytes=600 * 1024 * 1024,
             disk_read_bytes=1500,
             disk_write_bytes=2500,
             network_sent_bytes=3500,
@@ -240,7 +701,7 @@ class TestMetricsCollector(unittest.TestCase):
             pid=1000,
             name="process1",
             cpu_percent=6.0,
-            memory_mb=220.0,
+            memory_bytes=220 * 1024 * 1024,
             threads=2,
             read_bytes=600,
             write_bytes=1200,
@@ -249,7 +710,7 @@ class TestMetricsCollector(unittest.TestCase):
         )
         
         snapshot2 = MetricsSnapshot(
-            id="snap2",
+            id=1,
             timestamp=timestamp2,
             system=system2,
             processes=[process2],
@@ -257,25 +718,63 @@ class TestMetricsCollector(unittest.TestCase):
         )
         
         # Set up collector with snapshots and timing
-        self.collector._start_time = time.time() - 1.0
-        self.collector._end_time = time.time()
-        self.collector.snapshots = [snapshot1, snapshot2]
+        self.collector._start_time = time.monotonic() - 1.0
+        self.collector._end_time = time.monotonic()
+        self.collector._record_snapshot(snapshot1)
+        self.collector._record_snapshot(snapshot2)
         
         # Mock file operations
         mock_open = MagicMock()
-        mock_json_dump = MagicMock()
+        mock_json_dumps = MagicMock(return_value="{}")
         
         with patch('builtins.open', mock_open), \
-             patch('json.dump', mock_json_dump):
+             patch('json.dumps', mock_json_dumps):
             
             # Save the report
             filepath = Path("test_report.json")
             self.collector.save_metrics_report(filepath)
             
-            # Verify file was opened and json.dump was called
+            # Verify file was opened and written once
             mock_open.assert_called_once_with(filepath, 'w')
-            self.assertEqual(mock_json_dump.call_count, 1)
+            self.assertEqual(mock_json_dumps.call_count, 1)
+            mock_open.return_value.__enter__.return_value.write.assert_called_once_with("{}")
+        
+        report = mock_json_dumps.call_args[0][0]
+        # Compact output keeps json on its C encoder
+        self.assertEqual(mock_json_dumps.call_args[1], {"separators": (",", ":")})
+        self.assertEqual(report["collection_info"]["samples_count"], 2)
+        self.assertAlmostEqual(report["summary"]["average_cpu_percent"], 12.5)
+        self.assertEqual(report["summary"]["peak_memory_mb"], 600.0)
+        self.assertAlmostEqual(report["summary"]["p50_cpu_percent"], 12.5)
+        self.assertAlmostEqual(report["summary"]["total_disk_read_mb"], 500 / (1024 * 1024))
+        self.assertAlmostEqual(report["processes"]["process1"]["average_cpu_percent"], 5.5)
+        self.assertEqual(report["processes"]["process1"]["peak_memory_mb"], 220.0)
+        self.assertEqual(report["time_series"]["processes_count"], [1, 1])
 
+    
+    def test_save_metrics_report_npz(self):
+        """Test saving every held sample as compressed columns."""
+        import numpy as np
+        
+        for i in range(3):
+            self.collector._add_snapshot_raw(
+                i, 10.0 * i, i * 1024, 100 * i, 0, 0, 0, float(i), 2048, 1
+            )
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            filepath = Path(tmp) / "metrics.npz"
+            self.collector.save_metrics_report(filepath, format="npz")
+            with np.load(filepath) as columns:
+                self.assertEqual(columns["system_cpu_percent"].shape, (3,))
+                self.assertEqual(columns["system_cpu_percent"].tolist(), [0.0, 10.0, 20.0])
+                self.assertEqual(columns["disk_read_bytes"].tolist(), [0, 100, 200])
+                self.assertEqual(columns["processes_count"].tolist(), [1, 1, 1])
+                self.assertEqual(
+                    (columns["timestamp_ns"] - self.collector._wall_offset_ns).tolist(), [0, 1, 2]
+                )
+        
+        with self.assertRaises(ValueError):
+            self.collector.save_metrics_report(Path("report.xml"), format="xml")
 
 class TestProcessMonitor(unittest.TestCase):
     """Tests for ProcessMonitor class."""
@@ -284,17 +783,13 @@ class TestProcessMonitor(unittest.TestCase):
         """Set up test fixtures."""
         self.monitor = ProcessMonitor(sampling_interval=0.01)
     
-    @patch('subprocess.Popen')
-    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector')
-    def test_monitor_process(self, mock_collector_class, mock_popen):
+    def test_monitor_process(self):
         """Test process monitoring context manager."""
-        # Create mock process
-        mock_process = MagicMock()
+        # Stand-in process, only passed through
+        mock_process = SimpleNamespace(pid=1234)
         
         # Create mock collector
         mock_collector = MagicMock()
-        mock_collector.start_collection = MagicMock()
-        mock_collector.stop_collection = MagicMock()
         self.monitor.metrics_collector = mock_collector
         
         # Use the context manager
@@ -302,42 +797,143 @@ class TestProcessMonitor(unittest.TestCase):
             # Check that collection was started
             mock_collector.start_collection.assert_called_once()
         
-        # Check that collection was stopped
+        # Check that collection was stopped, signaling entry and exit
         mock_collector.stop_collection.assert_called_once()
+        self.assertEqual(mock_collector.signal_transition.call_count, 2)
+    
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._read_processes')
+    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector._read_system')
+    def test_execute_command_samples_exit(self, mock_read_system, mock_read_processes):
+        """Test that heartbeat monitoring samples the process exit."""
+        from swarm_benchmark.metrics.unified_metrics_collector import _HISTORY_CAPACITY
+        
+        mock_read_system.return_value = TestMetricsCollector.SYSTEM_READING
+        mock_read_processes.return_value = []
+        monitor = ProcessMonitor(sampling_interval=0.01, heartbeat_interval=60.0)
+        
+        result = monitor.execute_command([sys.executable, "-c", "import time; time.sleep(0.2)"])
+        
+        self.assertEqual(result.exit_code, 0)
+        collector = monitor.metrics_collector
+        first = collector._ts[0]
+        last = collector._ts[(collector._written - 1) % _HISTORY_CAPACITY]
+        self.assertGreaterEqual(last - first, 150_000_000)
     
     @patch('asyncio.create_subprocess_exec')
-    @patch('swarm_benchmark.metrics.unified_metrics_collector.MetricsCollector')
-    async def test_execute_command_async_success(self, mock_collector_class, mock_create_subprocess):
-        """Test async command execution with success."""
+    def test_execute_command_async_success(self, mock_create_subprocess):
+        """Test async command execution streaming output in chunks."""
+        from swarm_benchmark.metrics.unified_metrics_collector import _OUTPUT_READ_CHUNK
+        
         # Create mock process
         mock_process = MagicMock()
         mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(return_value=(b"stdout output", b"stderr output"))
+        mock_process.stdout.read = AsyncMock(side_effect=[b"stdout ", b"output\n", b""])
+        mock_process.stderr.read = AsyncMock(side_effect=[b"stderr output", b""])
+        mock_process.wait = AsyncMock(return_value=0)
         mock_create_subprocess.return_value = mock_process
         
         # Create mock collector
         mock_collector = MagicMock()
-        mock_collector.start_collection = MagicMock()
-        mock_collector.stop_collection = MagicMock(return_value=PerformanceMetrics())
-        mock_collector.snapshots = [MagicMock()]
+        mock_collector.start_collection_async = AsyncMock()
+        mock_collector.stop_collection_async = AsyncMock(return_value=PerformanceMetrics())
+        mock_collector.latest_resource_usage = MagicMock(return_value=ResourceUsage())
         self.monitor.metrics_collector = mock_collector
         
         # Execute command
-        result = await self.monitor.execute_command_async(["test", "command"])
+        result = asyncio.run(self.monitor.execute_command_async(["test", "command"]))
         
         # Check result
         self.assertIsInstance(result, ProcessExecutionResult)
         self.assertEqual(result.command, ["test", "command"])
         self.assertEqual(result.exit_code, 0)
-        self.assertEqual(result.stdout, "stdout output")
+        self.assertEqual(result.stdout, "stdout output\n")
         self.assertEqual(result.stderr, "stderr output")
+        self.assertEqual(result.output_size, 1)
         self.assertTrue(result.success)
         self.assertIsInstance(result.performance_metrics, PerformanceMetrics)
         self.assertIsInstance(result.resource_usage, ResourceUsage)
         
+        # Output is read in bounded chunks until EOF
+        self.assertEqual(mock_process.stdout.read.await_count, 3)
+        for call in mock_process.stdout.read.await_args_list:
+            self.assertEqual(call.args, (_OUTPUT_READ_CHUNK,))
+        
         # Verify collector was used
-        mock_collector.start_collection.assert_called_once()
-        mock_collector.stop_collection.assert_called_once()
+        mock_collector.start_collection_async.assert_awaited_once()
+        mock_collector.stop_collection_async.assert_awaited_once()
+    
+    @patch('asyncio.create_subprocess_exec')
+    def test_execute_command_async_timeout_keeps_output(self, mock_create_subprocess):
+        """Test that output streamed before a timeout is kept and counted."""
+        def stalls_after(*results):
+            """Build a coroutine function returning results, then hanging."""
+            pending = list(results)
+            
+            async def call(*args):
+                if pending:
+                    return pending.pop(0)
+                await asyncio.sleep(60)
+            return call
+        
+        mock_process = MagicMock()
+        mock_process.stdout.read = AsyncMock(side_effect=stalls_after(b"partial\n"))
+        mock_process.stderr.read = AsyncMock(side_effect=stalls_after(b"warning\n"))
+        mock_process.wait = AsyncMock(side_effect=stalls_after())
+        mock_create_subprocess.return_value = mock_process
+        
+        mock_collector = MagicMock()
+        mock_collector.start_collection_async = AsyncMock()
+        mock_collector.stop_collection_async = AsyncMock(return_value=PerformanceMetrics())
+        mock_collector.latest_resource_usage = MagicMock(return_value=ResourceUsage())
+        self.monitor.metrics_collector = mock_collector
+        
+        result = asyncio.run(self.monitor.execute_command_async(["test"], timeout=0.05))
+        
+        self.assertEqual(result.exit_code, -1)
+        self.assertEqual(result.stdout, "partial\n")
+        self.assertEqual(result.output_size, 1)
+        # The streamed warning plus the timeout note
+        self.assertEqual(result.error_count, 2)
+        self.assertTrue(result.stderr.startswith("warning\n"))
+        self.assertTrue(result.stderr.endswith("Process execution timed out"))
+        mock_process.kill.assert_called_once()
+    
+    def test_execute_command_streams_output(self):
+        """Test that output is streamed with lines counted past the buffer cap."""
+        mock_collector = MagicMock()
+        mock_collector.watch_cgroup.return_value = False
+        mock_collector.stop_collection.return_value = PerformanceMetrics()
+        mock_collector.latest_resource_usage.return_value = ResourceUsage()
+        self.monitor.metrics_collector = mock_collector
+        
+        script = "import sys; sys.stdout.write('line\\n' * 5000 + 'tail'); sys.stderr.write('oops\\n' * 300)"
+        with patch('swarm_benchmark.metrics.unified_metrics_collector._OUTPUT_CAP', 1000):
+            result = self.monitor.execute_command([sys.executable, "-c", script])
+        
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(result.output_size, 5001)
+        self.assertEqual(result.error_count, 300)
+        self.assertTrue(result.stdout.startswith("line\n" * 200))
+        self.assertIn("[output truncated after 1000 bytes]", result.stdout)
+        self.assertTrue(result.stderr.startswith("oops\n" * 200))
+    
+    def test_launch_failure_counts_as_error(self):
+        """Test that a command that cannot start reports its error line."""
+        mock_collector = MagicMock()
+        mock_collector.start_collection_async = AsyncMock()
+        mock_collector.stop_collection_async = AsyncMock(return_value=PerformanceMetrics())
+        mock_collector.stop_collection.return_value = PerformanceMetrics()
+        mock_collector.latest_resource_usage.return_value = ResourceUsage()
+        self.monitor.metrics_collector = mock_collector
+        command = ["/nonexistent/flowx-missing-binary"]
+        
+        for result in (
+            self.monitor.execute_command(command),
+            asyncio.run(self.monitor.execute_command_async(command)),
+        ):
+            self.assertEqual(result.exit_code, -1)
+            self.assertTrue(result.stderr.startswith("Error executing process"))
+            self.assertGreaterEqual(result.error_count, 1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,361 @@
+"""Unit tests for the unified output manager."""
+
+import unittest
+import asyncio
+import csv
+import json
+import sqlite3
+import tempfile
+import threading
+from unittest.mock import patch
+from pathlib import Path
+
+from swarm_benchmark.output.output_manager import (
+    CSVOutputHandler, JSONOutputHandler, OutputManager, SQLiteOutputHandler,
+    _BenchmarkView
+)
+from swarm_benchmark.core.models import Benchmark, Task, Result
+
+
+class TestJSONOutputHandler(unittest.TestCase):
+    """Tests for the JSONOutputHandler class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.handler = JSONOutputHandler()
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+    
+    def test_streamed_output_matches_benchmark_dict(self):
+        """Test that the streamed file decodes to the full benchmark dictionary."""
+        benchmark = Benchmark(name="Test Benchmark", error_log=["boom"], metadata={"run": 1})
+        for i in range(3):
+            task = Task(objective=f"Task {i}")
+            benchmark.add_task(task)
+            benchmark.add_result(Result(task_id=task.id, errors=[f"error {i}"]))
+        
+        output_path = asyncio.run(self.handler.save_benchmark(benchmark, self.output_dir))
+        
+        with open(output_path) as f:
+            saved = json.load(f)
+        self.assertEqual(saved, self.handler._benchmark_to_dict(benchmark))
+        self.assertEqual(len(saved["tasks"]), 3)
+    
+    def test_empty_benchmark(self):
+        """Test streaming a benchmark without tasks or results."""
+        benchmark = Benchmark(name="Empty")
+        
+        output_path = asyncio.run(self.handler.save_benchmark(benchmark, self.output_dir))
+        
+        with open(output_path) as f:
+            saved = json.load(f)
+        self.assertEqual(saved["tasks"], [])
+        self.assertEqual(saved["results"], [])
+    
+    def test_indent_is_opt_in(self):
+        """Test that output is compact unless an indent is configured."""
+        benchmark = Benchmark(name="Test Benchmark")
+        benchmark.add_task(Task(objective="Task"))
+        
+        compact_path = asyncio.run(self.handler.save_benchmark(benchmark, self.output_dir / "compact"))
+        pretty_path = asyncio.run(JSONOutputHandler(indent=2).save_benchmark(benchmark, self.output_dir / "pretty"))
+        
+        with open(compact_path) as f:
+            self.assertEqual(f.read(), json.dumps(self.handler._benchmark_to_dict(benchmark)))
+        with open(pretty_path) as f:
+            pretty = f.read()
+        self.assertIn('\n  "tasks": [\n    {"id": ', pretty)
+        self.assertEqual(json.loads(pretty), self.handler._benchmark_to_dict(benchmark))
+
+
+class TestCSVOutputHandler(unittest.TestCase):
+    """Tests for the CSVOutputHandler class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.handler = CSVOutputHandler()
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+    
+    def _read(self, path):
+        with open(path, newline="") as f:
+            return list(csv.reader(f))
+    
+    def test_fields_with_separators_round_trip(self):
+        """Test that commas, quotes and newlines in fields are escaped."""
+        benchmark = Benchmark(name="Test", description='Uses "quotes", commas')
+        task = Task(objective="Line one,\nline two")
+        benchmark.add_task(task)
+        benchmark.add_result(Result(task_id=task.id, errors=['Failed: "x", then y']))
+        
+        csv_dir = asyncio.run(self.handler.save_benchmark(benchmark, self.output_dir))
+        
+        summary = self._read(csv_dir / "benchmark.csv")
+        self.assertEqual(summary[1][2], 'Uses "quotes", commas')
+        self.assertEqual(summary[1][3], "pending")
+        tasks = self._read(csv_dir / "tasks.csv")
+        self.assertEqual(tasks[1][:4], [task.id, benchmark.id, "Line one,\nline two", "auto"])
+        errors = self._read(csv_dir / "errors.csv")
+        self.assertEqual(errors, [["result_id", "error_text"], [benchmark.results[0].id, 'Failed: "x", then y']])
+    
+    def test_large_output_writes_files_concurrently(self):
+        """Test that large benchmarks write each CSV file in its own worker call."""
+        benchmark = Benchmark(name="Large")
+        for i in range(4):
+            benchmark.add_task(Task(objective=f"Task {i}"))
+        
+        with patch('swarm_benchmark.output.output_manager._SMALL_CSV_ROWS', 2):
+            csv_dir = asyncio.run(self.handler.save_benchmark(benchmark, self.output_dir))
+        
+        self.assertEqual(len(self._read(csv_dir / "tasks.csv")), 5)
+        self.assertEqual(
+            sorted(path.name for path in csv_dir.iterdir()),
+            ["benchmark.csv", "errors.csv", "metrics.csv", "results.csv", "tasks.csv"]
+        )
+
+
+class TestSQLiteOutputHandler(unittest.TestCase):
+    """Tests for the SQLiteOutputHandler class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.handler = SQLiteOutputHandler()
+        
+        self.benchmark = Benchmark(name="Test Benchmark")
+        for i in range(3):
+            task = Task(objective=f"Task {i}")
+            self.benchmark.add_task(task)
+            self.benchmark.add_result(Result(task_id=task.id, errors=[f"error {i}a", f"error {i}b"]))
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.handler.close()
+        self.temp_dir.cleanup()
+    
+    def _count(self, db_path, table):
+        conn = sqlite3.connect(str(db_path))
+        try:
+            return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        finally:
+            conn.close()
+    
+    def test_save_benchmark(self):
+        """Test saving a benchmark with its tasks, results and errors."""
+        db_path = asyncio.run(self.handler.save_benchmark(self.benchmark, self.output_dir))
+        
+        self.assertEqual(db_path, self.output_dir / "benchmarks.db")
+        self.assertEqual(self._count(db_path, "benchmarks"), 1)
+        self.assertEqual(self._count(db_path, "tasks"), 3)
+        self.assertEqual(self._count(db_path, "results"), 3)
+        self.assertEqual(self._count(db_path, "errors"), 6)
+        self.assertEqual(self._count(db_path, "metrics"), 10)
+    
+    def test_database_uses_wal_journal(self):
+        """Test that the database is switched to write-ahead logging."""
+        db_path = asyncio.run(self.handler.save_benchmark(self.benchmark, self.output_dir))
+        
+        conn = sqlite3.connect(str(db_path))
+        try:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        finally:
+            conn.close()
+    
+    def test_empty_benchmark_is_not_written(self):
+        """Test that a benchmark without tasks or results creates no database."""
+        db_path = asyncio.run(self.handler.save_benchmark(Benchmark(name="Empty"), self.output_dir))
+        
+        self.assertEqual(db_path, self.output_dir / "benchmarks.db")
+        self.assertFalse(db_path.exists())
+        self.assertIsNone(self.handler._conn)
+    
+    def test_foreign_key_columns_are_indexed(self):
+        """Test that the foreign key columns get indexes."""
+        db_path = asyncio.run(self.handler.save_benchmark(self.benchmark, self.output_dir))
+        
+        conn = sqlite3.connect(str(db_path))
+        try:
+            indexes = {
+                (table, column)
+                for table, column in conn.execute(
+                    "SELECT m.tbl_name, i.name FROM sqlite_master m, pragma_index_info(m.name) i "
+                    "WHERE m.type = 'index' AND m.sql IS NOT NULL"
+                )
+            }
+        finally:
+            conn.close()
+        self.assertEqual(indexes, {
+            ("tasks", "benchmark_id"), ("results", "task_id"),
+            ("errors", "result_id"), ("metrics", "benchmark_id")
+        })
+    
+    def test_failed_save_is_rolled_back(self):
+        """Test that a save failing midway leaves no partial rows behind."""
+        self.benchmark.results[-1].resource_usage = None
+        
+        with self.assertRaises(AttributeError):
+            asyncio.run(self.handler.save_benchmark(self.benchmark, self.output_dir))
+        
+        db_path = self.output_dir / "benchmarks.db"
+        self.assertEqual(self._count(db_path, "benchmarks"), 0)
+        self.assertEqual(self._count(db_path, "tasks"), 0)
+        self.assertEqual(self._count(db_path, "results"), 0)
+    
+    def test_connection_is_reused_across_saves(self):
+        """Test that repeated saves to one database share a connection."""
+        asyncio.run(self.handler.save_benchmark(self.benchmark, self.output_dir))
+        conn = self.handler._conn
+        
+        with patch.object(self.handler, '_create_tables') as mock_create_tables:
+            second = Benchmark(name="Second Benchmark")
+            second.add_task(Task(objective="Task"))
+            db_path = asyncio.run(self.handler.save_benchmark(second, self.output_dir))
+        
+        self.assertIs(self.handler._conn, conn)
+        mock_create_tables.assert_not_called()
+        self.assertEqual(self._count(db_path, "benchmarks"), 2)
+        
+        self.handler.close()
+        self.assertIsNone(self.handler._conn)
+    
+    def test_schema_created_once_per_database(self):
+        """Test that reopening a known database skips table creation."""
+        asyncio.run(self.handler.save_benchmark(self.benchmark, self.output_dir))
+        self.handler.close()
+        
+        with patch.object(self.handler, '_create_tables') as mock_create_tables:
+            second = Benchmark(name="Second Benchmark")
+            second.add_task(Task(objective="Task"))
+            db_path = asyncio.run(self.handler.save_benchmark(second, self.output_dir))
+        
+        mock_create_tables.assert_not_called()
+        self.assertEqual(self._count(db_path, "benchmarks"), 2)
+    
+    def test_saves_run_on_writer_thread(self):
+        """Test that database work runs on the handler's own writer thread."""
+        threads = []
+        get_connection = self.handler._get_connection
+        
+        def record_thread(*args):
+            threads.append(threading.current_thread().name)
+            return get_connection(*args)
+        
+        with patch.object(self.handler, '_get_connection', side_effect=record_thread):
+            asyncio.run(self.handler.save_benchmark(self.benchmark, self.output_dir))
+        
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("flowx-sqlite"))
+        
+        self.handler.close()
+        self.assertIsNone(self.handler._conn)
+        self.assertIsNone(self.handler._writer)
+    
+    def test_concurrent_saves_are_serialized(self):
+        """Test that concurrent saves all complete without lock contention."""
+        benchmarks = [Benchmark(name=f"Benchmark {i}") for i in range(5)]
+        for benchmark in benchmarks:
+            benchmark.add_task(Task(objective="Task"))
+        
+        async def save_all():
+            return await asyncio.gather(*(
+                self.handler.save_benchmark(benchmark, self.output_dir)
+                for benchmark in benchmarks
+            ))
+        
+        paths = asyncio.run(save_all())
+        
+        self.assertEqual(len(set(paths)), 1)
+        self.assertEqual(self._count(paths[0], "benchmarks"), 5)
+
+
+
+class TestOutputManager(unittest.TestCase):
+    """Tests for the OutputManager class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.manager = OutputManager()
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.manager.close()
+        self.temp_dir.cleanup()
+    
+    def test_handlers_share_output_executor(self):
+        """Test that all handlers are given the manager's pool."""
+        executors = {id(handler.executor) for handler in self.manager.handlers.values()}
+        self.assertEqual(executors, {id(self.manager._io_executor)})
+        
+        handler = CSVOutputHandler()
+        self.manager.register_handler("custom", handler)
+        self.assertIs(handler.executor, self.manager._io_executor)
+    
+    def test_save_benchmark_all_formats(self):
+        """Test saving a benchmark in every format."""
+        benchmark = Benchmark(name="Test Benchmark")
+        benchmark.add_task(Task(objective="Task"))
+        
+        paths = asyncio.run(self.manager.save_benchmark(
+            benchmark, self.output_dir, formats=["json", "sqlite", "csv"]
+        ))
+        
+        self.assertEqual(set(paths), {"json", "sqlite", "csv"})
+        for path in paths.values():
+            self.assertTrue(path.exists())
+    
+    def test_save_after_close_starts_new_workers(self):
+        """Test that the manager can still save after it was closed."""
+        benchmark = Benchmark(name="Test Benchmark")
+        benchmark.add_task(Task(objective="Task"))
+        asyncio.run(self.manager.save_benchmark(benchmark, self.output_dir, formats=["sqlite"]))
+        self.manager.close()
+        
+        paths = asyncio.run(self.manager.save_benchmark(
+            benchmark, self.output_dir, formats=["json", "sqlite", "csv"]
+        ))
+        
+        self.assertEqual(set(paths), {"json", "sqlite", "csv"})
+        executors = {id(handler.executor) for handler in self.manager.handlers.values()}
+        self.assertEqual(executors, {id(self.manager._io_executor)})
+    
+    def test_benchmark_fields_formatted_once(self):
+        """Test that shared benchmark fields are formatted once for all formats."""
+        benchmark = Benchmark(name="Test Benchmark")
+        
+        with patch.object(_BenchmarkView, 'of', wraps=_BenchmarkView.of) as mock_of:
+            asyncio.run(self.manager.save_benchmark(
+                benchmark, self.output_dir, formats=["json", "sqlite", "csv"]
+            ))
+        
+        mock_of.assert_called_once_with(benchmark)
+    
+    def test_task_rows_built_once_for_all_formats(self):
+        """Test that every format reuses the same task rows."""
+        benchmark = Benchmark(name="Test Benchmark")
+        for i in range(3):
+            benchmark.add_task(Task(objective=f"Task {i}"))
+        
+        with patch.object(Task, 'duration', autospec=True, return_value=1.5) as mock_duration:
+            paths = asyncio.run(self.manager.save_benchmark(
+                benchmark, self.output_dir, formats=["json", "sqlite", "csv"]
+            ))
+        
+        self.assertEqual(mock_duration.call_count, 3)
+        with open(paths["csv"] / "tasks.csv", newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([row["duration"] for row in rows], ["1.5"] * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()